@@ -0,0 +1,26 @@
+"""Benchmarks for the startup of the package and of :command:`pysemver`."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ENV = dict(os.environ, PYTHONPATH=str(Path(__file__).parent.parent / "src"))
+
+
+def _run(*args):
+    return subprocess.run(
+        [sys.executable, *args], env=ENV, check=True, stdout=subprocess.DEVNULL
+    )
+
+
+def bench_python_startup():
+    return _run("-c", "pass")
+
+
+def bench_import_semver():
+    return _run("-c", "import semver")
+
+
+def bench_pysemver_compare():
+    return _run("-m", "semver", "compare", "1.2.3", "2.0.0")
@@ -0,0 +1,44 @@
+"""Benchmarks for comparing versions with the rich comparison operators."""
+
+from semver import Version
+
+V1 = Version.parse("1.2.3-rc.1")
+V2 = Version.parse("1.2.3")
+S2 = "1.2.3"
+T2 = (1, 2, 3)
+
+
+def bench_eq_version():
+    return V1 == V2
+
+
+def bench_ne_version():
+    return V1 != V2
+
+
+def bench_lt_version():
+    return V1 < V2
+
+
+def bench_le_version():
+    return V1 <= V2
+
+
+def bench_gt_version():
+    return V1 > V2
+
+
+def bench_ge_version():
+    return V1 >= V2
+
+
+def bench_lt_str():
+    return V1 < S2
+
+
+def bench_lt_tuple():
+    return V1 < T2
+
+
+def bench_compare_version():
+    return V1.compare(V2)
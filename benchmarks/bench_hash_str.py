@@ -0,0 +1,32 @@
+"""Benchmarks for using versions as dict keys and converting them to strings."""
+
+from semver import Version
+
+VERSIONS = [
+    Version(major, minor, patch, prerelease, build)
+    for major in range(5)
+    for minor in range(10)
+    for patch in range(5)
+    for prerelease, build in ((None, None), ("rc.1", None), ("beta.2", "build.7"))
+]
+ONE = VERSIONS[123]
+
+
+def bench_dict_insert_750():
+    return {v: None for v in VERSIONS}
+
+
+def bench_set_insert_750():
+    return set(VERSIONS)
+
+
+def bench_hash():
+    return hash(ONE)
+
+
+def bench_str():
+    return str(ONE)
+
+
+def bench_str_750():
+    return [str(v) for v in VERSIONS]
@@ -0,0 +1,23 @@
+"""Benchmarks for matching versions against match expressions."""
+
+from semver import Version, compile_match
+
+V = Version.parse("2.3.7")
+S = "2.3.7"
+IS_NEW = compile_match(">=1.0.0")
+
+
+def bench_match():
+    return V.match(">=1.0.0")
+
+
+def bench_match_str_version():
+    return Version.parse(S).match(">=1.0.0")
+
+
+def bench_compile_match_predicate():
+    return IS_NEW(V)
+
+
+def bench_compile_match_predicate_str():
+    return IS_NEW(S)
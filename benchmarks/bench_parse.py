@@ -0,0 +1,34 @@
+"""Benchmarks for parsing and validating each corpus of version strings."""
+
+from corpora import CORPORA
+
+from semver import Version
+
+RELEASE = CORPORA["release"]
+PRERELEASE = CORPORA["prerelease"]
+BUILD = CORPORA["build"]
+INVALID = CORPORA["invalid"]
+
+
+def bench_parse_release_1000():
+    return [Version.parse(s) for s in RELEASE]
+
+
+def bench_parse_prerelease_1000():
+    return [Version.parse(s) for s in PRERELEASE]
+
+
+def bench_parse_build_1000():
+    return [Version.parse(s) for s in BUILD]
+
+
+def bench_parse_many_invalid_1000():
+    return Version.parse_many(INVALID, on_error="collect")
+
+
+def bench_is_valid_prerelease_1000():
+    return [Version.is_valid(s) for s in PRERELEASE]
+
+
+def bench_is_valid_invalid_1000():
+    return [Version.is_valid(s) for s in INVALID]
@@ -0,0 +1,19 @@
+"""Benchmarks for checking versions against compiled ranges."""
+
+from semver import Version
+from semver.range import VersionRange
+
+V = Version.parse("3.4.1")
+RANGE = VersionRange.compile(">=1.0.0 <2.0.0 || ^3.1")
+
+
+def bench_match_two_exprs():
+    return V.match(">=1.0.0") and V.match("<2.0.0")
+
+
+def bench_range_contains():
+    return RANGE.contains(V)
+
+
+def bench_range_compile_cached():
+    return VersionRange.compile(">=1.0.0 <2.0.0 || ^3.1")
@@ -0,0 +1,37 @@
+"""Benchmarks for sorting and hashing each corpus of versions."""
+
+from corpora import CORPORA
+
+from semver import Version, latest
+
+STRINGS = {name: CORPORA[name] for name in ("release", "prerelease", "build")}
+VERSIONS = {name: Version.parse_many(STRINGS[name]).versions for name in STRINGS}
+
+
+def _fresh(name):
+    """Copy the versions without their cached sort keys and hashes."""
+    return [Version(*v.to_tuple()) for v in VERSIONS[name]]
+
+
+def bench_sorted_release_1000():
+    return sorted(_fresh("release"))
+
+
+def bench_sorted_prerelease_1000():
+    return sorted(_fresh("prerelease"))
+
+
+def bench_sorted_build_1000():
+    return sorted(_fresh("build"))
+
+
+def bench_sorted_str_key_parse_1000():
+    return sorted(STRINGS["prerelease"], key=Version.parse)
+
+
+def bench_set_prerelease_1000():
+    return set(_fresh("prerelease"))
+
+
+def bench_latest_str_prerelease_1000():
+    return latest(STRINGS["prerelease"], include_prereleases=True)
@@ -0,0 +1,23 @@
+"""
+Realistic corpora of version strings for the benchmarks.
+
+Each corpus is generated by :func:`semver.testing.generate_corpus` from a
+fixed seed, so every run measures the same strings.
+
+The environment variable ``SEMVER_BENCH_SIZE`` changes the number of
+versions; the test suite uses tiny corpora to run each benchmark once.
+"""
+
+import os
+from typing import Dict, List
+
+from semver.testing import generate_corpus
+
+#: Number of versions in each corpus
+SIZE = int(os.environ.get("SEMVER_BENCH_SIZE", 1000))
+
+#: The corpora by the name of their profile
+CORPORA: Dict[str, List[str]] = {
+    profile: list(generate_corpus(SIZE, profile, seed=2024))
+    for profile in ("release", "prerelease", "build", "invalid")
+}
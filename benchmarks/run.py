@@ -0,0 +1,172 @@
+"""
+Run the semver micro-benchmarks.
+
+Each ``bench_*.py`` module in this directory contains functions whose names
+start with ``bench_``. Every function performs one operation and takes no
+arguments. The runner calls each function in a tight loop and reports the
+best time per call out of several repetitions.
+
+Usage::
+
+    python benchmarks/run.py [PATTERN ...] [--save FILE] [--compare FILE]
+
+The optional patterns select benchmarks whose name contains one of them.
+
+With ``--save``, the results are written into a JSON file, the baseline.
+With ``--compare``, each result is compared with the baseline, and the
+runner fails if a benchmark got slower by more than ``--threshold``.
+"""
+
+import argparse
+import importlib
+import json
+import platform
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+HERE = Path(__file__).parent
+# Benchmark the source tree, not an installed version of semver
+sys.path.insert(0, str(HERE.parent / "src"))
+sys.path.insert(0, str(HERE))
+
+
+def collect(patterns: List[str]) -> Dict[str, Callable[[], object]]:
+    """
+    Collect all benchmark functions.
+
+    :param patterns: only collect benchmarks whose name contains one of
+        these strings; all if empty
+    :return: a dict which maps ``module.function`` to the function
+    """
+    benchmarks = {}
+    for path in sorted(HERE.glob("bench_*.py")):
+        module = importlib.import_module(path.stem)
+        for name, func in vars(module).items():
+            if not (name.startswith("bench_") and callable(func)):
+                continue
+            fullname = f"{path.stem[6:]}.{name[6:]}"
+            if not patterns or any(p in fullname for p in patterns):
+                benchmarks[fullname] = func
+    return benchmarks
+
+
+def measure(func: Callable[[], object], repeat: int = 5) -> float:
+    """
+    Measure the best time of one call of func.
+
+    :param func: the function to call
+    :param repeat: the number of repetitions
+    :return: the time of one call in nanoseconds
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def save(path: Path, results: Dict[str, float]) -> None:
+    """
+    Save the results as a baseline.
+
+    Results of benchmarks which didn't run are kept from an existing file.
+
+    :param path: the JSON file
+    :param results: the time of each benchmark in nanoseconds
+    """
+    baseline = load(path) if path.exists() else {}
+    baseline.update(results)
+    data = {"python": platform.python_version(), "benchmarks": baseline}
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+
+
+def load(path: Path) -> Dict[str, float]:
+    """
+    Load the results of a baseline.
+
+    :param path: the JSON file written by :func:`save`
+    :return: the time of each benchmark in nanoseconds
+    :raises OSError: if the file can't be read
+    :raises ValueError: if the file is no baseline
+    """
+    data = json.loads(path.read_text())
+    if not isinstance(data, dict) or not isinstance(data.get("benchmarks"), dict):
+        raise ValueError("no benchmarks found")
+    return data["benchmarks"]
+
+
+def compare(time: float, baseline: Optional[float], threshold: float) -> str:
+    """
+    Compare the result of a benchmark with its baseline.
+
+    :param time: the time of the benchmark in nanoseconds
+    :param baseline: the time in the baseline, None for new benchmarks
+    :param threshold: the allowed slowdown, 0.2 means 20 percent
+    :return: the relative change; it ends with ``REGRESSION`` if the benchmark
+        is slower than allowed
+    """
+    if baseline is None:
+        return "new"
+    change = time / baseline - 1
+    if change > threshold:
+        return f"{change:+7.1%}  REGRESSION"
+    return f"{change:+7.1%}"
+
+
+def main(cliargs: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("patterns", nargs="*", help="Select benchmarks by name")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Number of repetitions (default: 5)"
+    )
+    parser.add_argument(
+        "--save", metavar="FILE", type=Path, help="Save the results as baseline"
+    )
+    parser.add_argument(
+        "--compare", metavar="FILE", type=Path, help="Compare with a baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        metavar="PERCENT",
+        type=float,
+        default=20.0,
+        help="Fail if a benchmark is slower than the baseline by more than "
+        "this (default: %(default)s)",
+    )
+    args = parser.parse_args(cliargs)
+    try:
+        baseline = load(args.compare) if args.compare else {}
+    except (OSError, ValueError) as err:  # ValueError includes JSONDecodeError
+        parser.error(f"can't read the baseline {args.compare}: {err}")
+
+    results = {}
+    regressions = []
+    for name, func in collect(args.patterns).items():
+        results[name] = measure(func, args.repeat)
+        line = f"{name:<40} {results[name]:>14.1f} ns"
+        if args.compare:
+            note = compare(results[name], baseline.get(name), args.threshold / 100)
+            if note.endswith("REGRESSION"):
+                # Measure again, to rule out noise of other processes
+                results[name] = min(results[name], measure(func, args.repeat))
+                line = f"{name:<40} {results[name]:>14.1f} ns"
+                note = compare(results[name], baseline[name], args.threshold / 100)
+            if note.endswith("REGRESSION"):
+                regressions.append(name)
+            line += f"  {note}"
+        print(line, flush=True)
+
+    if args.save:
+        save(args.save, results)
+    if regressions:
+        print(
+            f"\n{len(regressions)} benchmark(s) slower than the baseline by more "
+            f"than {args.threshold}%: {', '.join(regressions)}",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,30 +4,16 @@ Semver package major release 3.
 A Python module for semantic versioning. Simplifies comparing versions.
 """
 
-from ._deprecated import (
-    bump_build,
-    bump_major,
-    bump_minor,
-    bump_patch,
-    compare,
-    bump_prerelease,
-    finalize_version,
-    format_version,
-    match,
-    max_ver,
-    min_ver,
-    parse,
-    parse_version_info,
-    replace,
-    cmd_bump,
-    cmd_compare,
-    cmd_nextver,
-    cmd_check,
-    createparser,
-    process,
-    main,
+from typing import TYPE_CHECKING, Any, List
+
+from .version import (
+    Version,
+    VersionInfo,
+    coerce_cache,
+    compile_match,
+    match_cache,
+    parse_cache,
 )
-from .version import Version, VersionInfo
 from .__about__ import (
     __version__,
     __author__,
@@ -62,6 +48,12 @@ __all__ = [
     "main",
     "Version",
     "VersionInfo",
+    "compile_match",
+    "latest",
+    "top_k",
+    "match_cache",
+    "coerce_cache",
+    "parse_cache",
     "__version__",
     "__author__",
     "__maintainer__",
@@ -70,3 +62,83 @@ __all__ = [
     "__maintainer_email__",
     "SEMVER_SPEC_VERSION",
 ]
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._deprecated import (
+        bump_build,
+        bump_major,
+        bump_minor,
+        bump_patch,
+        bump_prerelease,
+        cmd_bump,
+        cmd_check,
+        cmd_compare,
+        cmd_nextver,
+        compare,
+        createparser,
+        finalize_version,
+        format_version,
+        main,
+        match,
+        max_ver,
+        min_ver,
+        parse,
+        parse_version_info,
+        process,
+        replace,
+    )
+    from .collections import latest, top_k
+
+_DEPRECATED_NAMES = (
+    "bump_build",
+    "bump_major",
+    "bump_minor",
+    "bump_patch",
+    "compare",
+    "bump_prerelease",
+    "finalize_version",
+    "format_version",
+    "match",
+    "max_ver",
+    "min_ver",
+    "parse",
+    "parse_version_info",
+    "replace",
+    "cmd_bump",
+    "cmd_compare",
+    "cmd_nextver",
+    "cmd_check",
+    "createparser",
+    "process",
+    "main",
+)
+
+#: The names which are imported from their module when they are first used.
+#: This keeps :mod:`argparse` and :mod:`inspect` out of ``import semver``.
+_LAZY_NAMES = {
+    **dict.fromkeys(_DEPRECATED_NAMES, "._deprecated"),
+    "latest": ".collections",
+    "top_k": ".collections",
+}
+
+#: Submodules which are imported when they are first used as attributes.
+#: ``import semver`` used to import ``_deprecated`` and ``cli``, so they stay
+#: available as ``semver.cli`` and so on; ``collections`` and ``range`` are
+#: new submodules, which are available the same way.
+_LAZY_MODULES = frozenset({"_deprecated", "cli", "collections", "range"})
+
+
+def __getattr__(name: str) -> Any:
+    from importlib import import_module
+
+    if name in _LAZY_MODULES:
+        return import_module(f".{name}", __name__)
+    if name not in _LAZY_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_NAMES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,131 @@
+"""Size-bounded caches used by semver."""
+
+import typing
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable, NamedTuple, Optional
+
+#: Marks a missing entry, as None is a valid value
+_MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a :class:`LRUCache`."""
+
+    #: Number of lookups which found an entry
+    hits: int
+    #: Number of lookups which didn't find an entry
+    misses: int
+    #: Number of entries which were removed to make room for new ones
+    evictions: int
+    #: Maximum number of entries; zero if the cache is disabled
+    maxsize: int
+    #: Current number of entries
+    currsize: int
+
+
+class LRUCache:
+    """
+    A thread-safe, size-bounded least-recently-used cache.
+
+    A cache with a ``maxsize`` of zero is disabled: it stores nothing and
+    callers are expected to skip it altogether by checking
+    :attr:`maxsize` first.
+
+    :param maxsize: the maximum number of entries
+    """
+
+    __slots__ = ("_data", "_evictions", "_hits", "_lock", "_maxsize", "_misses")
+
+    def __init__(self, maxsize: int = 0):
+        self._data: typing.OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = Lock()
+        self._maxsize = 0
+        self._hits = self._misses = self._evictions = 0
+        self.resize(maxsize)
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of entries (read-only, see :meth:`resize`)."""
+        return self._maxsize
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Return the entry for key and mark it as recently used.
+
+        :param key: the key to look up
+        :param default: the value to return if key is not cached
+        :return: the cached value or default
+        """
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store value under key, evicting the least recently used entry if
+        the cache is full.
+
+        :param key: the key to store
+        :param value: the value to store
+        """
+        with self._lock:
+            if not self._maxsize:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Change the maximum number of entries.
+
+        Shrinking the cache evicts the least recently used entries, a size of
+        zero disables the cache and removes all entries.
+
+        :param maxsize: the new maximum number of entries
+        :raises ValueError: if maxsize is negative
+        """
+        if maxsize < 0:
+            raise ValueError(f"maxsize must not be negative, but got {maxsize}")
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Return the statistics of the cache.
+
+        :return: the current hits, misses, evictions, and sizes
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._maxsize,
+                len(self._data),
+            )
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(maxsize={self._maxsize})"
+
+    def _evict(self) -> None:
+        """Remove the oldest entries until the cache fits. Expects the lock."""
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+            self._evictions += 1
@@ -0,0 +1,170 @@
+"""
+Hand-written scanner for semver version strings.
+
+The scanner implements exactly the same grammar as
+:attr:`Version._REGEX <semver.version.Version._REGEX>` and
+:attr:`Version._REGEX_OPTIONAL_MINOR_AND_PATCH
+<semver.version.Version._REGEX_OPTIONAL_MINOR_AND_PATCH>`, but splits the
+string on ``+``, ``-``, and ``.`` and validates each part with string
+methods instead of running a verbose regular expression.
+
+To stay compatible with the regular expressions, the scanner mirrors two of
+their subtleties:
+
+* ``\\d`` matches any Unicode decimal digit (category ``Nd``), which is
+  what :meth:`str.isdecimal` checks.
+* ``$`` also matches right before a single trailing newline.
+"""
+
+from typing import List, Optional, Tuple
+
+#: The parts of a successfully scanned version string
+ScannedVersion = Tuple[int, int, int, Optional[str], Optional[str]]
+
+_NONZERO_DIGITS = frozenset("123456789")
+_ALPHA_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ-")
+_IDENTIFIER_CHARS = _ALPHA_CHARS | frozenset("0123456789")
+_DOTTED_IDENTIFIER_CHARS = _IDENTIFIER_CHARS | frozenset(".")
+
+
+def _is_numeric(part: str) -> bool:
+    """Check if part matches ``0|[1-9]\\d*``."""
+    return part.isdecimal() and (part == "0" or part[0] in _NONZERO_DIGITS)
+
+
+def _is_prerelease_identifier(ident: str) -> bool:
+    """Check if ident matches ``0|[1-9]\\d*|\\d*[a-zA-Z-][0-9a-zA-Z-]*``."""
+    if ident.isdecimal():
+        return ident == "0" or ident[0] in _NONZERO_DIGITS
+    if ident.isascii():
+        # If it's not empty, it contains at least one letter or hyphen
+        return bool(ident) and _IDENTIFIER_CHARS.issuperset(ident)
+    # Only the leading \d* run may contain non-ASCII (Unicode) digits
+    pos = 0
+    while ident[pos].isdecimal():
+        pos += 1
+    return ident[pos] in _ALPHA_CHARS and _IDENTIFIER_CHARS.issuperset(
+        ident[pos + 1 :]
+    )
+
+
+def _is_dotted(string: str) -> bool:
+    """Check if an ASCII string matches ``[0-9a-zA-Z-]+(?:\\.[0-9a-zA-Z-]+)*``."""
+    return not (
+        not string
+        or string[0] == "."
+        or string[-1] == "."
+        or ".." in string
+        or not _DOTTED_IDENTIFIER_CHARS.issuperset(string)
+    )
+
+
+def _split_unicode(
+    core: str, prerelease: Optional[str], build: Optional[str]
+) -> bool:
+    """
+    Validate the parts of a version string which contains non-ASCII chars.
+
+    :param core: the major, minor, and patch parts including the dots
+    :param prerelease: the prerelease part, if there is any
+    :param build: the build part, if there is any
+    :return: True if all parts are valid, otherwise False
+    """
+    if build is not None and not (build.isascii() and _is_dotted(build)):
+        return False
+    if prerelease is not None and not all(
+        map(_is_prerelease_identifier, prerelease.split("."))
+    ):
+        return False
+    return all(map(_is_numeric, core.split(".")))
+
+
+def split(
+    version: str, optional_minor_and_patch: bool = False
+) -> Optional[Tuple[List[str], Optional[str], Optional[str]]]:
+    """
+    Split and validate a version string without converting any numbers.
+
+    :param version: the version string
+    :param optional_minor_and_patch: allow missing minor and patch parts
+    :return: a tuple with the list of the major, minor, and patch strings, the
+        prerelease, and the build; None if the string is not a valid version
+    """
+    if version[-1:] == "\n":
+        version = version[:-1]
+
+    core, plus, build_ = version.partition("+")
+    core, minus, prerelease_ = core.partition("-")
+    build = build_ if plus else None
+    prerelease = prerelease_ if minus else None
+
+    parts = core.split(".")
+    if len(parts) != 3 and not (optional_minor_and_patch and len(parts) < 3):
+        return None
+
+    if not version.isascii():
+        if _split_unicode(core, prerelease, build):
+            return parts, prerelease, build
+        return None
+
+    if build is not None and not _is_dotted(build):
+        return None
+
+    if prerelease is not None:
+        if not _is_dotted(prerelease):
+            return None
+        # Numeric identifiers must not have leading zeros
+        if prerelease[0] == "0" or ".0" in prerelease:
+            for ident in prerelease.split("."):
+                if ident[0] == "0" and len(ident) > 1 and ident.isdigit():
+                    return None
+
+    for part in parts:
+        if not part.isdigit() or (part[0] == "0" and len(part) > 1):
+            return None
+
+    return parts, prerelease, build
+
+
+def is_valid(version: str, optional_minor_and_patch: bool = False) -> bool:
+    """
+    Check a version string against the grammar only.
+
+    :param version: the version string
+    :param optional_minor_and_patch: allow missing minor and patch parts
+    :return: True if the string is a valid version, otherwise False
+
+    >>> is_valid("1.2.3-rc.1"), is_valid("1.2.03")
+    (True, False)
+    """
+    return split(version, optional_minor_and_patch) is not None
+
+
+def scan(
+    version: str, optional_minor_and_patch: bool = False
+) -> Optional[ScannedVersion]:
+    """
+    Scan a version string into its parts.
+
+    :param version: the version string
+    :param optional_minor_and_patch: allow missing minor and patch parts;
+        missing parts are set to zero
+    :return: a tuple ``(major, minor, patch, prerelease, build)`` or None
+        if the string is not a valid version
+
+    >>> scan("1.2.3-rc.1+build.5")
+    (1, 2, 3, 'rc.1', 'build.5')
+    >>> scan("1.2", optional_minor_and_patch=True)
+    (1, 2, 0, None, None)
+    >>> scan("1.2") is None
+    True
+    """
+    result = split(version, optional_minor_and_patch)
+    if result is None:
+        return None
+
+    parts, prerelease, build = result
+    if len(parts) == 3:
+        return int(parts[0]), int(parts[1]), int(parts[2]), prerelease, build
+    minor = int(parts[1]) if len(parts) == 2 else 0
+    return int(parts[0]), minor, 0, prerelease, build
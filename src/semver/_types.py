@@ -1,12 +1,13 @@
 """Typing for semver."""
 
 from functools import partial
-from typing import Union, Optional, Tuple, Dict, Iterable, Callable, TypeVar
+from typing import Any, Union, Optional, Tuple, Dict, Iterable, Callable, TypeVar
 
 VersionPart = Union[int, Optional[str]]
 VersionTuple = Tuple[int, int, int, Optional[str], Optional[str]]
 VersionDict = Dict[str, VersionPart]
 VersionIterator = Iterable[VersionPart]
 String = Union[str, bytes]
+SortKey = Tuple[int, int, int, Tuple[Any, ...]]
 F = TypeVar("F", bound=Callable)
 Decorator = Union[Callable[..., F], partial]
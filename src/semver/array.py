@@ -0,0 +1,300 @@
+"""
+Columnar arrays of versions for vectorized comparisons.
+
+This module needs `NumPy <https://numpy.org>`_, which is an optional
+dependency of semver. Install it with::
+
+    pip install semver[numpy]
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+try:
+    import numpy as np
+except ImportError as err:  # pragma: no cover
+    raise ImportError(
+        "semver.array requires NumPy, install it with 'pip install semver[numpy]'"
+    ) from err
+
+from ._parser import scan
+from ._types import String, VersionTuple
+from .version import _MATCH_RESULTS, Version, _sort_key, _split_match_expr
+
+#: A single version to compare a :class:`VersionArray` with
+Scalar = Union[Version, String]
+
+#: The highest major, minor, or patch part which fits into a column
+_MAX_PART = int(np.iinfo(np.int64).max)
+
+
+def _check_part(part: int) -> None:
+    if part > _MAX_PART:
+        raise ValueError(f"Version part {part} is greater than {_MAX_PART}")
+
+
+class VersionArray:
+    """
+    An array of versions stored in NumPy columns.
+
+    .. versionadded:: 3.1.0
+
+    The major, minor, and patch parts are stored as integer columns. The
+    prerelease is stored as a rank column: the position of its sort key
+    among all distinct prereleases of the array, see
+    :meth:`Version.sort_key <semver.version.Version.sort_key>`. This way,
+    comparing, sorting, and matching works on whole columns instead of
+    single :class:`~semver.version.Version` objects.
+
+    Comparing a :class:`VersionArray` with a single version or version
+    string returns a boolean array.
+
+    Version strings are scanned into the columns directly, without
+    creating a :class:`~semver.version.Version` for each of them, unless
+    version_class overrides :meth:`~semver.version.Version.parse`.
+
+    :param versions: the versions or version strings
+    :param version_class: the class of the versions created by
+        :meth:`to_versions` and for parsing strings, defaults to
+        :class:`~semver.version.Version`
+    :raises ValueError: if a version is invalid, or one of its major, minor,
+        and patch parts doesn't fit into 64 bits
+
+    >>> array = VersionArray(["1.0.0", "2.0.0-rc.1", "2.0.0", "0.9.0"])
+    >>> (array >= "2.0.0-rc.1").tolist()
+    [False, True, True, False]
+    >>> [str(v) for v in array.sort().to_versions()]
+    ['0.9.0', '1.0.0', '2.0.0-rc.1', '2.0.0']
+    >>> str(array.max())
+    '2.0.0'
+    """
+
+    def __init__(
+        self,
+        versions: Iterable[Union[Version, String]] = (),
+        *,
+        version_class: Type[Version] = Version,
+    ):
+        self._cls = version_class
+        major: List[int] = []
+        minor: List[int] = []
+        patch: List[int] = []
+        prerelease_codes: List[int] = []
+        build_codes: List[int] = []
+        prereleases: Dict[Optional[str], int] = {}
+        builds: Dict[Optional[str], int] = {}
+
+        for version in versions:
+            parts = self._parts(version)
+            major.append(parts[0])
+            minor.append(parts[1])
+            patch.append(parts[2])
+            prerelease_codes.append(prereleases.setdefault(parts[3], len(prereleases)))
+            build_codes.append(builds.setdefault(parts[4], len(builds)))
+
+        for column in (major, minor, patch):
+            if column:
+                _check_part(max(column))
+
+        self._major = np.array(major, dtype=np.int64)
+        self._minor = np.array(minor, dtype=np.int64)
+        self._patch = np.array(patch, dtype=np.int64)
+        self._prerelease = np.array(prerelease_codes, dtype=np.int64)
+        self._build = np.array(build_codes, dtype=np.int64)
+        self._prereleases: List[Optional[str]] = list(prereleases)
+        self._builds: List[Optional[str]] = list(builds)
+
+        # Rank the distinct prereleases. Releases are included, so every
+        # array knows the key of a release.
+        keys: Dict[Optional[str], Tuple[Any, ...]] = {
+            p: _sort_key(0, 0, 0, p)[3] for p in [None, *prereleases]
+        }
+        self._keys: List[Tuple[Any, ...]] = sorted(set(keys.values()))
+        positions = {key: 2 * pos for pos, key in enumerate(self._keys)}
+        ranks = [positions[keys[p]] for p in self._prereleases]
+        self._rank = np.array(ranks, dtype=np.int64)[self._prerelease]
+
+    def _parts(self, version: Union[Version, String]) -> VersionTuple:
+        """Split a version or version string into its parts."""
+        if isinstance(version, Version):
+            return (
+                version.major,
+                version.minor,
+                version.patch,
+                version.prerelease,
+                version.build,
+            )
+        if self._cls._CUSTOM_PARSE or not isinstance(version, (str, bytes)):
+            # Custom parse methods accept other strings, and parse raises
+            # the usual TypeError for other types
+            return self._parts(self._cls.parse(version))
+        text = version.decode("UTF-8") if isinstance(version, bytes) else version
+        if self._cls._PARSE_WITH_REGEX:
+            parts = self._cls._parse_with_regex(text)
+        else:
+            parts = scan(text)
+        if parts is None:
+            raise ValueError(f"{text} is not valid SemVer string")
+        return parts
+
+    def _subset(self, index: Any) -> "VersionArray":
+        """Return a new array with the rows selected by a NumPy index."""
+        subset = object.__new__(type(self))
+        subset.__dict__.update(self.__dict__)
+        for name in ("_major", "_minor", "_patch", "_prerelease", "_build", "_rank"):
+            setattr(subset, name, getattr(self, name)[index])
+        return subset
+
+    def _version(self, row: int) -> Version:
+        """Create the version of a single row."""
+        return self._cls(
+            int(self._major[row]),
+            int(self._minor[row]),
+            int(self._patch[row]),
+            self._prereleases[self._prerelease[row]],
+            self._builds[self._build[row]],
+        )
+
+    def to_versions(self) -> List[Version]:
+        """
+        Convert the array into a list of versions.
+
+        :return: a list of :class:`~semver.version.Version` instances
+        """
+        return [self._version(row) for row in range(len(self))]
+
+    def __len__(self) -> int:
+        return len(self._major)
+
+    def __iter__(self):
+        return iter(self.to_versions())
+
+    def __getitem__(self, index: Any) -> Union[Version, "VersionArray"]:
+        """
+        Select a single version, or a subset with a slice, a boolean mask, or
+        an array of indices.
+        """
+        if isinstance(index, (int, np.integer)):
+            return self._version(range(len(self))[index])
+        return self._subset(index)
+
+    def __repr__(self) -> str:
+        versions = ", ".join(repr(str(v)) for v in self)
+        return f"{type(self).__name__}([{versions}])"
+
+    def _rank_of(self, prerelease: Optional[str]) -> int:
+        """
+        Rank a prerelease which might not be part of the array.
+
+        Unknown prereleases get an odd rank between their neighbors.
+        """
+        key = _sort_key(0, 0, 0, prerelease)[3]
+        pos = bisect_left(self._keys, key)
+        if pos < len(self._keys) and self._keys[pos] == key:
+            return 2 * pos
+        return 2 * pos - 1
+
+    def compare(self, other: Scalar) -> "np.ndarray":
+        """
+        Compare every version of the array with other.
+
+        :param other: a version or version string
+        :return: an integer array, negative where the version is smaller
+            than other, zero where it's equal, and positive where it's greater
+        :raises ValueError: if other is invalid, or one of its major, minor,
+            and patch parts doesn't fit into 64 bits
+        """
+        major, minor, patch, prerelease, _ = self._parts(other)
+        _check_part(max(major, minor, patch))
+        result = np.sign(self._major - major)
+        for column, value in (
+            (self._minor, minor),
+            (self._patch, patch),
+            (self._rank, self._rank_of(prerelease)),
+        ):
+            result = np.where(result != 0, result, np.sign(column - value))
+        return result
+
+    def __eq__(self, other: Scalar) -> "np.ndarray":  # type: ignore[override]
+        return self.compare(other) == 0
+
+    def __ne__(self, other: Scalar) -> "np.ndarray":  # type: ignore[override]
+        return self.compare(other) != 0
+
+    def __lt__(self, other: Scalar) -> "np.ndarray":
+        return self.compare(other) < 0
+
+    def __le__(self, other: Scalar) -> "np.ndarray":
+        return self.compare(other) <= 0
+
+    def __gt__(self, other: Scalar) -> "np.ndarray":
+        return self.compare(other) > 0
+
+    def __ge__(self, other: Scalar) -> "np.ndarray":
+        return self.compare(other) >= 0
+
+    __hash__ = None  # type: ignore
+
+    def match(self, match_expr: str) -> "np.ndarray":
+        """
+        Match every version of the array against a match expression.
+
+        :param match_expr: optional operator and version, see
+            :meth:`Version.match <semver.version.Version.match>`
+        :return: a boolean array, True where the version matches
+
+        >>> VersionArray(["1.0.0", "1.5.0", "2.0.0"]).match(">=1.2.0").tolist()
+        [False, True, True]
+        """
+        prefix, match_version = _split_match_expr(match_expr)
+        return np.isin(self.compare(match_version), _MATCH_RESULTS[prefix])
+
+    def argsort(self, reverse: bool = False) -> "np.ndarray":
+        """
+        Return the indices which would sort the array by precedence.
+
+        The sort is stable, equal versions keep their order.
+
+        :param reverse: sort from the highest to the lowest version
+        :return: an integer array of indices
+        """
+        if reverse:
+            return np.lexsort((-self._rank, -self._patch, -self._minor, -self._major))
+        return np.lexsort((self._rank, self._patch, self._minor, self._major))
+
+    def sort(self, reverse: bool = False) -> "VersionArray":
+        """
+        Return a new array sorted by precedence.
+
+        :param reverse: sort from the highest to the lowest version
+        :return: the sorted array
+        """
+        return self._subset(self.argsort(reverse))
+
+    def _extreme(self, largest: bool) -> Version:
+        """Find the first highest or lowest version without sorting."""
+        if not len(self):
+            raise ValueError("empty VersionArray has no maximum or minimum")
+        rows = np.arange(len(self))
+        for column in (self._major, self._minor, self._patch, self._rank):
+            values = column[rows]
+            rows = rows[values == (values.max() if largest else values.min())]
+        return self._version(rows[0])
+
+    def max(self) -> Version:
+        """
+        Return the highest version.
+
+        :return: the first version with the highest precedence
+        :raises ValueError: if the array is empty
+        """
+        return self._extreme(largest=True)
+
+    def min(self) -> Version:
+        """
+        Return the lowest version.
+
+        :return: the first version with the lowest precedence
+        :raises ValueError: if the array is empty
+        """
+        return self._extreme(largest=False)
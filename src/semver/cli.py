@@ -8,16 +8,143 @@ The :func:`main <semver.cli.main>` function calls
 all the commandline options.
 
 The result of each command is printed on stdout.
+
+With ``--batch``, a command runs once for every line of its input, see
+:func:`process_batch <semver.cli.process_batch>`. The ``sort`` and
+``filter`` commands read all versions from stdin and print them line by line.
+
+With ``--connect``, a command is sent to a running ``pysemver serve``
+process, see :mod:`semver.server`.
+
+With ``--format json`` or ``--format ndjson``, results and errors are
+written as JSON records on stdout, see :func:`main <semver.cli.main>`.
 """
 
 import argparse
+import json
 import sys
-from typing import cast, List, Optional
-
-from .version import Version
+from heapq import nlargest
+from itertools import count
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, Tuple, cast, List, Optional
+
+from ._parser import scan
+from ._types import SortKey
+from .range import _POINT, VersionRange
+from .version import Version, _sort_key
 from .__about__ import __version__
 
 
+#: The output formats of :func:`main`
+FORMATS = ("text", "json", "ndjson")
+
+
+class _InvalidLinesError(ValueError):
+    """Some lines of a stream were invalid, and were reported already."""
+
+
+class _Output:
+    """
+    Write the results and errors of a command.
+
+    The ``text`` format prints results on stdout, and errors on stderr.
+    The ``json`` and ``ndjson`` formats write a record for each result or
+    error on stdout, one per line. For streams of records, ``json`` writes
+    a JSON array item by item, so nothing is buffered.
+
+    :param format: one of :data:`FORMATS`
+    :param stream: the command writes many records
+    """
+
+    def __init__(self, format: str = "text", stream: bool = False):
+        self.format = format
+        self.stream = stream
+        self._records = 0
+
+    @property
+    def structured(self) -> bool:
+        return self.format != "text"
+
+    def _write_record(
+        self,
+        input: Optional[str],
+        version: Optional[str],
+        result: Optional[str],
+        error: Optional[str],
+        line: Optional[int],
+        flush: bool,
+    ) -> None:
+        parts = scan(version) if version is not None else None
+        record: Dict[str, Any] = {
+            "input": input,
+            "parsed": None if parts is None else dict(zip(Version.NAMES, parts)),
+            "result": result,
+            "error": error,
+        }
+        if line is not None:
+            record["line"] = line
+        text = json.dumps(record)
+        if self.format == "json" and self.stream:
+            text = ("[\n" if not self._records else ",\n") + text
+        else:
+            text += "\n"
+        self._records += 1
+        sys.stdout.write(text)
+        if flush:
+            sys.stdout.flush()
+
+    def result(
+        self,
+        input: Optional[str],
+        version: Optional[str],
+        result: Optional[str],
+        line: Optional[int] = None,
+        flush: bool = False,
+    ) -> None:
+        """
+        Write the result of a command.
+
+        :param input: the input of the command, a line or the arguments
+        :param version: the input version, its parts are part of the record
+        :param result: the result of the command
+        :param line: the line number of the input
+        :param flush: flush stdout after writing
+        """
+        if self.structured:
+            self._write_record(input, version, result, None, line, flush)
+        elif result is not None:
+            print(result, flush=flush)
+
+    def error(
+        self,
+        input: Optional[str],
+        version: Optional[str],
+        message: str,
+        line: Optional[int] = None,
+    ) -> None:
+        """
+        Write the error of a command.
+
+        See :meth:`result` for the arguments.
+        """
+        if self.structured:
+            self._write_record(input, version, None, message, line, True)
+        elif line is None:
+            print("ERROR", message, file=sys.stderr, flush=True)
+        else:
+            print(f"ERROR line {line}:", message, file=sys.stderr, flush=True)
+
+    def close(self) -> None:
+        """Finish the output, which closes the JSON array of a stream."""
+        if self.format == "json" and self.stream:
+            sys.stdout.write("\n]\n" if self._records else "[]\n")
+
+
+def _output(args: argparse.Namespace) -> _Output:
+    """Return the output of the command, see :func:`main`."""
+    return getattr(args, "output", None) or _Output()
+
+
 def cmd_bump(args: argparse.Namespace) -> str:
     """
     Subcommand: Bumps a version.
@@ -83,6 +210,164 @@ def cmd_nextver(args: argparse.Namespace) -> str:
     return str(version.next_version(args.part))
 
 
+def _read_versions(
+    args: argparse.Namespace, invalid: List[int]
+) -> Iterator[Tuple[SortKey, str]]:
+    """
+    Read the versions from stdin, one per line.
+
+    Each version is scanned once into its sort key. Empty lines are skipped.
+    The line numbers of invalid versions are appended to invalid and reported,
+    unless ``args.skip_invalid`` is set.
+
+    :param args: The parsed arguments
+    :param invalid: the list which collects the numbers of invalid lines
+    :return: an iterator over the sort key and the version string of each line
+    """
+    output = _output(args)
+    for number, line in enumerate(sys.stdin, 1):
+        version = line.strip()
+        if not version:
+            continue
+        parts = scan(version)
+        if parts is None:
+            if not args.skip_invalid:
+                output.error(version, None, f"Invalid version {version!r}", number)
+                invalid.append(number)
+            continue
+        yield _sort_key(parts[0], parts[1], parts[2], parts[3]), version
+
+
+def _check_invalid(invalid: List[int]) -> None:
+    """Raise an error after all lines were processed if any line was invalid."""
+    if invalid:
+        raise _InvalidLinesError(f"Found {len(invalid)} invalid version(s)")
+
+
+def cmd_sort(args: argparse.Namespace) -> None:
+    """
+    Subcommand: Sort the versions read from stdin by their precedence.
+
+    Synopsis: sort [--reverse] [--unique] [--latest N] [--skip-invalid]
+
+    The sort is stable, versions with equal precedence keep their order.
+    With ``--latest N``, only the N highest versions are kept in memory.
+
+    :param args: The parsed arguments
+    """
+    invalid: List[int] = []
+    entries = _read_versions(args, invalid)
+    if args.unique:
+        # Keep the first version of equal precedence, like a stable sort
+        first: Dict[SortKey, str] = {}
+        for key, version in entries:
+            first.setdefault(key, version)
+        entries = iter(first.items())
+
+    if args.latest is None:
+        result = sorted(entries, key=itemgetter(0), reverse=args.reverse)
+    else:
+        # Break ties by position, to select the same lines as a stable sort
+        order = count(0, -1) if args.reverse else count()
+        ranked = (
+            (key, pos, version) for pos, (key, version) in zip(order, entries)
+        )
+        top = nlargest(args.latest, ranked)
+        if not args.reverse:
+            top.reverse()
+        result = [(key, version) for key, _, version in top]
+
+    output = _output(args)
+    if output.structured:
+        for _, version in result:
+            output.result(version, version, version)
+    else:
+        sys.stdout.writelines(f"{version}\n" for _, version in result)
+    _check_invalid(invalid)
+
+
+def cmd_filter(args: argparse.Namespace) -> None:
+    """
+    Subcommand: Print the versions read from stdin which satisfy a range.
+
+    Synopsis: filter <RANGE> [--skip-invalid]
+
+    Each matching version is printed as soon as it's read, see
+    :class:`~semver.range.VersionRange` for the range syntax.
+
+    :param args: The parsed arguments
+    """
+    version_range = VersionRange.compile(args.range)
+    output = _output(args)
+    invalid: List[int] = []
+    for key, version in _read_versions(args, invalid):
+        if version_range._contains_point((key, _POINT)):
+            if output.structured:
+                output.result(version, version, version)
+            else:
+                sys.stdout.write(f"{version}\n")
+    _check_invalid(invalid)
+
+
+def cmd_serve(args: argparse.Namespace) -> None:
+    """
+    Subcommand: Answer requests on a Unix socket until interrupted.
+
+    Synopsis: serve --socket <PATH> [--cache-size N]
+
+    :param args: The parsed arguments
+    """
+    from .server import serve
+
+    serve(args.socket, args.cache_size)
+
+
+#: The positional arguments of each command, which can be read from the lines
+#: of the input in batch mode
+BATCH_ARGS: Dict[Callable[[argparse.Namespace], Optional[str]], Tuple[str, ...]] = {
+    cmd_bump: ("version",),
+    cmd_check: ("version",),
+    cmd_compare: ("version1", "version2"),
+    cmd_nextver: ("version", "part"),
+}
+
+
+def _add_batch_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the ``--batch`` option to the parser of a command."""
+    # Errors about missing arguments show the usage of this parser
+    parser.set_defaults(command_parser=parser)
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        nargs="?",
+        const=sys.stdin,
+        default=argparse.SUPPRESS,
+        type=argparse.FileType(encoding="utf-8"),
+        help="Run the command for each line of FILE (default: stdin); "
+        "each line contains the arguments missing on the command line",
+    )
+
+
+def _positive_int(value: str) -> int:
+    """Convert an option value into an integer greater than zero."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"invalid positive integer: {value!r}")
+    return number
+
+
+def _add_skip_invalid_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the ``--skip-invalid`` option to the parser of a command."""
+    parser.add_argument(
+        "--skip-invalid",
+        action="store_true",
+        help="Skip invalid versions silently instead of reporting them",
+    )
+
+
 def createparser() -> argparse.ArgumentParser:
     """
     Create an :class:`argparse.ArgumentParser` instance.
@@ -94,13 +379,28 @@ def createparser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--version", action="version", version="%(prog)s " + __version__
     )
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        default=argparse.SUPPRESS,
+        help="Write results and errors as text (default), as a JSON array, "
+        "or as one JSON object per line",
+    )
+    parser.add_argument(
+        "--connect",
+        metavar="PATH",
+        default=argparse.SUPPRESS,
+        help="Send the command to the server on the Unix socket PATH; "
+        "run it in this process if the server is not running",
+    )
 
     s = parser.add_subparsers()
     # create compare subcommand
     parser_compare = s.add_parser("compare", help="Compare two versions")
     parser_compare.set_defaults(func=cmd_compare)
-    parser_compare.add_argument("version1", help="First version")
-    parser_compare.add_argument("version2", help="Second version")
+    parser_compare.add_argument("version1", nargs="?", help="First version")
+    parser_compare.add_argument("version2", nargs="?", help="Second version")
+    _add_batch_argument(parser_compare)
 
     # create bump subcommand
     parser_bump = s.add_parser("bump", help="Bumps a version")
@@ -115,23 +415,72 @@ def createparser() -> argparse.ArgumentParser:
         sb.add_parser("prerelease", help="Bump the prerelease part of the version"),
         sb.add_parser("build", help="Bump the build part of the version"),
     ):
-        p.add_argument("version", help="Version to raise")
+        p.add_argument("version", nargs="?", help="Version to raise")
+        _add_batch_argument(p)
 
     # Create the check subcommand
     parser_check = s.add_parser(
         "check", help="Checks if a string is a valid semver version"
     )
     parser_check.set_defaults(func=cmd_check)
-    parser_check.add_argument("version", help="Version to check")
+    parser_check.add_argument("version", nargs="?", help="Version to check")
+    _add_batch_argument(parser_check)
 
     # Create the nextver subcommand
     parser_nextver = s.add_parser(
         "nextver", help="Determines the next version, taking prereleases into account."
     )
     parser_nextver.set_defaults(func=cmd_nextver)
-    parser_nextver.add_argument("version", help="Version to raise")
+    parser_nextver.add_argument("version", nargs="?", help="Version to raise")
     parser_nextver.add_argument(
-        "part", help="One of 'major', 'minor', 'patch', or 'prerelease'"
+        "part", nargs="?", help="One of 'major', 'minor', 'patch', or 'prerelease'"
+    )
+    _add_batch_argument(parser_nextver)
+
+    # Create the sort subcommand
+    parser_sort = s.add_parser(
+        "sort", help="Sorts the versions from stdin by their precedence"
+    )
+    parser_sort.set_defaults(func=cmd_sort)
+    parser_sort.add_argument(
+        "-r", "--reverse", action="store_true", help="Sort from highest to lowest"
+    )
+    parser_sort.add_argument(
+        "-u",
+        "--unique",
+        action="store_true",
+        help="Print only the first of versions with equal precedence",
+    )
+    parser_sort.add_argument(
+        "--latest",
+        metavar="N",
+        type=_positive_int,
+        help="Print only the N highest versions",
+    )
+    _add_skip_invalid_argument(parser_sort)
+
+    # Create the filter subcommand
+    parser_filter = s.add_parser(
+        "filter", help="Prints the versions from stdin which satisfy a range"
+    )
+    parser_filter.set_defaults(func=cmd_filter)
+    parser_filter.add_argument("range", help="Range expression, like '>=1.2 <2'")
+    _add_skip_invalid_argument(parser_filter)
+
+    # Create the serve subcommand
+    parser_serve = s.add_parser(
+        "serve", help="Answers requests on a Unix socket until interrupted"
+    )
+    parser_serve.set_defaults(func=cmd_serve)
+    parser_serve.add_argument(
+        "--socket", metavar="PATH", required=True, help="Path of the Unix socket"
+    )
+    parser_serve.add_argument(
+        "--cache-size",
+        metavar="N",
+        type=int,
+        default=4096,
+        help="Number of parsed versions to cache (default: %(default)s)",
     )
     return parser
 
@@ -148,27 +497,169 @@ def process(args: argparse.Namespace) -> str:
         args.parser.print_help()
         raise SystemExit()
 
+    names = BATCH_ARGS.get(args.func, ())
+    missing = [name for name in names if getattr(args, name, "") is None]
+    if missing:
+        parser = getattr(args, "command_parser", args.parser)
+        parser.error(f"the following arguments are required: {', '.join(missing)}")
+
     # Call the respective function object:
     return args.func(args)
 
 
+def process_batch(args: argparse.Namespace) -> int:
+    """
+    Process many inputs with a single command.
+
+    .. versionadded:: 3.1.0
+
+    The command runs once for each line of the open file ``args.batch``.
+    Each line contains the positional arguments which were not given on the
+    command line, separated by whitespace; empty lines are skipped.
+
+    The result of each line is written as soon as it's available. An invalid
+    line writes an error message with the line number, but doesn't stop the
+    processing.
+
+    :param args: The parsed arguments, including ``batch``
+    :return: error code, 2 if any line failed, otherwise 0
+    """
+    names = [name for name in BATCH_ARGS[args.func] if getattr(args, name) is None]
+    output = _output(args)
+    failed = False
+    try:
+        for number, line in enumerate(args.batch, 1):
+            fields = line.split()
+            if not fields:
+                continue
+            text = " ".join(fields)
+            if len(fields) != len(names):
+                message = f"Expected {len(names)} argument(s), but got {len(fields)}"
+                output.error(text, None, message, number)
+                failed = True
+                continue
+            values = dict(zip(names, fields))
+            version = _input_version(args, values)
+            try:
+                for name, field in values.items():
+                    setattr(args, name, field)
+                result = args.func(args)
+            except (ValueError, TypeError) as err:
+                output.error(text, version, str(err), number)
+                failed = True
+                continue
+            output.result(text, version, result, number, flush=True)
+    finally:
+        if args.batch is not sys.stdin:
+            args.batch.close()
+    return 2 if failed else 0
+
+
+def _input_version(
+    args: argparse.Namespace, values: Optional[Dict[str, str]] = None
+) -> Optional[str]:
+    """
+    Return the first version argument of a command, if there is any.
+
+    :param args: The parsed arguments
+    :param values: The arguments of a batch line, which replace the ones in args
+    """
+    for name in ("version", "version1"):
+        value = (values or {}).get(name) or getattr(args, name, None)
+        if value:
+            return value
+    return None
+
+
+def process_remote(args: argparse.Namespace) -> Optional[str]:
+    """
+    Send a command to the server on the socket ``args.connect``.
+
+    .. versionadded:: 3.1.0
+
+    If the server is not running, or doesn't support the command, the
+    command is processed in this process instead, see :func:`process`.
+
+    :param args: The parsed arguments
+    :return: result of the selected action
+    :raises ValueError: if the server reports an error
+    """
+    from .server import send, to_request
+
+    request = to_request(args) if hasattr(args, "func") else None
+    if request is not None and None not in request.values():
+        try:
+            response = send(args.connect, request)
+        except OSError:
+            pass
+        else:
+            if "error" in response:
+                raise ValueError(response["error"])
+            return response["result"]
+    return process(args)
+
+
 def main(cliargs: Optional[List[str]] = None) -> int:
     """
     Entry point for the application script.
 
+    With ``--format json`` or ``--format ndjson``, each result or error is
+    written as a JSON object with these keys:
+
+    * ``input``: the arguments of the command, or the line of the input
+    * ``parsed``: the parts of the input version, like
+      :meth:`Version.to_dict <semver.version.Version.to_dict>`, or null
+    * ``result``: the result of the command, or null
+    * ``error``: the error message, or null
+    * ``line``: the line number, only for commands which read lines
+
+    The ``sort`` and ``filter`` commands, and ``--batch``, write many records.
+    With ``json``, they are items of a JSON array; with ``ndjson``, each
+    record is on its own line.
+
     :param list cliargs: Arguments to parse or None (=use :class:`sys.argv`)
     :return: error code
     """
+    output = _Output()
     try:
         parser = createparser()
         args = parser.parse_args(args=cliargs)
         # Save parser instance:
         args.parser = parser
-        result = process(args)
-        if result is not None:
-            print(result)
+        func = getattr(args, "func", None)
+        output = args.output = _Output(
+            getattr(args, "format", "text"),
+            stream="batch" in args or func in (cmd_sort, cmd_filter),
+        )
+        if "batch" in args:
+            if "connect" in args:
+                if args.batch is not sys.stdin:
+                    args.batch.close()
+                parser.error("argument --batch: not allowed with argument --connect")
+            return process_batch(args)
+        result = process_remote(args) if "connect" in args else process(args)
+        if not output.stream:
+            output.result(_join_args(args), _input_version(args), result)
         return 0
 
+    except _InvalidLinesError as err:
+        # Each invalid line was reported already
+        if not output.structured:
+            print("ERROR", err, file=sys.stderr)
+        return 2
+
     except (ValueError, TypeError) as err:
-        print("ERROR", err, file=sys.stderr)
+        if output.stream:
+            output.error(None, None, str(err))
+        else:
+            output.error(_join_args(args), _input_version(args), str(err))
         return 2
+
+    finally:
+        output.close()
+
+
+def _join_args(args: argparse.Namespace) -> Optional[str]:
+    """Join the positional arguments of a command."""
+    names = BATCH_ARGS.get(args.func, ())
+    return " ".join(getattr(args, name) for name in names) or None
@@ -0,0 +1,510 @@
+"""Containers for many versions."""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from heapq import nlargest
+from operator import itemgetter
+from sys import getsizeof
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from ._parser import scan
+from ._types import SortKey, String
+from .version import Version, _pack, _sort_key
+
+T = TypeVar("T")
+KeyFunc = Optional[Callable[[Any], Union[Version, String]]]
+# The parts of a version without the build, followed by the original item
+_Scanned = Tuple[int, int, int, Optional[str], Any]
+
+
+class CompactVersionList(Sequence):
+    """
+    A memory-lean list of versions.
+
+    .. versionadded:: 3.1.0
+
+    Release versions (without prerelease and build) whose parts fit into
+    :meth:`Version.to_int <semver.version.Version.to_int>` are stored as
+    packed 64-bit integers in an :class:`array.array`, which takes 8 bytes per
+    version instead of a full object. All other versions are kept as
+    objects. Items are converted back into
+    :class:`~semver.version.Version` instances on access.
+
+    :param versions: the initial versions or version strings
+    :param version_class: the class of the versions, defaults to
+        :class:`~semver.version.Version`
+
+    >>> versions = CompactVersionList(["1.0.0", "1.1.0", "2.0.0-rc.1"])
+    >>> versions[1]
+    Version(major=1, minor=1, patch=0, prerelease=None, build=None)
+    >>> [str(v) for v in versions]
+    ['1.0.0', '1.1.0', '2.0.0-rc.1']
+    """
+
+    def __init__(
+        self,
+        versions: Iterable[Union[Version, String]] = (),
+        *,
+        version_class: Type[Version] = Version,
+    ):
+        # Packed versions are positive, objects are stored as -(index + 1)
+        self._packed = array("q")
+        self._objects: List[Version] = []
+        self._cls = version_class
+        self.extend(versions)
+
+    def append(self, version: Union[Version, String]) -> None:
+        """
+        Add a version to the end of the list.
+
+        :param version: the version or version string
+        """
+        if not isinstance(version, Version):
+            version = self._cls.parse(version)
+        if (
+            type(version) is self._cls
+            and version.prerelease is None
+            and version.build is None
+        ):
+            value = _pack(version.major, version.minor, version.patch)
+            if value is not None:
+                self._packed.append(value)
+                return
+        self._objects.append(version)
+        self._packed.append(-len(self._objects))
+
+    def extend(self, versions: Iterable[Union[Version, String]]) -> None:
+        """
+        Add many versions to the end of the list.
+
+        :param versions: the versions or version strings
+        """
+        for version in versions:
+            self.append(version)
+
+    def _get(self, value: int) -> Version:
+        if value < 0:
+            return self._objects[-value - 1]
+        return self._cls.from_int(value)
+
+    def __getitem__(  # type: ignore[override]
+        self, index: Union[int, slice]
+    ) -> Union[Version, "CompactVersionList"]:
+        if isinstance(index, slice):
+            return type(self)(
+                (self._get(v) for v in self._packed[index]), version_class=self._cls
+            )
+        return self._get(self._packed[index])
+
+    def __len__(self) -> int:
+        return len(self._packed)
+
+    def __iter__(self) -> Iterator[Version]:
+        return map(self._get, self._packed)
+
+    def __contains__(self, version: object) -> bool:
+        if isinstance(version, str):
+            version = self._cls.parse(version)
+        if isinstance(version, Version) and version.prerelease is None:
+            value = _pack(version.major, version.minor, version.patch)
+            if value is not None and value in self._packed:
+                return True
+        return any(version == other for other in self._objects)
+
+    def __sizeof__(self) -> int:
+        return (
+            object.__sizeof__(self)
+            + getsizeof(self._packed)
+            + getsizeof(self._objects)
+            + sum(getsizeof(v) for v in self._objects)
+        )
+
+    def __repr__(self) -> str:
+        versions = ", ".join(repr(str(v)) for v in self)
+        return f"{type(self).__name__}([{versions}])"
+
+
+class VersionIndex(Sequence):
+    """
+    A sorted set of versions with bisection-based queries.
+
+    .. versionadded:: 3.1.0
+
+    Versions are kept in ascending order of their precedence, next to their
+    precomputed :meth:`Version.sort_key <semver.version.Version.sort_key>`.
+    Versions with equal precedence are stored only once: as the build part
+    is ignored for precedence, adding ``1.0.0+build.2`` when ``1.0.0+build.1``
+    is already part of the index keeps ``1.0.0+build.1``.
+
+    All queries use :mod:`bisect`, so they take O(log n) instead of
+    scanning all versions. A slice is a new index, except for a slice with
+    a negative step, which is a list of the versions in descending order.
+
+    :param versions: the initial versions or version strings
+    :param version_class: the class for parsing version strings, defaults to
+        :class:`~semver.version.Version`
+
+    >>> index = VersionIndex(["1.0.0", "2.1.0", "2.0.0", "3.0.0-rc.1", "1.0.0"])
+    >>> [str(v) for v in index]
+    ['1.0.0', '2.0.0', '2.1.0', '3.0.0-rc.1']
+    >>> str(index.latest(major=2)), str(index.next_after("2.0.0"))
+    ('2.1.0', '2.1.0')
+    """
+
+    def __init__(
+        self,
+        versions: Iterable[Union[Version, String]] = (),
+        *,
+        version_class: Type[Version] = Version,
+    ):
+        self._cls = version_class
+        self._keys: List[SortKey] = []
+        self._versions: List[Version] = []
+        entries: Dict[SortKey, Version] = {}
+        for version in map(self._coerce, versions):
+            entries.setdefault(version.sort_key(), version)
+        for key in sorted(entries):
+            self._keys.append(key)
+            self._versions.append(entries[key])
+
+    def _coerce(self, version: Union[Version, String]) -> Version:
+        if isinstance(version, Version):
+            return version
+        return self._cls.parse(version)
+
+    def _key(self, version: Union[Version, String]) -> SortKey:
+        return self._coerce(version).sort_key()
+
+    def add(self, version: Union[Version, String]) -> None:
+        """
+        Add a version, unless a version with equal precedence is already
+        part of the index.
+
+        :param version: the version or version string
+        """
+        version = self._coerce(version)
+        key = version.sort_key()
+        index = bisect_left(self._keys, key)
+        if index == len(self._keys) or self._keys[index] != key:
+            self._keys.insert(index, key)
+            self._versions.insert(index, version)
+
+    def discard(self, version: Union[Version, String]) -> None:
+        """
+        Remove the version with the same precedence, if there is one.
+
+        :param version: the version or version string
+        """
+        key = self._key(version)
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            del self._keys[index]
+            del self._versions[index]
+
+    def __getitem__(  # type: ignore[override]
+        self, index: Union[int, slice]
+    ) -> Union[Version, "VersionIndex", List[Version]]:
+        if isinstance(index, slice):
+            if index.step is not None and index.step < 0:
+                # The versions are no longer sorted, so they can't be an index
+                return self._versions[index]
+            return self._slice(index)
+        return self._versions[index]
+
+    def _slice(self, index: slice) -> "VersionIndex":
+        """Return a new index with a slice of the versions, kept in order."""
+        result = type(self)(version_class=self._cls)
+        result._keys = self._keys[index]
+        result._versions = self._versions[index]
+        return result
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def __iter__(self) -> Iterator[Version]:
+        return iter(self._versions)
+
+    def __reversed__(self) -> Iterator[Version]:
+        return reversed(self._versions)
+
+    def __contains__(self, version: object) -> bool:
+        if not isinstance(version, (Version, *String.__args__)):  # type: ignore
+            return False
+        try:
+            key = self._key(version)  # type: ignore[arg-type]
+        except ValueError:
+            return False
+        index = bisect_left(self._keys, key)
+        return index < len(self._keys) and self._keys[index] == key
+
+    def __repr__(self) -> str:
+        versions = ", ".join(repr(str(v)) for v in self)
+        return f"{type(self).__name__}([{versions}])"
+
+    def _at(self, index: int) -> Optional[Version]:
+        """Return the version at index or None if it's out of range."""
+        if 0 <= index < len(self._versions):
+            return self._versions[index]
+        return None
+
+    def floor(self, version: Union[Version, String]) -> Optional[Version]:
+        """
+        Return the highest version lower than or equal to version.
+
+        :param version: the version or version string
+        :return: the version, or None if there is no such version
+        """
+        return self._at(bisect_right(self._keys, self._key(version)) - 1)
+
+    def ceiling(self, version: Union[Version, String]) -> Optional[Version]:
+        """
+        Return the lowest version greater than or equal to version.
+
+        :param version: the version or version string
+        :return: the version, or None if there is no such version
+        """
+        return self._at(bisect_left(self._keys, self._key(version)))
+
+    def previous_before(self, version: Union[Version, String]) -> Optional[Version]:
+        """
+        Return the highest version lower than version.
+
+        :param version: the version or version string
+        :return: the version, or None if there is no such version
+        """
+        return self._at(bisect_left(self._keys, self._key(version)) - 1)
+
+    def next_after(self, version: Union[Version, String]) -> Optional[Version]:
+        """
+        Return the lowest version greater than version.
+
+        :param version: the version or version string
+        :return: the version, or None if there is no such version
+
+        >>> str(VersionIndex(["1.0.0", "1.0.1", "1.1.0"]).next_after("1.0.0"))
+        '1.0.1'
+        """
+        return self._at(bisect_right(self._keys, self._key(version)))
+
+    def between(
+        self,
+        lower: Optional[Union[Version, String]] = None,
+        upper: Optional[Union[Version, String]] = None,
+        *,
+        inclusive: Tuple[bool, bool] = (True, True),
+    ) -> "VersionIndex":
+        """
+        Return all versions between lower and upper.
+
+        :param lower: the lower bound or None for no lower bound
+        :param upper: the upper bound or None for no upper bound
+        :param inclusive: whether lower and upper themselves are included
+        :return: a new index with the versions in the range
+
+        >>> index = VersionIndex(["1.0.0", "1.5.0", "2.0.0-rc.1", "2.0.0"])
+        >>> [str(v) for v in index.between("1.0.0", "2.0.0", inclusive=(False, False))]
+        ['1.5.0', '2.0.0-rc.1']
+        """
+        start, stop = 0, len(self._keys)
+        if lower is not None:
+            find = bisect_left if inclusive[0] else bisect_right
+            start = find(self._keys, self._key(lower))
+        if upper is not None:
+            find = bisect_right if inclusive[1] else bisect_left
+            stop = find(self._keys, self._key(upper))
+        return self._slice(slice(start, max(start, stop)))
+
+    def latest(
+        self,
+        major: Optional[int] = None,
+        minor: Optional[int] = None,
+        *,
+        prerelease: bool = True,
+    ) -> Optional[Version]:
+        """
+        Return the highest version, optionally within a major or minor line.
+
+        :param major: only consider versions with this major part
+        :param minor: only consider versions with this minor part; requires
+            major
+        :param prerelease: also consider prereleases; if False, prereleases
+            are skipped one by one
+        :return: the version, or None if there is no such version
+        :raises ValueError: if minor is given without major
+
+        >>> index = VersionIndex(["2.9.0", "3.1.0", "3.2.0-rc.1", "4.0.0"])
+        >>> str(index.latest(3)), str(index.latest(3, prerelease=False))
+        ('3.2.0-rc.1', '3.1.0')
+        """
+        if major is None:
+            if minor is not None:
+                raise ValueError("minor requires major")
+            index = len(self._keys)
+            prefix: Tuple[int, ...] = ()
+        elif minor is None:
+            index = bisect_left(self._keys, (major + 1,))
+            prefix = (major,)
+        else:
+            index = bisect_left(self._keys, (major, minor + 1))
+            prefix = (major, minor)
+        for pos in range(index - 1, -1, -1):
+            if self._keys[pos][: len(prefix)] != prefix:
+                break
+            if prerelease or self._versions[pos].prerelease is None:
+                return self._versions[pos]
+        return None
+
+    def latest_per_major(self, *, prerelease: bool = True) -> Dict[int, Version]:
+        """
+        Return the highest version of each major part.
+
+        :param prerelease: also consider prereleases, see :meth:`latest`
+        :return: a dict of the major parts and their highest versions, in
+            ascending order of the major parts
+
+        >>> index = VersionIndex(["1.0.0", "1.2.0", "3.0.0", "3.0.1"])
+        >>> {major: str(v) for major, v in index.latest_per_major().items()}
+        {1: '1.2.0', 3: '3.0.1'}
+        """
+        found = []
+        index = len(self._keys)
+        while index:
+            major = self._keys[index - 1][0]
+            latest = self.latest(major, prerelease=prerelease)
+            if latest is not None:
+                found.append((major, latest))
+            index = bisect_left(self._keys, (major,))
+        return dict(reversed(found))
+
+
+def _scan_items(
+    items: Iterable[T], key: KeyFunc, include_prereleases: bool, skip_invalid: bool
+) -> Iterator[_Scanned]:
+    """
+    Scan the version of each item without creating Version instances.
+
+    Prereleases are dropped right after scanning, unless they are included.
+    """
+    for item in items:
+        value = item if key is None else key(item)
+        if isinstance(value, Version):
+            if include_prereleases or value.prerelease is None:
+                yield value.major, value.minor, value.patch, value.prerelease, item
+            continue
+        if isinstance(value, bytes):
+            try:
+                value = value.decode("UTF-8")
+            except UnicodeDecodeError:
+                value = ""
+        elif not isinstance(value, str):
+            raise TypeError(f"Expected str, bytes, or Version, but got {type(value)}")
+        parts = scan(value)
+        if parts is None:
+            if skip_invalid:
+                continue
+            raise ValueError(f"{value} is not valid SemVer string")
+        if include_prereleases or parts[3] is None:
+            yield parts[0], parts[1], parts[2], parts[3], item
+
+
+def latest(
+    items: Iterable[T],
+    *,
+    include_prereleases: bool = False,
+    key: KeyFunc = None,
+    skip_invalid: bool = False,
+) -> Optional[T]:
+    """
+    Return the item with the highest version in a single pass.
+
+    .. versionadded:: 3.1.0
+
+    Unlike :func:`max`, this works on version strings directly: they are
+    scanned one by one without creating :class:`~semver.version.Version`
+    instances. Prereleases are skipped right after scanning, and the
+    prerelease of a version is only looked at if its major, minor, and
+    patch parts equal the highest ones so far.
+
+    :param items: version strings, bytes, :class:`~semver.version.Version`
+        instances, or anything key converts into one of them
+    :param include_prereleases: also consider prereleases
+    :param key: a function which returns the version of an item
+    :param skip_invalid: skip invalid version strings instead of raising
+    :return: the first item with the highest version, or None if there is
+        no (matching) item
+    :raises ValueError: if a version string is invalid and skip_invalid is
+        False
+
+    >>> semver.latest(["1.2.0", "1.10.0", "2.0.0-rc.1"])
+    '1.10.0'
+    >>> semver.latest(["1.2.0", "2.0.0-rc.1"], include_prereleases=True)
+    '2.0.0-rc.1'
+    >>> semver.latest([("a", "1.0.0"), ("b", "1.1.0")], key=lambda item: item[1])
+    ('b', '1.1.0')
+    """
+    best: Optional[T] = None
+    best_key: Optional[SortKey] = None
+    best_parts = (-1, -1, -1)
+    for major, minor, patch, prerelease, item in _scan_items(
+        items, key, include_prereleases, skip_invalid
+    ):
+        parts = (major, minor, patch)
+        if parts < best_parts:
+            continue
+        sort_key = _sort_key(major, minor, patch, prerelease)
+        if best_key is None or sort_key > best_key:
+            best, best_key, best_parts = item, sort_key, parts
+    return best
+
+
+def top_k(
+    items: Iterable[T],
+    k: int,
+    *,
+    include_prereleases: bool = False,
+    key: KeyFunc = None,
+    skip_invalid: bool = False,
+) -> List[T]:
+    """
+    Return the k items with the highest versions in a single pass.
+
+    .. versionadded:: 3.1.0
+
+    Only k items are kept in memory at a time, see :func:`heapq.nlargest`.
+    Version strings are scanned without creating
+    :class:`~semver.version.Version` instances, like in :func:`latest`.
+
+    :param items: version strings, bytes, :class:`~semver.version.Version`
+        instances, or anything key converts into one of them
+    :param k: the maximum number of items to return
+    :param include_prereleases: also consider prereleases
+    :param key: a function which returns the version of an item
+    :param skip_invalid: skip invalid version strings instead of raising
+    :return: the items, from the highest to the lowest version; items with
+        equal versions keep their order
+    :raises ValueError: if a version string is invalid and skip_invalid is
+        False
+
+    >>> semver.top_k(["1.0.0", "3.0.0", "2.0.0", "4.0.0-rc.1"], 2)
+    ['3.0.0', '2.0.0']
+    """
+    entries = (
+        (_sort_key(major, minor, patch, prerelease), item)
+        for major, minor, patch, prerelease, item in _scan_items(
+            items, key, include_prereleases, skip_invalid
+        )
+    )
+    return [item for _, item in nlargest(k, entries, key=itemgetter(0))]
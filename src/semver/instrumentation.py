@@ -0,0 +1,353 @@
+"""
+Count and time the hot paths of semver, without a profiler.
+
+The instrumentation is disabled by default and costs nothing then: only
+:func:`enable` replaces the instrumented methods and functions with wrappers
+which count their calls and errors and add up their time. :func:`disable`
+restores the originals.
+
+The counters are collected in a :class:`Snapshot` together with the
+statistics of the caches. Pass an exporter to :func:`add_exporter` to send
+the snapshots of :func:`export` to a metrics system.
+
+To find the lines which convert the same strings into versions again and
+again, like ``version > "1.0.0"`` in a loop, enable the instrumentation with
+``coercion_sites=True``.
+"""
+
+import os
+import sys
+import warnings
+from functools import wraps
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+from types import FrameType
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from ._cache import CacheInfo
+from .version import Version, coerce_cache, match_cache, parse_cache
+
+
+class Stats(NamedTuple):
+    """Counters of an instrumented operation."""
+
+    #: Number of calls
+    calls: int
+    #: Number of calls which raised an exception
+    errors: int
+    #: Total time of the calls in seconds, including the time of nested
+    #: operations
+    time: float
+
+
+class CoercionSite(NamedTuple):
+    """A line which converts other types into versions implicitly."""
+
+    #: The file of the line
+    filename: str
+    #: The number of the line
+    lineno: int
+    #: The function which contains the line
+    function: str
+    #: Number of conversions on this line
+    count: int  # type: ignore[assignment]
+    #: The last converted value
+    operand: Any
+
+
+class Snapshot(NamedTuple):
+    """The counters at a point in time, see :func:`snapshot`."""
+
+    #: The counters of each operation which was called at least once
+    operations: Dict[str, Stats]
+    #: The statistics of the caches: ``parse``, ``match``, ``coerce``, and
+    #: ``range`` if :mod:`semver.range` is imported
+    caches: Dict[str, CacheInfo]
+    #: The lines with implicit conversions, the most frequent first; only
+    #: filled with ``enable(coercion_sites=True)``
+    coercion_sites: List[CoercionSite]
+
+
+class CoercionWarning(UserWarning):
+    """
+    Warns about a line which converts values into versions repeatedly.
+
+    It's issued once for each line, on the second conversion.
+    """
+
+
+#: Computes the name of an operation from the arguments of a call, or
+#: returns None if the call is not counted
+_Key = Callable[..., Optional[str]]
+
+_lock = Lock()
+#: The calls, errors, and time of each operation
+_counters: Dict[str, List[Any]] = {}
+#: The owners, names, and original attributes of the wrapped functions
+_originals: List[Tuple[Any, str, Any]] = []
+_exporters: List[Callable[[Snapshot], None]] = []
+#: The function, count, and last operand of each coercion site, by its file
+#: and line number
+_sites: Dict[Tuple[str, int], List[Any]] = {}
+_track_sites = False
+#: Frames in this directory belong to semver and are no call sites
+_PACKAGE_DIR = str(Path(__file__).parent) + os.sep
+
+
+def _record(name: str, start: float, failed: bool) -> None:
+    elapsed = perf_counter() - start
+    with _lock:
+        counters = _counters.get(name)
+        if counters is None:
+            counters = _counters[name] = [0, 0, 0.0]
+        counters[0] += 1
+        counters[1] += failed
+        counters[2] += elapsed
+
+
+def _timed(func: Callable[..., Any], key: _Key) -> Callable[..., Any]:
+    """Wrap func to record its calls under the name which key returns."""
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        name = key(*args, **kwargs)
+        if name is None:
+            return func(*args, **kwargs)
+        start = perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException:
+            _record(name, start, True)
+            raise
+        _record(name, start, False)
+        return result
+
+    return wrapper
+
+
+def _named(name: str) -> _Key:
+    return lambda *args, **kwargs: name
+
+
+def _coercion(self: Version, other: Any, cached: bool = True) -> Optional[str]:
+    # Instances of the right class are returned as they are
+    if isinstance(other, type(self)):
+        return None
+    if _track_sites:
+        _record_site(type(self), other)
+    return "coerce"
+
+
+def _record_site(cls: type, operand: Any) -> None:
+    """Count the conversion of operand at the first line outside of semver."""
+    frame: Optional[FrameType] = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename.startswith(_PACKAGE_DIR):
+        frame = frame.f_back
+    if frame is None:  # pragma: no cover
+        # Called by semver itself, like by "python -m semver"
+        return
+
+    filename, lineno = frame.f_code.co_filename, frame.f_lineno
+    with _lock:
+        site = _sites.get((filename, lineno))
+        if site is None:
+            site = _sites[filename, lineno] = [frame.f_code.co_name, 0, None]
+        site[1] += 1
+        site[2] = operand
+        count = site[1]
+    if count == 2:
+        warnings.warn_explicit(
+            f"{operand!r} is converted into a {cls.__name__} again; "
+            "convert it once and reuse the instance",
+            CoercionWarning,
+            filename,
+            lineno,
+            module=frame.f_globals.get("__name__"),
+        )
+
+
+def _command(args: Any) -> Optional[str]:
+    func = getattr(args, "func", None)
+    return None if func is None else "cli." + func.__name__[len("cmd_") :]
+
+
+def _request(request: Any) -> Optional[str]:
+    from .server import COMMANDS
+
+    # Only count known commands, clients can send anything
+    cmd = request.get("cmd") if isinstance(request, dict) else None
+    return f"cli.{cmd}" if cmd in COMMANDS else None
+
+
+def _targets() -> List[Tuple[Any, str, _Key]]:
+    """Return the owners and names of the instrumented functions."""
+    from . import cli, server
+
+    methods = [
+        "parse",
+        "parse_many",
+        "compare",
+        "match",
+        "replace",
+        "bump_major",
+        "bump_minor",
+        "bump_patch",
+        "bump_prerelease",
+        "bump_build",
+    ]
+    # Comparison operators are counted as "cmp.lt", "cmp.eq", and so on
+    operators = ["__eq__", "__ne__", "__lt__", "__le__", "__gt__", "__ge__"]
+    return [
+        *((Version, name, _named(name)) for name in methods),
+        *((Version, name, _named(f"cmp.{name.strip('_')}")) for name in operators),
+        (Version, "_coerce", _coercion),
+        (cli, "process", _command),
+        (cli, "process_batch", _command),
+        (server, "handle", _request),
+    ]
+
+
+def enable(coercion_sites: bool = False) -> None:
+    """
+    Start counting the calls of the instrumented operations.
+
+    .. versionadded:: 3.1.0
+
+    The operations are named after the methods of
+    :class:`~semver.version.Version`: ``parse``, ``parse_many``,
+    ``compare``, ``match``, ``replace``, and ``bump_major`` to
+    ``bump_build``. The comparison operators are counted as ``cmp.`` and
+    the name of their method, like ``cmp.lt`` for ``a < b`` and for each
+    comparison of :func:`sorted`. Subclasses which override a method are
+    not counted.
+    ``coerce`` counts the conversions of other types into a version, for
+    example of strings in :meth:`~semver.version.Version.compare`.
+    The commands of :mod:`semver.cli` and :mod:`semver.server` are
+    counted as ``cli.`` and the name of the command, like ``cli.bump``.
+
+    With coercion_sites, each conversion is counted for the line outside of
+    semver which caused it, see :attr:`Snapshot.coercion_sites`. This
+    costs a few more microseconds per conversion. The second conversion on
+    a line issues a :class:`CoercionWarning`.
+
+    Enabling the instrumentation again only changes coercion_sites.
+
+    :param coercion_sites: count the conversions for each line
+    """
+    global _track_sites
+
+    with _lock:
+        _track_sites = coercion_sites
+        if _originals:
+            return
+        for owner, name, key in _targets():
+            original = owner.__dict__[name]
+            if isinstance(original, classmethod):
+                wrapper: Any = classmethod(_timed(original.__func__, key))
+            else:
+                wrapper = _timed(original, key)
+            _originals.append((owner, name, original))
+            setattr(owner, name, wrapper)
+
+
+def disable() -> None:
+    """
+    Stop counting and restore the original operations.
+
+    .. versionadded:: 3.1.0
+
+    The counters keep their values, see :func:`reset`.
+    """
+    global _track_sites
+
+    with _lock:
+        _track_sites = False
+        while _originals:
+            owner, name, original = _originals.pop()
+            setattr(owner, name, original)
+
+
+def is_enabled() -> bool:
+    """
+    Return True if the instrumentation is enabled.
+
+    .. versionadded:: 3.1.0
+    """
+    return bool(_originals)
+
+
+def snapshot() -> Snapshot:
+    """
+    Return the current counters and cache statistics.
+
+    .. versionadded:: 3.1.0
+
+    :return: a snapshot, which doesn't change with later calls
+    """
+    caches = {
+        "parse": parse_cache.info(),
+        "match": match_cache.info(),
+        "coerce": coerce_cache.info(),
+    }
+    if "semver.range" in sys.modules:
+        caches["range"] = sys.modules["semver.range"].range_cache.info()
+    with _lock:
+        operations = {name: Stats(*counters) for name, counters in _counters.items()}
+        sites = [CoercionSite(*key, *site) for key, site in _sites.items()]
+    sites.sort(key=lambda site: site.count, reverse=True)
+    return Snapshot(operations, caches, sites)
+
+
+def reset() -> None:
+    """
+    Set all counters to zero and forget the coercion sites.
+
+    .. versionadded:: 3.1.0
+
+    The statistics of the caches are reset by their own
+    :meth:`~semver._cache.LRUCache.clear` method.
+    """
+    with _lock:
+        _counters.clear()
+        _sites.clear()
+
+
+def add_exporter(exporter: Callable[[Snapshot], None]) -> None:
+    """
+    Register a function which is called with the snapshots of :func:`export`.
+
+    .. versionadded:: 3.1.0
+
+    :param exporter: a function which sends a snapshot to a metrics system
+    """
+    _exporters.append(exporter)
+
+
+def remove_exporter(exporter: Callable[[Snapshot], None]) -> None:
+    """
+    Unregister an exporter of :func:`add_exporter`.
+
+    .. versionadded:: 3.1.0
+
+    :param exporter: the registered function
+    :raises ValueError: if exporter is not registered
+    """
+    _exporters.remove(exporter)
+
+
+def export() -> Snapshot:
+    """
+    Take a snapshot and pass it to every registered exporter.
+
+    .. versionadded:: 3.1.0
+
+    Call it periodically, for example from a timer thread, or when the
+    process exits with :func:`atexit.register`.
+
+    :return: the exported snapshot
+    """
+    current = snapshot()
+    for exporter in list(_exporters):
+        exporter(current)
+    return current
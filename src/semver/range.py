@@ -0,0 +1,553 @@
+"""
+Version ranges with npm and Cargo style constraints.
+
+A range expression is compiled once into a sorted list of disjoint
+intervals over the precedence of versions, see
+:meth:`Version.sort_key <semver.version.Version.sort_key>`. Checking a
+version then only needs a binary search over the interval bounds.
+"""
+
+import math
+import re
+from bisect import bisect_right
+from collections.abc import MutableMapping
+from itertools import count
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from ._cache import LRUCache
+from ._parser import _is_numeric, scan
+from ._types import String
+from .version import Version, _sort_key
+
+T = TypeVar("T", bound="VersionRange")
+V = TypeVar("V", Version, str, bytes)
+
+#: Cache of :meth:`VersionRange.compile`, keyed on the class and expression
+range_cache = LRUCache(maxsize=256)
+
+# A bound is a sort key and a flag. Versions are checked as (key, 1), so
+# flag 0 includes a lower and excludes an upper bound at the same key, and
+# flag 2 excludes a lower and includes an upper bound.
+Bound = Tuple[Tuple[Any, ...], int]
+Interval = Tuple[Bound, Bound]
+
+_INCLUSIVE_LOWER = _EXCLUSIVE_UPPER = 0
+_POINT = 1
+_EXCLUSIVE_LOWER = _INCLUSIVE_UPPER = 2
+
+#: Below and above every version
+_MIN: Bound = ((-1,), _INCLUSIVE_LOWER)
+_MAX: Bound = ((math.inf,), _INCLUSIVE_UPPER)
+_ANY: List[Interval] = [(_MIN, _MAX)]
+
+_WILDCARDS = ("x", "X", "*")
+_HYPHEN_RANGE = re.compile(r"^\s*(?P<lower>[^\s]+)\s+-\s+(?P<upper>[^\s]+)\s*$")
+_COMPARATOR = re.compile(r"\s*(?P<op>\^|~|[<>]=?|==?|!=|)\s*(?P<version>[^\s,]+)")
+
+# The parts of a partial version: None marks a wildcard or a missing part,
+# the prerelease is only allowed after all three parts.
+Partial = Tuple[Optional[int], Optional[int], Optional[int], Optional[str]]
+
+
+def _parse_partial(text: str) -> Optional[Partial]:
+    """
+    Parse a version which may have wildcards or missing parts.
+
+    :param text: the version, optionally prefixed with ``v``
+    :return: the parts of the version or None if it's invalid
+    """
+    if text[:1] in ("v", "V"):
+        text = text[1:]
+    if not text:
+        return None
+    scanned = scan(text)
+    if scanned is not None:
+        return scanned[:4]
+    parts = text.split(".")
+    if len(parts) > 3:
+        return None
+    numbers: List[Optional[int]] = []
+    for part in parts:
+        if part in _WILDCARDS:
+            numbers.append(None)
+        elif _is_numeric(part):
+            # Everything after a wildcard is a wildcard as well, like "1.x.3"
+            numbers.append(int(part) if None not in numbers else None)
+        else:
+            return None
+    numbers += [None] * (3 - len(numbers))
+    return numbers[0], numbers[1], numbers[2], None
+
+
+def _bound(
+    major: int, minor: int = 0, patch: int = 0, prerelease: Optional[str] = None
+) -> Tuple[Any, ...]:
+    """Return the sort key of a version, which is used as a bound."""
+    return _sort_key(major, minor, patch, prerelease)
+
+
+def _lower(partial: Partial) -> Bound:
+    """Return the inclusive lower bound of all versions matching partial."""
+    major, minor, patch, prerelease = partial
+    if major is None:
+        return _MIN
+    return _bound(major, minor or 0, patch or 0, prerelease), _INCLUSIVE_LOWER
+
+
+def _upper(partial: Partial) -> Bound:
+    """Return the upper bound of all versions matching partial."""
+    major, minor, patch, prerelease = partial
+    if major is None:
+        return _MAX
+    if minor is None:
+        return _bound(major + 1, prerelease="0"), _EXCLUSIVE_UPPER
+    if patch is None:
+        return _bound(major, minor + 1, prerelease="0"), _EXCLUSIVE_UPPER
+    return _bound(major, minor, patch, prerelease), _INCLUSIVE_UPPER
+
+
+def _comparator(op: str, partial: Partial) -> List[Interval]:
+    """
+    Convert a single comparator into intervals.
+
+    A lower bound uses the same tuple as the upper bound which excludes
+    exactly the same versions, so bounds can be reused for complements.
+    """
+    lower, upper = _lower(partial), _upper(partial)
+    major, minor, patch, _ = partial
+    if op in ("", "=", "=="):
+        return [(lower, upper)]
+    if op == "!=":
+        return [(_MIN, lower), (upper, _MAX)]
+    if op == ">":
+        return [(upper, _MAX)]
+    if op == ">=":
+        return [(lower, _MAX)]
+    if op == "<":
+        return [(_MIN, lower)]
+    if op == "<=":
+        return [(_MIN, upper)]
+    if major is None:
+        return _ANY
+    if op == "^":
+        if major or minor is None:
+            upper = _bound(major + 1, prerelease="0"), _EXCLUSIVE_UPPER
+        elif minor or patch is None:
+            upper = _bound(0, minor + 1, prerelease="0"), _EXCLUSIVE_UPPER
+        else:
+            upper = _bound(0, 0, patch + 1, prerelease="0"), _EXCLUSIVE_UPPER
+    # op == "~"
+    elif minor is None:
+        upper = _bound(major + 1, prerelease="0"), _EXCLUSIVE_UPPER
+    else:
+        upper = _bound(major, minor + 1, prerelease="0"), _EXCLUSIVE_UPPER
+    return [(lower, upper)]
+
+
+def _normalize(intervals: Iterable[Interval]) -> List[Interval]:
+    """Sort intervals, drop empty ones, and merge overlapping ones."""
+    result: List[Interval] = []
+    for lower, upper in sorted(i for i in intervals if i[0] < i[1]):
+        if result and lower <= result[-1][1]:
+            result[-1] = result[-1][0], max(result[-1][1], upper)
+        else:
+            result.append((lower, upper))
+    return result
+
+
+def _intersect(left: List[Interval], right: List[Interval]) -> List[Interval]:
+    """Return the intervals which are part of both left and right."""
+    return _normalize(
+        (max(l_lower, r_lower), min(l_upper, r_upper))
+        for l_lower, l_upper in left
+        for r_lower, r_upper in right
+    )
+
+
+def _point(version: Union[Version, String]) -> Bound:
+    """Return the position of a version between the bounds."""
+    if not isinstance(version, Version):
+        version = Version.parse(version)
+    return version.sort_key(), _POINT
+
+
+def _format_bound(bound: Bound) -> str:
+    """Convert the sort key of a bound back into a version string."""
+    key = bound[0]
+    version = f"{key[0]}.{key[1]}.{key[2]}"
+    if key[3][0] == 0:
+        version += "-" + ".".join(str(token) for _, token in key[3][1:])
+    return version
+
+
+class VersionRange:
+    """
+    A set of versions described by a range expression.
+
+    .. versionadded:: 3.1.0
+
+    The expression consists of comparator sets separated by ``||``; a
+    version has to satisfy every comparator of at least one set. The
+    comparators of a set are separated by whitespace or commas:
+
+    * ``1.2.3``, ``=1.2.3``, ``==1.2.3``: exactly this version
+    * ``>1.2.3``, ``>=1.2.3``, ``<1.2.3``, ``<=1.2.3``, ``!=1.2.3``
+    * ``1.2.x``, ``1.x``, ``1.2``, ``*``: any version with these parts
+    * ``^1.2.3``: compatible versions, ``>=1.2.3 <2.0.0-0``; for ``0.x``
+      versions, the first non-zero part must stay the same
+    * ``~1.2.3``: patch updates, ``>=1.2.3 <1.3.0-0``
+    * ``1.2.3 - 2.3``: a hyphen range, ``>=1.2.3 <2.4.0-0``
+
+    Versions are compared by their precedence: unlike npm, prereleases
+    are not excluded from ranges. Upper bounds which come from ``^``,
+    ``~``, or partial versions use the lowest prerelease ``-0``, so
+    ``^1.2.3`` doesn't match ``2.0.0-rc.1``.
+
+    :param expr: the range expression
+    :raises ValueError: if the expression is invalid
+
+    >>> from semver.range import VersionRange
+    >>> r = VersionRange.compile(">=1.0.0 <2.0.0 || ^3.1")
+    >>> r.contains("1.5.0"), r.contains("2.0.0"), r.contains("3.4.1")
+    (True, False, True)
+    >>> str(r)
+    '>=1.0.0 <2.0.0 || >=3.1.0 <4.0.0-0'
+    """
+
+    __slots__ = ("_expr", "_intervals", "_lowers")
+
+    def __init__(self, expr: str):
+        intervals: List[Interval] = []
+        for comparators in expr.split("||"):
+            intervals += self._parse_set(comparators, expr)
+        self._expr = expr
+        self._intervals = _normalize(intervals)
+        self._lowers = [lower for lower, _ in self._intervals]
+
+    @classmethod
+    def compile(cls: Type[T], expr: str) -> T:
+        """
+        Return the compiled range of an expression.
+
+        Ranges are cached in :data:`range_cache`, so compiling the same
+        expression again costs a single lookup.
+
+        :param expr: the range expression, see :class:`VersionRange`
+        :return: the compiled range
+        :raises ValueError: if the expression is invalid
+        """
+        key = (cls, expr)
+        version_range = range_cache.get(key)
+        if version_range is None:
+            version_range = cls(expr)
+            range_cache.put(key, version_range)
+        return version_range
+
+    @staticmethod
+    def _parse_set(comparators: str, expr: str) -> List[Interval]:
+        """Convert a set of comparators into the intervals of its intersection."""
+        match = _HYPHEN_RANGE.match(comparators)
+        if match:
+            lower = _parse_partial(match["lower"])
+            upper = _parse_partial(match["upper"])
+            if lower is None or upper is None:
+                raise ValueError(f"Invalid hyphen range {comparators!r} in {expr!r}")
+            return _normalize([(_lower(lower), _upper(upper))])
+
+        intervals = _ANY
+        for match in _COMPARATOR.finditer(comparators):
+            partial = _parse_partial(match["version"])
+            if partial is None:
+                raise ValueError(f"Invalid comparator {match[0].strip()!r} in {expr!r}")
+            intervals = _intersect(intervals, _comparator(match["op"], partial))
+        return intervals
+
+    @property
+    def expr(self) -> str:
+        """The expression of the range (read-only)."""
+        return self._expr
+
+    def contains(self, version: Union[Version, String]) -> bool:
+        """
+        Check if a version is part of the range.
+
+        :param version: a version or version string
+        :return: True if the version satisfies the range, otherwise False
+        :raises ValueError: if version is an invalid version string
+
+        >>> VersionRange.compile("~1.4.0").contains("1.4.7")
+        True
+        """
+        return self._contains_point(_point(version))
+
+    def _contains_point(self, point: Bound) -> bool:
+        index = bisect_right(self._lowers, point) - 1
+        return index >= 0 and point <= self._intervals[index][1]
+
+    __contains__ = contains
+
+    def filter(self, versions: Iterable[V]) -> Iterator[V]:
+        """
+        Yield the versions which are part of the range.
+
+        :param versions: the versions or version strings
+        :return: an iterator over the satisfying items, unchanged
+
+        >>> list(VersionRange.compile("1.x").filter(["0.9.0", "1.2.0", "2.0.0"]))
+        ['1.2.0']
+        """
+        return (version for version in versions if self.contains(version))
+
+    def max_satisfying(self, versions: Iterable[V]) -> Optional[V]:
+        """
+        Return the highest version which is part of the range.
+
+        :param versions: the versions or version strings
+        :return: the first satisfying item with the highest precedence, or None
+            if no item satisfies the range
+
+        >>> VersionRange.compile("^1.2").max_satisfying(["1.2.0", "1.9.1", "2.0.0"])
+        '1.9.1'
+        """
+        best: Optional[V] = None
+        best_key = None
+        for version in versions:
+            parsed = version if isinstance(version, Version) else Version.parse(version)
+            if self.contains(parsed):
+                key = parsed.sort_key()
+                if best_key is None or key > best_key:
+                    best, best_key = version, key
+        return best
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, VersionRange):
+            return NotImplemented
+        return self._intervals == other._intervals
+
+    def __hash__(self) -> int:
+        return hash(tuple(self._intervals))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._expr!r})"
+
+    def __str__(self) -> str:
+        """Return the normalized expression of the range."""
+        if not self._intervals:
+            # Nothing is lower than the lowest version, so this can't match
+            # anything, and it compiles back to no intervals
+            return "<0.0.0-0 >0.0.0-0"
+        sets = []
+        for lower, upper in self._intervals:
+            if lower[0] == upper[0]:
+                sets.append("=" + _format_bound(lower))
+                continue
+            comparators = []
+            if lower != _MIN:
+                op = ">=" if lower[1] == _INCLUSIVE_LOWER else ">"
+                comparators.append(op + _format_bound(lower))
+            if upper != _MAX:
+                op = "<=" if upper[1] == _INCLUSIVE_UPPER else "<"
+                comparators.append(op + _format_bound(upper))
+            sets.append(" ".join(comparators) or "*")
+        return " || ".join(sets)
+
+
+class _Node:
+    """
+    A node of the centered interval tree of :class:`ConstraintIndex`.
+
+    The tree stores intervals as ``(lower, upper, ident)`` tuples, where the
+    bounds are replaced by even ranks among all bounds of the tree. A
+    version gets the odd rank between its neighboring bounds, so it never
+    falls onto a bound and ranks compare like the bounds.
+    """
+
+    __slots__ = ("by_lower", "by_upper", "center", "left", "right")
+
+    def __init__(self, entries: List[Tuple[int, int, int]]):
+        bounds = sorted(bound for entry in entries for bound in entry[:2])
+        self.center = center = bounds[len(bounds) // 2]
+        left, right, overlapping = [], [], []
+        for entry in entries:
+            if entry[1] < center:
+                left.append(entry)
+            elif entry[0] > center:
+                right.append(entry)
+            else:
+                overlapping.append(entry)
+        self.by_lower = sorted((lower, ident) for lower, _, ident in overlapping)
+        self.by_upper = sorted(
+            ((upper, ident) for _, upper, ident in overlapping), reverse=True
+        )
+        self.left = _Node(left) if left else None
+        self.right = _Node(right) if right else None
+
+
+class ConstraintIndex(MutableMapping):
+    """
+    A mapping of keys to version ranges which finds all ranges containing a
+    version.
+
+    .. versionadded:: 3.1.0
+
+    The intervals of all ranges are kept in a centered interval tree, so
+    :meth:`query` takes O(log n + k) for n ranges and k results instead of
+    checking every range. Ranges which were added after the tree was built
+    are checked one by one, and removed ranges are skipped until the tree is
+    rebuilt. The tree is rebuilt by the next :meth:`query` once there are
+    too many of either, so adding many ranges at once costs a single
+    rebuild.
+
+    Like a :class:`dict`, adding a range for an existing key replaces it.
+
+    :param constraints: a mapping or an iterable of key and range pairs;
+        ranges are :class:`VersionRange` instances or expressions
+
+    >>> index = ConstraintIndex({"app": "^1.2", "cli": ">=1.4 <1.6", "lib": "2.x"})
+    >>> sorted(index.query("1.5.0"))
+    ['app', 'cli']
+    >>> index.remove("app")
+    >>> index.add("tool", "~1.5")
+    >>> sorted(index.query("1.5.0"))
+    ['cli', 'tool']
+    """
+
+    def __init__(
+        self,
+        constraints: Union[
+            Mapping[Hashable, Union[VersionRange, str]],
+            Iterable[Tuple[Hashable, Union[VersionRange, str]]],
+        ] = (),
+    ):
+        self._ids: Dict[Hashable, int] = {}
+        self._entries: Dict[int, Tuple[Hashable, VersionRange]] = {}
+        self._counter = count()
+        self._tree: Optional[_Node] = None
+        self._bounds: List[Bound] = []
+        # Ids below the watermark are part of the tree
+        self._watermark = 0
+        self._indexed = self._removed = 0
+        self._pending: List[int] = []
+        self.update(constraints)
+
+    def add(self, key: Hashable, constraint: Union[VersionRange, str]) -> None:
+        """
+        Add or replace the range of a key.
+
+        :param key: the key, for example the name of a dependent package
+        :param constraint: a :class:`VersionRange` or a range expression
+        :raises ValueError: if the expression is invalid
+        :raises TypeError: if constraint has an unsupported type
+        """
+        if isinstance(constraint, str):
+            constraint = VersionRange.compile(constraint)
+        elif not isinstance(constraint, VersionRange):
+            raise TypeError(
+                f"Expected str or VersionRange instance, but got {type(constraint)}"
+            )
+        if key in self._ids:
+            self.remove(key)
+        ident = next(self._counter)
+        self._ids[key] = ident
+        self._entries[ident] = key, constraint
+        self._pending.append(ident)
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Remove the range of a key.
+
+        :param key: the key
+        :raises KeyError: if there is no range for key
+        """
+        ident = self._ids.pop(key)
+        del self._entries[ident]
+        if ident < self._watermark:
+            self._removed += 1
+
+    __setitem__ = add
+    __delitem__ = remove
+
+    def __getitem__(self, key: Hashable) -> VersionRange:
+        return self._entries[self._ids[key]][1]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __repr__(self) -> str:
+        constraints = ", ".join(f"{key!r}: {r.expr!r}" for key, r in self.items())
+        return f"{type(self).__name__}({{{constraints}}})"
+
+    def _rebuild(self) -> None:
+        """Build the tree from all current ranges."""
+        intervals = [
+            (lower, upper, ident)
+            for ident, (_, version_range) in self._entries.items()
+            for lower, upper in version_range._intervals
+        ]
+        self._bounds = sorted({bound for i in intervals for bound in i[:2]})
+        ranks = {bound: 2 * pos for pos, bound in enumerate(self._bounds)}
+        entries = [
+            (ranks[lower], ranks[upper], ident)
+            for lower, upper, ident in intervals
+        ]
+        self._tree = _Node(entries) if entries else None
+        self._watermark = next(self._counter)
+        self._indexed = len(self._entries)
+        self._removed = 0
+        self._pending = []
+
+    def query(self, version: Union[Version, String]) -> List[Hashable]:
+        """
+        Find the keys of all ranges which contain a version.
+
+        :param version: a version or version string
+        :return: the keys in no particular order
+        :raises ValueError: if version is an invalid version string
+        """
+        point = _point(version)
+        if (
+            len(self._pending) > 32 + self._indexed // 8
+            or self._removed > self._indexed // 2
+        ):
+            self._rebuild()
+
+        found = []
+        rank = 2 * bisect_right(self._bounds, point) - 1
+        node = self._tree
+        while node is not None:
+            if rank < node.center:
+                for lower, ident in node.by_lower:
+                    if lower > rank:
+                        break
+                    found.append(ident)
+                node = node.left
+            else:
+                for upper, ident in node.by_upper:
+                    if upper < rank:
+                        break
+                    found.append(ident)
+                node = node.right
+
+        entries = self._entries
+        keys = [entries[ident][0] for ident in found if ident in entries]
+        for ident in self._pending:
+            entry = entries.get(ident)
+            if entry is not None and entry[1]._contains_point(point):
+                keys.append(entry[0])
+        return keys
@@ -0,0 +1,198 @@
+"""
+Answer :command:`pysemver` commands from a long running process.
+
+The server listens on a local Unix socket. Each connection sends one JSON
+object per line and gets one JSON object per line back, in the same order.
+As the interpreter stays warm and keeps its parse cache, a request costs much
+less than starting a new :command:`pysemver` process.
+
+A request names the command in ``cmd`` and passes its arguments, see
+:data:`COMMANDS`::
+
+    {"cmd": "compare", "a": "1.2.3", "b": "2.0.0"}
+
+A response contains either the ``result`` or an ``error`` message. An ``id``
+of the request is copied into the response::
+
+    {"result": "-1"}
+"""
+
+import argparse
+import json
+import socket
+import socketserver
+import stat
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .cli import cmd_bump, cmd_check, cmd_compare, cmd_nextver
+from .version import parse_cache
+
+#: The commands of the server, with their function and the JSON fields which
+#: are passed as arguments to the function
+COMMANDS: Dict[str, Tuple[Callable[[argparse.Namespace], Any], Dict[str, str]]] = {
+    "bump": (cmd_bump, {"part": "bump", "version": "version"}),
+    "check": (cmd_check, {"version": "version"}),
+    "compare": (cmd_compare, {"a": "version1", "b": "version2"}),
+    "nextver": (cmd_nextver, {"version": "version", "part": "part"}),
+}
+
+
+def to_request(args: argparse.Namespace) -> Optional[Dict[str, Any]]:
+    """
+    Convert the parsed arguments of a command into a request.
+
+    :param args: The parsed arguments
+    :return: the request, or None if the server doesn't know the command
+    """
+    for cmd, (func, fields) in COMMANDS.items():
+        if args.func is func:
+            request = {"cmd": cmd}
+            request.update((field, getattr(args, arg)) for field, arg in fields.items())
+            return request
+    return None
+
+
+def handle(request: Any) -> Dict[str, Any]:
+    """
+    Run the command of a single request.
+
+    :param request: the decoded JSON request
+    :return: the response with the result or an error message
+    """
+    if not isinstance(request, dict):
+        return {"error": "Request must be a JSON object"}
+
+    response: Dict[str, Any] = {}
+    if "id" in request:
+        response["id"] = request["id"]
+
+    command = COMMANDS.get(request.get("cmd"))  # type: ignore[arg-type]
+    if command is None:
+        response["error"] = f"Unknown command {request.get('cmd')!r}"
+        return response
+
+    func, fields = command
+    missing = [field for field in fields if not isinstance(request.get(field), str)]
+    if missing:
+        response["error"] = f"Expected string field(s): {', '.join(missing)}"
+        return response
+
+    args = argparse.Namespace(**{arg: request[field] for field, arg in fields.items()})
+    try:
+        response["result"] = func(args)
+    except KeyError as err:
+        response["error"] = f"Invalid argument {err}"
+    except (ValueError, TypeError) as err:
+        response["error"] = str(err)
+    return response
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Answer the requests of a single connection, line by line."""
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as err:
+                response: Dict[str, Any] = {"error": f"Invalid JSON: {err}"}
+            else:
+                response = handle(request)
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+def _connect(path: str, timeout: Optional[float] = None) -> socket.socket:
+    """
+    Connect to the Unix socket at path.
+
+    :raises OSError: if nobody listens on path, or the platform has no Unix
+        sockets
+    """
+    family = getattr(socket, "AF_UNIX", None)
+    if family is None:
+        raise OSError("Unix sockets are not supported on this platform")
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        # With a timeout, connect fails with EAGAIN instead of waiting while
+        # the backlog of the server is full, so set it afterwards
+        sock.connect(path)
+        sock.settimeout(timeout)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def create_server(path: str) -> socketserver.BaseServer:
+    """
+    Create a server which listens on a Unix socket.
+
+    Every connection is handled in its own thread. A stale socket file which
+    is left over from a previous server is removed.
+
+    :param path: the path of the socket
+    :return: the server, call its ``serve_forever`` method to answer requests
+    :raises ValueError: if another server listens on path, or if path is not
+        a socket
+    """
+    if Path(path).exists():
+        if not stat.S_ISSOCK(Path(path).stat().st_mode):
+            raise ValueError(f"{path} exists and is not a socket")
+        try:
+            _connect(path).close()
+        except OSError:
+            Path(path).unlink()
+        else:
+            raise ValueError(f"A server is already listening on {path}")
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+        request_queue_size = socket.SOMAXCONN
+
+    return Server(path, _Handler)
+
+
+def serve(path: str, cache_size: int = 4096) -> None:
+    """
+    Answer requests on a Unix socket until the process is interrupted.
+
+    .. versionadded:: 3.1.0
+
+    :param path: the path of the socket, it's removed when the server stops
+    :param cache_size: the size of the parse cache, see
+        :data:`semver.version.parse_cache`
+    """
+    if cache_size > parse_cache.maxsize:
+        parse_cache.resize(cache_size)
+    server = create_server(path)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        Path(path).unlink()
+
+
+def send(path: str, request: Dict[str, Any], timeout: float = 10.0) -> Dict[str, Any]:
+    """
+    Send a single request to a server and wait for the response.
+
+    .. versionadded:: 3.1.0
+
+    :param path: the path of the socket
+    :param request: the request
+    :param timeout: the timeout in seconds for the response
+    :return: the response
+    :raises OSError: if the server is not running or doesn't answer
+    """
+    with _connect(path, timeout) as sock:
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    if not line:
+        raise ConnectionError(f"The server on {path} closed the connection")
+    return json.loads(line)
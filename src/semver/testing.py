@@ -0,0 +1,257 @@
+"""
+Generate synthetic corpora of version strings for benchmarks and fuzzers.
+
+The corpora are reproducible: the same arguments always generate the same
+strings, in the same order. They are generated one by one, so even millions
+of strings are never stored. From the command line, write a corpus with one
+version per line::
+
+    python -m semver.testing -n 1000000 --profile mixed --seed 42 > versions.txt
+"""
+
+import random
+import sys
+from itertools import count, islice
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class Profile(NamedTuple):
+    """The fractions of the different kinds of versions in a corpus."""
+
+    #: Fraction of versions with a prerelease
+    prerelease: float
+    #: Fraction of versions with build metadata
+    build: float
+    #: Fraction of invalid version strings
+    invalid: float
+
+
+#: The profiles of :func:`generate_corpus`
+PROFILES: Dict[str, Profile] = {
+    "release": Profile(prerelease=0.0, build=0.0, invalid=0.0),
+    "prerelease": Profile(prerelease=1.0, build=0.0, invalid=0.0),
+    "build": Profile(prerelease=0.3, build=1.0, invalid=0.0),
+    "mixed": Profile(prerelease=0.3, build=0.15, invalid=0.05),
+    "invalid": Profile(prerelease=0.3, build=0.15, invalid=1.0),
+}
+
+_LABELS = ("alpha", "beta", "rc", "dev", "pre", "preview", "snapshot", "x", "z")
+_BUILD_LABELS = ("build", "sha", "exp", "ci", "date", "linux", "x86-64")
+
+
+def _number(rng: random.Random, scale: float) -> int:
+    """Return a small number most of the time, but sometimes a large one."""
+    return int(rng.expovariate(1 / scale))
+
+
+def _core(rng: random.Random) -> str:
+    return f"{_number(rng, 2)}.{_number(rng, 6)}.{_number(rng, 4)}"
+
+
+def _prerelease(rng: random.Random) -> str:
+    """Return a prerelease like ``alpha.1``, ``rc.12``, or ``0.3.7.x.7.z.92``."""
+    if rng.random() < 0.1:
+        # Long chains of mostly numeric identifiers
+        return ".".join(
+            rng.choice(_LABELS[-2:]) if rng.random() < 0.2 else str(_number(rng, 20))
+            for _ in range(rng.randrange(2, 9))
+        )
+    identifiers = [rng.choice(_LABELS)]
+    for _ in range(rng.randrange(3)):
+        identifiers.append(str(_number(rng, 8)))
+    return ".".join(identifiers)
+
+
+def _build(rng: random.Random) -> str:
+    identifiers = []
+    for _ in range(rng.randrange(1, 5)):
+        label = rng.choice(_BUILD_LABELS)
+        if label == "sha":
+            identifiers += [label, f"{rng.getrandbits(28):07x}"]
+        else:
+            identifiers += [label, str(_number(rng, 500))]
+    return ".".join(identifiers)
+
+
+def _version(rng: random.Random, profile: Profile) -> str:
+    version = _core(rng)
+    if rng.random() < profile.prerelease:
+        version += "-" + _prerelease(rng)
+    if rng.random() < profile.build:
+        version += "+" + _build(rng)
+    return version
+
+
+def _split(version: str) -> Tuple[str, str, str]:
+    """Split a valid version into its core, ``-prerelease``, and ``+build``."""
+    version, plus, build = version.partition("+")
+    core, minus, prerelease = version.partition("-")
+    return core, minus + prerelease, plus + build
+
+
+def _replace_core(version: str, index: int, part: str) -> str:
+    core, prerelease, build = _split(version)
+    parts = core.split(".")
+    parts[index] = part
+    return ".".join(parts) + prerelease + build
+
+
+def _leading_zero(index: int) -> Callable[[random.Random, str], str]:
+    def mutate(rng: random.Random, version: str) -> str:
+        part = version.split(".")[index].partition("-")[0].partition("+")[0]
+        return _replace_core(version, index, "0" + str(int(part) + 1))
+
+    return mutate
+
+
+def _not_a_number(index: int) -> Callable[[random.Random, str], str]:
+    def mutate(rng: random.Random, version: str) -> str:
+        return _replace_core(version, index, rng.choice(["", "x", "1a", "-1"]))
+
+    return mutate
+
+
+def _missing_patch(rng: random.Random, version: str) -> str:
+    core, prerelease, build = _split(version)
+    return core.rsplit(".", 1)[0] + prerelease + build
+
+
+def _extra_part(rng: random.Random, version: str) -> str:
+    core, prerelease, build = _split(version)
+    return f"{core}.{_number(rng, 4)}{prerelease}{build}"
+
+
+def _bad_prerelease(rng: random.Random, version: str) -> str:
+    core, _, build = _split(version)
+    prerelease = rng.choice(["", "rc..1", ".rc", "rc.", "01", "rc.007", "rc_1"])
+    return f"{core}-{prerelease}{build}"
+
+
+def _bad_build(rng: random.Random, version: str) -> str:
+    core, prerelease, _ = _split(version)
+    build = rng.choice(["", "b..1", ".b", "b.", "b_1", "b@1", "b+1"])
+    return f"{core}{prerelease}+{build}"
+
+
+def _garbage(rng: random.Random, version: str) -> str:
+    prefix, suffix = rng.choice([("v", ""), ("=", ""), (" ", ""), ("", " ")])
+    return prefix + version + suffix
+
+
+#: The ways to turn a valid version into an invalid one, by the part of the
+#: grammar they violate
+INVALID_KINDS: Dict[str, Callable[[random.Random, str], str]] = {
+    "major_leading_zero": _leading_zero(0),
+    "minor_leading_zero": _leading_zero(1),
+    "patch_leading_zero": _leading_zero(2),
+    "major_not_a_number": _not_a_number(0),
+    "minor_not_a_number": _not_a_number(1),
+    "patch_not_a_number": _not_a_number(2),
+    "missing_patch": _missing_patch,
+    "extra_part": _extra_part,
+    "prerelease": _bad_prerelease,
+    "build": _bad_build,
+    "garbage": _garbage,
+}
+
+
+def generate_corpus(
+    n: Optional[int] = None,
+    profile: str = "mixed",
+    *,
+    seed: int = 0,
+    invalid: Optional[float] = None,
+) -> Iterator[str]:
+    """
+    Generate a reproducible corpus of version strings.
+
+    .. versionadded:: 3.1.0
+
+    Major, minor, and patch parts are mostly small numbers. Prereleases look
+    like ``alpha.1``, ``rc.12``, or ``0.3.7.x.7.z.92``, build metadata like
+    ``build.42.sha.1a2b3c4``. Invalid strings are valid versions with a
+    single defect, each one violating another part of the grammar, see
+    :data:`INVALID_KINDS`.
+
+    :param n: the number of versions, or None for an endless corpus
+    :param profile: the name of a profile in :data:`PROFILES`, which sets the
+        fractions of prereleases, builds, and invalid strings
+    :param seed: the seed of the random generator
+    :param invalid: the fraction of invalid strings, instead of the one of
+        the profile
+    :return: an iterator over the version strings
+    :raises ValueError: if the profile is unknown, or if invalid is not
+        between 0 and 1
+
+    >>> list(semver.testing.generate_corpus(3, "prerelease", seed=1))
+    ['0.11.5-x.8', '0.10.2-32.2.0.0.23', '1.8.11-dev.24']
+    """
+    if profile not in PROFILES:
+        raise ValueError(
+            f"Unknown profile {profile!r}, expected one of {', '.join(PROFILES)}"
+        )
+    fractions = PROFILES[profile]
+    if invalid is not None:
+        if not 0 <= invalid <= 1:
+            raise ValueError(f"invalid must be between 0 and 1, but is {invalid}")
+        fractions = fractions._replace(invalid=invalid)
+
+    return _generate(n, fractions, random.Random(seed))
+
+
+def _generate(
+    n: Optional[int], profile: Profile, rng: random.Random
+) -> Iterator[str]:
+    mutations = list(INVALID_KINDS.values())
+    for _ in range(n) if n is not None else count():
+        version = _version(rng, profile)
+        if rng.random() < profile.invalid:
+            version = rng.choice(mutations)(rng, version)
+        yield version
+
+
+def main(cliargs: Optional[List[str]] = None) -> int:
+    """
+    Write a corpus to stdout, one version per line.
+
+    :param cliargs: Arguments to parse or None (=use :class:`sys.argv`)
+    :return: error code
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m semver.testing",
+        description="Generate a reproducible corpus of version strings.",
+    )
+    parser.add_argument(
+        "-n", type=int, default=None, help="Number of versions (default: endless)"
+    )
+    parser.add_argument(
+        "--profile", choices=PROFILES, default="mixed", help="(default: mixed)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="(default: 0)")
+    parser.add_argument(
+        "--invalid", type=float, help="Fraction of invalid versions, from 0 to 1"
+    )
+    args = parser.parse_args(cliargs)
+
+    try:
+        corpus = generate_corpus(
+            args.n, args.profile, seed=args.seed, invalid=args.invalid
+        )
+        while True:
+            chunk = list(islice(corpus, 4096))
+            if not chunk:
+                return 0
+            sys.stdout.write("\n".join(chunk) + "\n")
+    except ValueError as err:
+        print("ERROR", err, file=sys.stderr)
+        return 2
+    except BrokenPipeError:  # pragma: no cover
+        # The reader stopped, like "head -n 10"
+        sys.stderr.close()
+        return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
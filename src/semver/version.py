@@ -1,12 +1,13 @@
 """Version handling by a semver compatible version class."""
 
-import re
 from functools import wraps
 from typing import (
     Any,
     ClassVar,
     Dict,
     Iterable,
+    List,
+    NamedTuple,
     Optional,
     Pattern,
     SupportsInt,
@@ -19,11 +20,14 @@ from typing import (
     TypeVar,
 )
 
+from ._cache import LRUCache
+from ._parser import is_valid, scan
 from ._types import (
     VersionTuple,
     VersionDict,
     VersionIterator,
     String,
+    SortKey,
     VersionPart,
 )
 
@@ -34,21 +38,154 @@ Comparator = Callable[["Version", Comparable], bool]
 T = TypeVar("T", bound="Version")
 T_cmp = TypeVar("T_cmp", tuple, str, int)
 
+#: Cache for :meth:`Version.parse`, disabled by default.
+#: Enable it with ``parse_cache.resize(maxsize)``.
+parse_cache = LRUCache()
+
+#: Cache for the match expressions of :meth:`Version.match` and
+#: :func:`compile_match`, compiled into the operator results and the version
+match_cache = LRUCache(maxsize=512)
+
+#: Cache for the versions which strings are converted into when they are
+#: compared with a :class:`Version`, like ``version > "1.0.0"``
+coerce_cache = LRUCache(maxsize=512)
+
+
+class _LazyPattern:
+    """
+    A regular expression which is compiled when it's used for the first time.
+
+    As a class attribute, it returns the compiled pattern. This keeps
+    :mod:`re` and the compilation of large patterns out of the import.
+    """
+
+    def __init__(self, pattern: str, verbose: bool = False):
+        self.pattern = pattern
+        self.verbose = verbose
+        self._compiled: Optional[Pattern[str]] = None
+
+    def __get__(self, instance: Any, owner: Any = None) -> Pattern[str]:
+        if self._compiled is None:
+            import re
+
+            self._compiled = re.compile(
+                self.pattern, re.VERBOSE if self.verbose else 0
+            )
+        return self._compiled
+
+
+class ParseError(NamedTuple):
+    """An invalid item found by :meth:`Version.parse_many`."""
+
+    #: Position of the item in the input
+    index: int  # type: ignore[assignment]
+    #: The item itself
+    input: Any
+    #: Why the item couldn't be parsed
+    reason: str
+
+
+class ParseResult(NamedTuple):
+    """The result of :meth:`Version.parse_many`."""
+
+    #: The parsed versions in the order of the input
+    versions: List["Version"]
+    #: The invalid items, only filled with ``on_error="collect"``
+    errors: List[ParseError]
+
+
+#: Number of bits for each of the major, minor, and patch parts in
+#: :meth:`Version.to_int`
+PACKED_BITS = 21
+#: Every part packed by :meth:`Version.to_int` has to be smaller than this
+PACKED_LIMIT = 1 << PACKED_BITS
+
+
+def _pack(major: int, minor: int, patch: int) -> Optional[int]:
+    """Pack the parts of a release into an int, None if a part is too big."""
+    if major < PACKED_LIMIT and minor < PACKED_LIMIT and patch < PACKED_LIMIT:
+        return (major << (2 * PACKED_BITS)) | (minor << PACKED_BITS) | patch
+    return None
+
+
+# Markers of Version.to_sortable_bytes; each one sorts below the next
+_BYTES_END = 0x00
+_BYTES_PRERELEASE = _BYTES_NUMERIC = 0x01
+_BYTES_RELEASE = _BYTES_ALPHA = 0x02
+_BYTES_BUILD = ord("+")
+
+
+def _encode_int(value: int) -> bytes:
+    """Encode a non-negative int as its byte length and big-endian bytes."""
+    size = (value.bit_length() + 7) // 8
+    if size > 0xFF:
+        raise ValueError(f"{value} is too big to be encoded")
+    return bytes((size,)) + value.to_bytes(size, "big")
+
+
+def _decode_int(data: bytes, pos: int) -> Tuple[int, int]:
+    """Decode an int encoded by :func:`_encode_int` at pos."""
+    end = pos + 1 + data[pos]
+    if end > len(data):
+        raise ValueError("truncated integer")
+    return int.from_bytes(data[pos + 1 : end], "big"), end
+
+
+#: The results of :meth:`Version.compare` which satisfy each match operator
+_MATCH_RESULTS: Dict[str, Tuple[int, ...]] = {
+    ">": (1,),
+    "<": (-1,),
+    "==": (0,),
+    "!=": (-1, 1),
+    ">=": (0, 1),
+    "<=": (-1, 0),
+}
+
+
+def _split_match_expr(match_expr: str) -> Tuple[str, str]:
+    """
+    Split a match expression into its operator and version string.
+
+    See :meth:`Version.match` for the syntax.
+
+    :param match_expr: optional operator and version
+    :return: a tuple of the operator and the version string
+    :raises ValueError: if the operator is unknown
+    """
+    prefix = match_expr[:2]
+    if prefix in (">=", "<=", "==", "!="):
+        return prefix, match_expr[2:]
+    if prefix and prefix[0] in (">", "<"):
+        return prefix[0], match_expr[1:]
+    if match_expr and match_expr[0] in "0123456789":
+        return "==", match_expr
+    raise ValueError(
+        "match_expr parameter should be in format <op><ver>, "
+        "where <op> is one of "
+        "['<', '>', '==', '<=', '>=', '!=']. "
+        "You provided: %r" % match_expr
+    )
+
+
+#: Types which are converted into a Version before comparing
+_COMPARABLE_TYPES = (dict, tuple, list, *String.__args__)  # type: ignore
+
 
 def _comparator(operator: Comparator) -> Comparator:
-    """Wrap a Version binary op method in a type-check."""
+    """
+    Wrap a Version binary op method in a type-check.
+
+    If other is an instance of the class of self, the operator is called
+    right away. Comparable types are converted with :meth:`Version._coerce`
+    first, all other types return :data:`NotImplemented`.
+    """
 
     @wraps(operator)
     def wrapper(self: "Version", other: Comparable) -> bool:
-        comparable_types = (
-            type(self),
-            dict,
-            tuple,
-            list,
-            *String.__args__,  # type: ignore
-        )
-        if not isinstance(other, comparable_types):
-            return NotImplemented
+        if not isinstance(other, type(self)):
+            if not isinstance(other, _COMPARABLE_TYPES):
+                return NotImplemented
+            other = self._coerce(other)
         return operator(self, other)
 
     return wrapper
@@ -59,6 +196,30 @@ def _cmp(a: T_cmp, b: T_cmp) -> int:
     return (a > b) - (a < b)
 
 
+#: Sort key for the prerelease part of a version without prerelease.
+#: It is greater than the key of every prerelease, which all start with 0.
+_RELEASE_KEY = (1,)
+
+
+def _sort_key(
+    major: int, minor: int, patch: int, prerelease: Optional[str]
+) -> SortKey:
+    """
+    Build the sort key of a version from its parts.
+
+    See :meth:`Version.sort_key` for details.
+    """
+    if not prerelease:
+        return (major, minor, patch, _RELEASE_KEY)
+    tokens = [(0, int(x)) if x.isdigit() else (1, x) for x in prerelease.split(".")]
+    return (major, minor, patch, (0, *tokens))
+
+
+#: The slots which are not pickled: the lazily computed caches of
+#: :class:`Version`, and the ones which Python adds for subclasses
+_CACHED_SLOTS = frozenset({"_sort_key", "_hash", "_str", "__dict__", "__weakref__"})
+
+
 class Version:
     """
     A semver compatible version class.
@@ -72,13 +233,21 @@ class Version:
     :param build: an optional build string
     """
 
-    __slots__ = ("_major", "_minor", "_patch", "_prerelease", "_build")
+    __slots__ = (
+        "_major",
+        "_minor",
+        "_patch",
+        "_prerelease",
+        "_build",
+        # Lazily computed caches, see sort_key(), __hash__(), and __str__()
+        "_sort_key",
+        "_hash",
+        "_str",
+    )
 
     #: The names of the different parts of a version
-    NAMES: ClassVar[Tuple[str, ...]] = tuple([item[1:] for item in __slots__])
+    NAMES: ClassVar[Tuple[str, ...]] = tuple([item[1:] for item in __slots__[:5]])
 
-    #: Regex for number in a prerelease
-    _LAST_NUMBER: ClassVar[Pattern[str]] = re.compile(r"(?:[^\d]*(\d+)[^\d]*)+")
     #: Regex template for a semver version
     _REGEX_TEMPLATE: ClassVar[
         str
@@ -104,15 +273,30 @@ class Version:
             $
         """
     #: Regex for a semver version
-    _REGEX: ClassVar[Pattern[str]] = re.compile(
+    _REGEX: ClassVar[Pattern[str]] = _LazyPattern(  # type: ignore[assignment]
         _REGEX_TEMPLATE.format(opt_patch="", opt_minor=""),
-        re.VERBOSE,
+        verbose=True,
     )
     #: Regex for a semver version that might be shorter
-    _REGEX_OPTIONAL_MINOR_AND_PATCH: ClassVar[Pattern[str]] = re.compile(
+    _REGEX_OPTIONAL_MINOR_AND_PATCH: ClassVar[
+        Pattern[str]
+    ] = _LazyPattern(  # type: ignore[assignment]
         _REGEX_TEMPLATE.format(opt_patch="?", opt_minor="?"),
-        re.VERBOSE,
+        verbose=True,
     )
+    #: Parse with the regexes instead of the faster scanner. Set automatically
+    #: for subclasses which customize one of the regexes above.
+    _PARSE_WITH_REGEX: ClassVar[bool] = False
+    #: Set automatically for subclasses which override :meth:`parse`.
+    #: Methods which take shortcuts around it call it instead.
+    _CUSTOM_PARSE: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "_REGEX" in vars(cls) or "_REGEX_OPTIONAL_MINOR_AND_PATCH" in vars(cls):
+            cls._PARSE_WITH_REGEX = True
+        if "parse" in vars(cls):
+            cls._CUSTOM_PARSE = True
 
     def __init__(
         self,
@@ -122,42 +306,21 @@ class Version:
         prerelease: Optional[Union[String, int]] = None,
         build: Optional[Union[String, int]] = None,
     ):
-        # Build a dictionary of the arguments except prerelease and build
-        version_parts = {"major": int(major), "minor": int(minor), "patch": int(patch)}
-
-        for name, value in version_parts.items():
-            if value < 0:
-                raise ValueError(
-                    "{!r} is negative. A version can only be positive.".format(name)
-                )
-
-        self._major = version_parts["major"]
-        self._minor = version_parts["minor"]
-        self._patch = version_parts["patch"]
+        major, minor, patch = int(major), int(minor), int(patch)
+        if major < 0 or minor < 0 or patch < 0:
+            name = "major" if major < 0 else "minor" if minor < 0 else "patch"
+            raise ValueError(
+                "{!r} is negative. A version can only be positive.".format(name)
+            )
+
+        self._major = major
+        self._minor = minor
+        self._patch = patch
         self._prerelease = None if prerelease is None else str(prerelease)
         self._build = None if build is None else str(build)
-
-    @classmethod
-    def _nat_cmp(cls, a: Optional[str], b: Optional[str]) -> int:
-        def cmp_prerelease_tag(a, b):
-            if isinstance(a, int) and isinstance(b, int):
-                return _cmp(a, b)
-            elif isinstance(a, int):
-                return -1
-            elif isinstance(b, int):
-                return 1
-            else:
-                return _cmp(a, b)
-
-        a_parts = [int(x) if x.isdigit() else x for x in (a or "").split(".")]
-        b_parts = [int(x) if x.isdigit() else x for x in (b or "").split(".")]
-
-        for sub_a, sub_b in zip(a_parts, b_parts):
-            cmp_result = cmp_prerelease_tag(sub_a, sub_b)
-            if cmp_result != 0:
-                return cmp_result
-
-        return _cmp(len(a_parts), len(b_parts))
+        self._sort_key: Optional[SortKey] = None
+        self._hash: Optional[int] = None
+        self._str: Optional[str] = None
 
     @property
     def major(self) -> int:
@@ -241,6 +404,201 @@ class Version:
             build=self.build,
         )
 
+    def sort_key(self) -> SortKey:
+        """
+        Return a key which orders versions by their precedence.
+
+        .. versionadded:: 3.1.0
+
+        The key is computed only once per instance. It is a tuple of the
+        major, minor, and patch parts followed by a tuple for the prerelease:
+
+        * A version without a prerelease gets ``(1,)``.
+        * A prerelease gets ``0`` followed by one ``(0, number)`` tuple for
+          each numeric identifier and one ``(1, string)`` tuple for each
+          alphanumeric identifier.
+
+        This way, a release has a higher precedence than its prereleases,
+        numeric identifiers have a lower precedence than alphanumeric ones, and
+        a larger set of identifiers has a higher precedence than a smaller
+        one. The build part is ignored. Two versions are equal if, and only if,
+        their keys are equal.
+
+        The method can be passed as ``key`` to functions like :func:`sorted`
+        or :func:`bisect.bisect`.
+
+        :return: the sort key
+
+        >>> semver.Version.parse("1.2.3-rc.1").sort_key()
+        (1, 2, 3, (0, (1, 'rc'), (0, 1)))
+        >>> versions = [Version.parse("1.0.0"), Version.parse("1.0.0-rc.1")]
+        >>> [str(v) for v in sorted(versions, key=Version.sort_key)]
+        ['1.0.0-rc.1', '1.0.0']
+        """
+        key = self._sort_key
+        if key is None:
+            key = self._sort_key = _sort_key(
+                self._major, self._minor, self._patch, self._prerelease
+            )
+        return key
+
+    def to_int(self) -> int:
+        """
+        Pack a release version into a single integer.
+
+        .. versionadded:: 3.1.0
+
+        Each of the major, minor, and patch parts gets
+        :data:`~semver.version.PACKED_BITS` (21) bits, so every part has to be
+        smaller than :data:`~semver.version.PACKED_LIMIT` (2097152). The result
+        fits into a signed 64-bit integer and packed integers have the same
+        order as their versions. Use :meth:`from_int` to get the version back.
+
+        :return: the packed version
+        :raises ValueError: if the version has a prerelease or build part,
+            or if a part is too big
+
+        >>> semver.Version(1, 2, 3).to_int()
+        4398050705411
+        """
+        if self._prerelease is not None or self._build is not None:
+            raise ValueError(
+                f"Only versions without prerelease and build can be packed: {self}"
+            )
+        value = _pack(self._major, self._minor, self._patch)
+        if value is None:
+            raise ValueError(
+                f"Parts of {self} must be smaller than {PACKED_LIMIT} to be packed"
+            )
+        return value
+
+    @classmethod
+    def from_int(cls: Type[T], value: int) -> T:
+        """
+        Unpack an integer created by :meth:`to_int`.
+
+        .. versionadded:: 3.1.0
+
+        :param value: the packed version
+        :return: a new :class:`Version` instance
+        :raises ValueError: if value is out of range
+
+        >>> semver.Version.from_int(4398050705411)
+        Version(major=1, minor=2, patch=3, prerelease=None, build=None)
+        """
+        if not 0 <= value < 1 << (3 * PACKED_BITS):
+            raise ValueError(f"{value} is not a packed version")
+        mask = PACKED_LIMIT - 1
+        return cls(
+            value >> (2 * PACKED_BITS), (value >> PACKED_BITS) & mask, value & mask
+        )
+
+    def to_sortable_bytes(self) -> bytes:
+        """
+        Encode the version into bytes which sort like the version.
+
+        .. versionadded:: 3.1.0
+
+        Comparing the encoded bytes gives the same order as comparing the
+        versions, so the bytes can be used as keys of databases and
+        key-value stores which sort their keys bytewise. The encoding is
+        built from :meth:`sort_key`:
+
+        * Each of major, minor, and patch is encoded as its length in bytes
+          followed by its big-endian bytes.
+        * A release gets ``0x02``. A prerelease gets ``0x01`` followed by
+          ``0x01`` and the encoded number for each numeric identifier, or
+          ``0x02``, the UTF-8 bytes, and ``0x00`` for each alphanumeric
+          identifier, and ends with ``0x00``.
+        * The build part, if there is any, is appended after a ``+``.
+
+        The build part doesn't affect the precedence of a version; it only
+        orders versions which are otherwise equal. Use
+        :meth:`from_sortable_bytes` to get the version back.
+
+        :return: the encoded version
+        :raises ValueError: if a part is too big or an identifier contains a
+            null character
+
+        >>> semver.Version.parse("1.2.3-rc.1").to_sortable_bytes()
+        b'\\x01\\x01\\x01\\x02\\x01\\x03\\x01\\x02rc\\x00\\x01\\x01\\x01\\x00'
+        >>> (semver.Version.parse("1.0.0-rc.1").to_sortable_bytes()
+        ...  < semver.Version.parse("1.0.0").to_sortable_bytes())
+        True
+        """
+        prerelease = self.sort_key()[3]
+        chunks = [
+            _encode_int(self._major),
+            _encode_int(self._minor),
+            _encode_int(self._patch),
+        ]
+        if prerelease == _RELEASE_KEY:
+            chunks.append(bytes((_BYTES_RELEASE,)))
+        else:
+            chunks.append(bytes((_BYTES_PRERELEASE,)))
+            for is_alpha, token in prerelease[1:]:
+                if not is_alpha:
+                    chunks.append(bytes((_BYTES_NUMERIC,)) + _encode_int(token))
+                    continue
+                encoded = token.encode("utf-8")
+                if b"\x00" in encoded:
+                    raise ValueError(
+                        f"Prerelease of {self!r} must not contain null characters"
+                    )
+                chunks.append(bytes((_BYTES_ALPHA,)) + encoded + b"\x00")
+            chunks.append(bytes((_BYTES_END,)))
+        if self._build is not None:
+            chunks.append(bytes((_BYTES_BUILD,)) + self._build.encode("utf-8"))
+        return b"".join(chunks)
+
+    @classmethod
+    def from_sortable_bytes(cls: Type[T], data: bytes) -> T:
+        """
+        Decode bytes created by :meth:`to_sortable_bytes`.
+
+        .. versionadded:: 3.1.0
+
+        :param data: the encoded version, any bytes-like object
+        :return: a new :class:`Version` instance
+        :raises ValueError: if data is not a valid encoding
+
+        >>> data = semver.Version.parse("1.2.3-rc.1+build.4").to_sortable_bytes()
+        >>> semver.Version.from_sortable_bytes(data)
+        Version(major=1, minor=2, patch=3, prerelease='rc.1', build='build.4')
+        """
+        data = bytes(data)
+        try:
+            major, pos = _decode_int(data, 0)
+            minor, pos = _decode_int(data, pos)
+            patch, pos = _decode_int(data, pos)
+            prerelease = None
+            marker, pos = data[pos], pos + 1
+            if marker == _BYTES_PRERELEASE:
+                identifiers = []
+                while data[pos] != _BYTES_END:
+                    marker, pos = data[pos], pos + 1
+                    if marker == _BYTES_NUMERIC:
+                        number, pos = _decode_int(data, pos)
+                        identifiers.append(str(number))
+                    elif marker == _BYTES_ALPHA:
+                        end = data.index(b"\x00", pos)
+                        identifiers.append(data[pos:end].decode("utf-8"))
+                        pos = end + 1
+                    else:
+                        raise ValueError(f"unknown marker {marker}")
+                prerelease = ".".join(identifiers)
+                pos += 1
+            elif marker != _BYTES_RELEASE:
+                raise ValueError(f"unknown marker {marker}")
+            build = None
+            if pos < len(data):
+                if data[pos] != _BYTES_BUILD:
+                    raise ValueError("trailing bytes")
+                build = data[pos + 1 :].decode("utf-8")
+        except (IndexError, ValueError) as err:
+            raise ValueError(f"{data!r} is not a sortable version encoding") from err
+        return cls(major, minor, patch, prerelease, build)
+
     def __iter__(self) -> VersionIterator:
         """Return iter(self)."""
         yield from self.to_tuple()
@@ -250,18 +608,27 @@ class Version:
         """
         Look for the last sequence of number(s) in a string and increment.
 
+        Leading zeros are kept as long as the number fits, like in
+        ``"build.009"`` to ``"build.010"``. The string is scanned from its
+        end, so the time is linear in its length.
+
         :param string: the string to search for.
-        :return: the incremented string
+        :return: the incremented string, or the string itself if it
+            contains no number
 
         Source:
         http://code.activestate.com/recipes/442460-increment-numbers-in-a-string/#c1
         """
-        match = Version._LAST_NUMBER.search(string)
-        if match:
-            next_ = str(int(match.group(1)) + 1)
-            start, end = match.span(1)
-            string = string[: max(end - len(next_), start)] + next_ + string[end:]
-        return string
+        end = len(string)
+        while end and not string[end - 1].isdecimal():
+            end -= 1
+        start = end
+        while start and string[start - 1].isdecimal():
+            start -= 1
+        if start == end:
+            return string
+        next_ = str(int(string[start:end]) + 1)
+        return string[: max(end - len(next_), start)] + next_ + string[end:]
 
     def bump_major(self) -> "Version":
         """
@@ -389,36 +756,42 @@ build='build.10')
         >>> Version.parse("2.0.0").compare("2.0.0")
         0
         """
-        cls = type(self)
-        if isinstance(other, String.__args__):  # type: ignore
-            other = cls.parse(other)
-        elif isinstance(other, dict):
-            other = cls(**other)
-        elif isinstance(other, (tuple, list)):
-            other = cls(*other)
-        elif not isinstance(other, cls):
-            raise TypeError(
-                f"Expected str, bytes, dict, tuple, list, or {cls.__name__} instance, "
-                f"but got {type(other)}"
-            )
-
-        v1 = self.to_tuple()[:3]
-        v2 = other.to_tuple()[:3]
-        x = _cmp(v1, v2)
-        if x:
-            return x
+        return _cmp(self.sort_key(), self._coerce(other).sort_key())
 
-        rc1, rc2 = self.prerelease, other.prerelease
-        rccmp = self._nat_cmp(rc1, rc2)
+    def _coerce(self, other: Comparable, cached: bool = True) -> "Version":
+        """
+        Convert other into an instance of the class of self.
 
-        if not rccmp:
-            return 0
-        if not rc1:
-            return 1
-        elif not rc2:
-            return -1
+        Strings are parsed only once and cached in
+        :data:`semver.version.coerce_cache`, as they are mostly constants
+        like in ``version > "1.0.0"``.
 
-        return rccmp
+        :param other: a version string, dict, tuple, list, or instance
+        :param cached: False for strings which are rarely the same, a cache
+            miss costs about half as much as parsing
+        :return: other as an instance of the class of self
+        :raises TypeError: if other has an unsupported type
+        """
+        cls = type(self)
+        if isinstance(other, cls):
+            return other
+        if isinstance(other, String.__args__):  # type: ignore
+            if not cached or not coerce_cache.maxsize:
+                return cls.parse(other)
+            key = (cls, other)
+            version = coerce_cache.get(key)
+            if version is None:
+                version = cls.parse(other)
+                coerce_cache.put(key, version)
+            return version
+        if isinstance(other, dict):
+            return cls(**other)
+        if isinstance(other, (tuple, list)):
+            return cls(*other)
+        raise TypeError(
+            f"Expected str, bytes, dict, tuple, list, or {cls.__name__} instance, "
+            f"but got {type(other)}"
+        )
 
     def next_version(self, part: str, prerelease_token: str = "rc") -> "Version":
         """
@@ -464,27 +837,27 @@ build='build.10')
 
     @_comparator
     def __eq__(self, other: Comparable) -> bool:  # type: ignore
-        return self.compare(other) == 0
+        return self.sort_key() == other.sort_key()  # type: ignore
 
     @_comparator
     def __ne__(self, other: Comparable) -> bool:  # type: ignore
-        return self.compare(other) != 0
+        return self.sort_key() != other.sort_key()  # type: ignore
 
     @_comparator
     def __lt__(self, other: Comparable) -> bool:
-        return self.compare(other) < 0
+        return self.sort_key() < other.sort_key()  # type: ignore
 
     @_comparator
     def __le__(self, other: Comparable) -> bool:
-        return self.compare(other) <= 0
+        return self.sort_key() <= other.sort_key()  # type: ignore
 
     @_comparator
     def __gt__(self, other: Comparable) -> bool:
-        return self.compare(other) > 0
+        return self.sort_key() > other.sort_key()  # type: ignore
 
     @_comparator
     def __ge__(self, other: Comparable) -> bool:
-        return self.compare(other) >= 0
+        return self.sort_key() >= other.sort_key()  # type: ignore
 
     def __getitem__(
         self, index: Union[int, slice]
@@ -527,19 +900,40 @@ build='build.10')
         return part
 
     def __repr__(self) -> str:
-        s = ", ".join("%s=%r" % (key, val) for key, val in self.to_dict().items())
-        return "%s(%s)" % (type(self).__name__, s)
+        s = ", ".join(f"{key}={val!r}" for key, val in self.to_dict().items())
+        return f"{type(self).__name__}({s})"
 
     def __str__(self) -> str:
-        version = "%d.%d.%d" % (self.major, self.minor, self.patch)
-        if self.prerelease:
-            version += "-%s" % self.prerelease
-        if self.build:
-            version += "+%s" % self.build
+        version = self._str
+        if version is None:
+            version = f"{self.major}.{self.minor}.{self.patch}"
+            if self.prerelease:
+                version += f"-{self.prerelease}"
+            if self.build:
+                version += f"+{self.build}"
+            self._str = version
         return version
 
     def __hash__(self) -> int:
-        return hash(self.to_tuple()[:4])
+        value = self._hash
+        if value is None:
+            value = self._hash = hash(self.sort_key())
+        return value
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Leave out the lazily computed caches: hashes of strings, and so the
+        # hash of a prerelease, differ between processes
+        state = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if name not in _CACHED_SLOTS and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._sort_key = self._hash = self._str = None
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
 
     def finalize_version(self) -> "Version":
         """
@@ -573,36 +967,28 @@ build='build.10')
         >>> semver.Version.parse("4.0.4").match("4.0.4")
         True
         """
-        prefix = match_expr[:2]
-        if prefix in (">=", "<=", "==", "!="):
-            match_version = match_expr[2:]
-        elif prefix and prefix[0] in (">", "<"):
-            prefix = prefix[0]
-            match_version = match_expr[1:]
-        elif match_expr and match_expr[0] in "0123456789":
-            prefix = "=="
-            match_version = match_expr
-        else:
-            raise ValueError(
-                "match_expr parameter should be in format <op><ver>, "
-                "where <op> is one of "
-                "['<', '>', '==', '<=', '>=', '!=']. "
-                "You provided: %r" % match_expr
-            )
+        results, version = type(self)._compile_match(match_expr)
+        return _cmp(self.sort_key(), version.sort_key()) in results
 
-        possibilities_dict = {
-            ">": (1,),
-            "<": (-1,),
-            "==": (0,),
-            "!=": (-1, 1),
-            ">=": (0, 1),
-            "<=": (-1, 0),
-        }
+    @classmethod
+    def _compile_match(cls: Type[T], match_expr: str) -> Tuple[Tuple[int, ...], T]:
+        """
+        Compile a match expression into the accepted results of
+        :meth:`compare` and the version to compare with.
 
-        possibilities = possibilities_dict[prefix]
-        cmp_res = self.compare(match_version)
+        The result is cached in :data:`semver.version.match_cache`.
 
-        return cmp_res in possibilities
+        :param match_expr: optional operator and version, see :meth:`match`
+        :return: a tuple of the accepted results and the parsed version
+        :raises ValueError: if the operator or the version is invalid
+        """
+        key = (cls, match_expr)
+        compiled = match_cache.get(key)
+        if compiled is None:
+            prefix, match_version = _split_match_expr(match_expr)
+            compiled = _MATCH_RESULTS[prefix], cls.parse(match_version)
+            match_cache.put(key, compiled)
+        return compiled
 
     @classmethod
     def parse(
@@ -617,6 +1003,9 @@ build='build.10')
         .. versionchanged:: 3.0.0
            Added optional parameter ``optional_minor_and_patch`` to allow
            optional minor and patch parts.
+        .. versionchanged:: 3.1.0
+           Return shared instances from :data:`semver.version.parse_cache`
+           if the cache is enabled.
 
         :param version: version string
         :param optional_minor_and_patch: if set to true, the version string to parse \
@@ -630,26 +1019,175 @@ build='build.10')
         >>> semver.Version.parse('3.4.5-pre.2+build.4')
         Version(major=3, minor=4, patch=5, \
 prerelease='pre.2', build='build.4')
+        """
+        if not isinstance(version, String.__args__):  # type: ignore
+            raise TypeError("not expecting type '%s'" % type(version))
+
+        if parse_cache.maxsize:
+            key = (cls, version, optional_minor_and_patch)
+            cached = parse_cache.get(key)
+            if cached is None:
+                cached = cls._parse(version, optional_minor_and_patch)
+                parse_cache.put(key, cached)
+            return cached
+
+        return cls._parse(version, optional_minor_and_patch)
+
+    @classmethod
+    def _parse(cls: Type[T], version: String, optional_minor_and_patch: bool) -> T:
+        """
+        Parse a version string of the right type, bypassing the cache.
+
+        :param version: version string
+        :param optional_minor_and_patch: allow missing minor and patch parts
+        :return: a new :class:`Version` instance
+        :raises ValueError: if version is invalid
         """
         if isinstance(version, bytes):
             version = version.decode("UTF-8")
-        elif not isinstance(version, String.__args__):  # type: ignore
-            raise TypeError("not expecting type '%s'" % type(version))
 
+        if cls._PARSE_WITH_REGEX:
+            parts = cls._parse_with_regex(version, optional_minor_and_patch)
+        else:
+            parts = scan(version, optional_minor_and_patch)
+        if parts is None:
+            raise ValueError(f"{version} is not valid SemVer string")
+
+        return cls(*parts)
+
+    @classmethod
+    def _parse_with_regex(
+        cls, version: str, optional_minor_and_patch: bool = False
+    ) -> Optional[VersionTuple]:
+        """
+        Split a version string into its parts with the regexes.
+
+        This is the reference implementation of the grammar for the
+        faster scanner in :mod:`semver._parser`.
+
+        :param version: version string
+        :param optional_minor_and_patch: allow missing minor and patch parts
+        :return: a tuple with all the parts or None if version is invalid
+        """
         if optional_minor_and_patch:
             match = cls._REGEX_OPTIONAL_MINOR_AND_PATCH.match(version)
         else:
             match = cls._REGEX.match(version)
         if match is None:
-            raise ValueError(f"{version} is not valid SemVer string")
+            return None
+
+        parts = match.groupdict()
+        return (
+            int(parts["major"]),
+            int(parts["minor"] or 0),
+            int(parts["patch"] or 0),
+            parts.get("prerelease"),
+            parts.get("build"),
+        )
 
-        matched_version_parts: Dict[str, Any] = match.groupdict()
-        if not matched_version_parts["minor"]:
-            matched_version_parts["minor"] = 0
-        if not matched_version_parts["patch"]:
-            matched_version_parts["patch"] = 0
+    @classmethod
+    def parse_many(
+        cls,
+        versions: Iterable[String],
+        *,
+        optional_minor_and_patch: bool = False,
+        on_error: str = "raise",
+    ) -> ParseResult:
+        """
+        Parse many version strings at once.
+
+        .. versionadded:: 3.1.0
+
+        This is faster than calling :meth:`parse` in a loop, as the
+        parser is selected once and invalid items don't raise exceptions
+        internally.
+
+        :param versions: an iterable of version strings
+        :param optional_minor_and_patch: see :meth:`parse`
+        :param on_error: what to do with invalid items:
+           ``"raise"`` raises the error of the first invalid item,
+           ``"skip"`` ignores invalid items, and
+           ``"collect"`` records them in the ``errors`` list of the result
+        :return: a named tuple with the list of parsed ``versions`` and the
+           list of ``errors``, each one a :class:`ParseError` with the
+           ``index``, the ``input``, and the ``reason``
+        :raises ValueError: if on_error is ``"raise"`` and an item is invalid,
+           or if on_error is unknown
+        :raises TypeError: if on_error is ``"raise"`` and an item contains
+           the wrong type
+
+        >>> result = Version.parse_many(["1.0.0", "1.0", "2.0.0"], on_error="collect")
+        >>> [str(v) for v in result.versions]
+        ['1.0.0', '2.0.0']
+        >>> result.errors
+        [ParseError(index=1, input='1.0', reason='1.0 is not valid SemVer string')]
+        """
+        if on_error not in ("raise", "skip", "collect"):
+            raise ValueError(
+                "on_error must be one of 'raise', 'skip', or 'collect', "
+                f"but got {on_error!r}"
+            )
+        result = ParseResult([], [])
+        append = result.versions.append
+
+        # Subclasses with their own parse method and the cache need the
+        # full parse method for each item
+        if parse_cache.maxsize or cls._CUSTOM_PARSE:
+            # Custom parse methods may not know the optional flag at all
+            kwargs = {}
+            if optional_minor_and_patch:
+                kwargs["optional_minor_and_patch"] = True
+            for index, version in enumerate(versions):
+                try:
+                    append(cls.parse(version, **kwargs))
+                except (ValueError, TypeError) as err:
+                    error = (
+                        ValueError if isinstance(err, ValueError) else TypeError
+                    )
+                    cls._parse_error(result, on_error, index, version, error, str(err))
+            return result
+
+        split = cls._parse_with_regex if cls._PARSE_WITH_REGEX else scan
+        for index, version in enumerate(versions):
+            text = version
+            if type(text) is not str:  # Faster than isinstance for plain str
+                if isinstance(text, bytes):
+                    try:
+                        text = text.decode("UTF-8")
+                    except UnicodeDecodeError as err:
+                        cls._parse_error(
+                            result, on_error, index, version, ValueError, str(err)
+                        )
+                        continue
+                elif not isinstance(text, str):
+                    reason = f"not expecting type '{type(version)}'"
+                    cls._parse_error(
+                        result, on_error, index, version, TypeError, reason
+                    )
+                    continue
+
+            parts = split(cast(str, text), optional_minor_and_patch)
+            if parts is None:
+                reason = f"{text!s} is not valid SemVer string"
+                cls._parse_error(result, on_error, index, version, ValueError, reason)
+            else:
+                append(cls(*parts))
+        return result
 
-        return cls(**matched_version_parts)
+    @staticmethod
+    def _parse_error(
+        result: ParseResult,
+        on_error: str,
+        index: int,
+        version: Any,
+        error: Type[Exception],
+        reason: str,
+    ) -> None:
+        """Raise, skip, or collect an invalid item of :meth:`parse_many`."""
+        if on_error == "raise":
+            raise error(f"item {index}: {reason}")
+        if on_error == "collect":
+            result.errors.append(ParseError(index, version, reason))
 
     def replace(self, **parts: Union[int, Optional[str]]) -> "Version":
         """
@@ -686,16 +1224,34 @@ prerelease='pre.2', build='build.4')
 
         .. versionchanged:: 3.0.0
            Renamed from :meth:`~semver.version.Version.isvalid`
+        .. versionchanged:: 3.1.0
+           Only checks the grammar without creating a
+           :class:`~semver.version.Version` instance or raising an exception.
 
         :param version: the version string to check
         :return: True if the version string is a valid semver version, False
                  otherwise.
+        :raises TypeError: if version contains the wrong type
         """
-        try:
-            cls.parse(version)
-            return True
-        except ValueError:
-            return False
+        if cls._CUSTOM_PARSE:
+            try:
+                cls.parse(version)
+                return True
+            except ValueError:
+                return False
+
+        if type(version) is not str:  # Faster than isinstance for plain str
+            if isinstance(version, bytes):
+                try:
+                    version = version.decode("UTF-8")
+                except UnicodeDecodeError:
+                    return False
+            elif not isinstance(version, str):
+                raise TypeError(f"not expecting type '{type(version)}'")
+
+        if cls._PARSE_WITH_REGEX:
+            return cls._REGEX.match(version) is not None
+        return is_valid(version)
 
     def is_compatible(self, other: "Version") -> bool:
         """
@@ -738,3 +1294,39 @@ prerelease='pre.2', build='build.4')
 
 #: Keep the VersionInfo name for compatibility
 VersionInfo = Version
+
+
+def compile_match(
+    match_expr: str, version_class: Type[Version] = Version
+) -> Callable[[Comparable], bool]:
+    """
+    Compile a match expression into a reusable predicate.
+
+    .. versionadded:: 3.1.0
+
+    The expression is parsed only once. The predicate accepts everything
+    :meth:`Version.compare` accepts and is equivalent to calling
+    :meth:`Version.match` with the expression.
+
+    :param match_expr: optional operator and version, see :meth:`Version.match`
+    :param version_class: the class to parse the versions with
+    :return: a function which checks if a version matches the expression
+    :raises ValueError: if the operator or the version is invalid
+
+    >>> is_new = semver.compile_match(">=2.0.0")
+    >>> is_new("2.1.0"), is_new(semver.Version(1, 9, 0))
+    (True, False)
+    >>> [v for v in ["1.0.0", "2.0.0", "3.0.0-rc.1"] if is_new(v)]
+    ['2.0.0', '3.0.0-rc.1']
+    """
+    results, match_version = version_class._compile_match(match_expr)
+    key = match_version.sort_key()
+
+    def predicate(version: Comparable) -> bool:
+        if not isinstance(version, version_class):
+            # The versions to match are rarely the same, so don't cache them
+            version = match_version._coerce(version, cached=False)
+        return _cmp(version.sort_key(), key) in results
+
+    predicate.__qualname__ = predicate.__name__ = f"match({match_expr!r})"
+    return predicate
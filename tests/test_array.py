@@ -0,0 +1,200 @@
+import re
+
+import pytest
+from semverwithvprefix import SemVerWithVPrefix
+
+from semver import Version
+
+np = pytest.importorskip("numpy")
+
+from semver.array import VersionArray  # noqa: E402
+
+VERSIONS = [
+    "1.0.0",
+    "1.0.0-alpha",
+    "2.0.0+build.1",
+    "1.0.0-alpha.1",
+    "0.9.12",
+    "1.0.0-beta.11",
+    "1.0.0-rc.1",
+    "1.0.0-alpha.beta",
+    "1.0.0-beta",
+    "1.0.0-beta.2",
+    "1.10.0",
+    "1.2.0",
+    "2.0.0",
+]
+
+
+@pytest.fixture
+def array():
+    return VersionArray(VERSIONS)
+
+
+def test_should_round_trip_versions(array):
+    assert array.to_versions() == [Version.parse(v) for v in VERSIONS]
+    assert [str(v) for v in array] == VERSIONS
+    assert len(array) == len(VERSIONS)
+
+
+def test_should_accept_version_instances():
+    versions = [Version.parse(v) for v in VERSIONS]
+    assert VersionArray(versions).to_versions() == versions
+
+
+def test_should_not_create_versions_for_strings(monkeypatch):
+    def fail(*args, **kwargs):  # pragma: no cover
+        raise AssertionError("created a Version")
+
+    monkeypatch.setattr(Version, "__init__", fail)
+    array = VersionArray([*VERSIONS, b"3.0.0"])
+    assert (array == "2.0.0").sum() == 2
+
+
+@pytest.mark.parametrize(
+    "version,error,message",
+    [
+        ("1.2", ValueError, "1.2 is not valid SemVer string"),
+        (b"\xff", ValueError, "codec can't decode"),
+        (42, TypeError, "not expecting type"),
+        (f"{2**63}.0.0", ValueError, f"part {2**63} is greater than"),
+        (f"1.0.{2**64}-rc.1", ValueError, f"part {2**64} is greater than"),
+    ],
+)
+def test_should_raise_on_invalid_versions(version, error, message):
+    with pytest.raises(error, match=message):
+        VersionArray(["1.0.0", version])
+
+
+def test_should_accept_largest_parts():
+    largest = f"{2**63 - 1}.0.0"
+    array = VersionArray(["1.0.0", largest])
+    assert array.max() == Version.parse(largest)
+    assert (array < largest).tolist() == [True, False]
+    with pytest.raises(ValueError, match="is greater than"):
+        array.compare(f"{2**63}.0.0")
+
+
+def test_should_use_custom_parse_method():
+    array = VersionArray(["v1.2.3", "V2.0.0"], version_class=SemVerWithVPrefix)
+    assert array.to_versions() == [SemVerWithVPrefix(1, 2, 3), SemVerWithVPrefix(2)]
+    assert (array >= "v2.0.0").tolist() == [False, True]
+    with pytest.raises(ValueError, match="Must start with"):
+        VersionArray(["1.2.3"], version_class=SemVerWithVPrefix)
+
+
+def test_should_use_custom_regex():
+    class NoPrerelease(Version):
+        _REGEX = re.compile(r"^(?P<major>\d+)\.(?P<minor>\d+)\.(?P<patch>\d+)$")
+
+    array = VersionArray(["1.2.3"], version_class=NoPrerelease)
+    assert type(array[0]) is NoPrerelease
+    with pytest.raises(ValueError, match=r"1\.2\.3-rc\.1 is not valid"):
+        VersionArray(["1.2.3-rc.1"], version_class=NoPrerelease)
+
+
+def test_should_create_empty_array():
+    array = VersionArray()
+    assert len(array) == 0
+    assert array.to_versions() == []
+    assert (array > "1.0.0").tolist() == []
+
+
+def test_should_sort_like_versions(array):
+    expected = sorted(Version.parse(v) for v in VERSIONS)
+    assert array.sort().to_versions() == expected
+    assert array.sort(reverse=True).to_versions() == sorted(
+        (Version.parse(v) for v in VERSIONS), reverse=True
+    )
+
+
+def test_should_argsort_stable():
+    array = VersionArray(["1.0.0+b", "0.1.0", "1.0.0+a"])
+    assert array.argsort().tolist() == [1, 0, 2]
+    assert array.argsort(reverse=True).tolist() == [0, 2, 1]
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        "1.0.0",
+        "1.0.0-beta",
+        "1.0.0-beta.3",
+        "1.0.0-0",
+        "1.0.0-zzz",
+        "1.0.0-alpha.0",
+        "0.0.1",
+        "3.0.0",
+        "2.0.0+other",
+    ],
+)
+def test_should_compare_like_versions(array, other):
+    versions = [Version.parse(v) for v in VERSIONS]
+    assert array.compare(other).tolist() == [v.compare(other) for v in versions]
+    assert (array < other).tolist() == [v < other for v in versions]
+    assert (array <= other).tolist() == [v <= other for v in versions]
+    assert (array > other).tolist() == [v > other for v in versions]
+    assert (array >= other).tolist() == [v >= other for v in versions]
+    assert (array == other).tolist() == [v == other for v in versions]
+    assert (array != other).tolist() == [v != other for v in versions]
+
+
+def test_should_compare_with_version(array):
+    assert (array == Version(2)).tolist() == [v.startswith("2.") for v in VERSIONS]
+
+
+@pytest.mark.parametrize(
+    "expr", [">=1.2.0", "<1.0.0", "==1.0.0-beta", "!=2.0.0", "<=1.0.0-rc.1", "1.0.0"]
+)
+def test_should_match_like_versions(array, expr):
+    expected = [Version.parse(v).match(expr) for v in VERSIONS]
+    assert array.match(expr).tolist() == expected
+
+
+def test_should_raise_on_invalid_match(array):
+    with pytest.raises(ValueError, match="match_expr parameter should be in format"):
+        array.match("=>1.0.0")
+
+
+def test_should_find_max_and_min(array):
+    assert array.max() == Version(2)
+    assert array.min() == Version(0, 9, 12)
+    assert array.max().build == "build.1"
+
+
+@pytest.mark.parametrize("method", ["max", "min"])
+def test_should_raise_on_empty_max_min(method):
+    with pytest.raises(ValueError, match="empty VersionArray"):
+        getattr(VersionArray(), method)()
+
+
+def test_should_select_items(array):
+    assert array[0] == Version(1)
+    assert array[-1] == Version(2)
+    assert array[np.int64(1)] == Version(1, prerelease="alpha")
+    assert isinstance(array[1:3], VersionArray)
+    assert [str(v) for v in array[1:3]] == VERSIONS[1:3]
+    assert [str(v) for v in array[array >= "2.0.0"]] == ["2.0.0+build.1", "2.0.0"]
+    assert [str(v) for v in array[[4, 0]]] == ["0.9.12", "1.0.0"]
+    with pytest.raises(IndexError):
+        array[len(VERSIONS)]
+
+
+def test_should_use_version_class():
+    class MyVersion(Version):
+        pass
+
+    array = VersionArray(["1.2.3"], version_class=MyVersion)
+    assert type(array[0]) is MyVersion
+    assert (array == "1.2.3").tolist() == [True]
+
+
+def test_should_not_be_hashable(array):
+    with pytest.raises(TypeError):
+        hash(array)
+
+
+def test_repr():
+    assert repr(VersionArray(["1.0.0", "2.0.0-rc.1"])) == (
+        "VersionArray(['1.0.0', '2.0.0-rc.1'])"
+    )
@@ -0,0 +1,60 @@
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+BENCHMARKS = Path(__file__).parent.parent / "benchmarks"
+
+
+@pytest.fixture
+def run(monkeypatch):
+    # run.py puts the benchmarks on sys.path and imports them, undo that
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    modules = set(sys.modules)
+    spec = importlib.util.spec_from_file_location("run", BENCHMARKS / "run.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    yield module
+    for name in set(sys.modules) - modules:
+        if str(BENCHMARKS) in str(getattr(sys.modules[name], "__file__", "")):
+            del sys.modules[name]
+
+
+@pytest.mark.parametrize(
+    "module", sorted(path.stem for path in BENCHMARKS.glob("bench_*.py"))
+)
+def test_should_run_each_benchmark_once(run, module, monkeypatch):
+    monkeypatch.setenv("SEMVER_BENCH_SIZE", "20")
+    benchmarks = run.collect([f"{module[len('bench_') :]}."])
+    assert benchmarks
+    for func in benchmarks.values():
+        func()
+
+
+@pytest.mark.parametrize(
+    "content,message",
+    [
+        (None, "No such file"),
+        ("{", "Expecting property name"),
+        ("[]", "no benchmarks found"),
+        ('{"benchmarks": 1}', "no benchmarks found"),
+    ],
+)
+def test_should_fail_on_unreadable_baseline(run, content, message, tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    if content is not None:
+        baseline.write_text(content)
+    with pytest.raises(SystemExit) as excinfo:
+        run.main(["--compare", str(baseline), "no-such-benchmark"])
+    err = capsys.readouterr().err
+    assert excinfo.value.code == 2
+    assert f"can't read the baseline {baseline}: " in err
+    assert message in err
+
+
+def test_should_compare_with_saved_baseline(run, tmp_path):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"benchmarks": {}}))
+    assert run.main(["--compare", str(baseline), "no-such-benchmark"]) == 0
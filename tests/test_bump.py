@@ -1,6 +1,7 @@
 import pytest
 
 from semver import (
+    Version,
     bump_build,
     bump_major,
     bump_minor,
@@ -123,3 +124,20 @@ def test_should_ignore_build_on_prerelease_bump():
 )
 def test_should_bump_build(version, expected):
     assert bump_build(version) == expected
+
+
+@pytest.mark.parametrize(
+    "prerelease,expected",
+    [
+        # Without digits, a regex search used to take quadratic time
+        ("rc." + "x." * 10_000 + "x", None),
+        ("-" * 20_000, None),
+        ("1" + "a" * 20_000, "2" + "a" * 20_000),
+        ("a1" * 10_000, "a1" * 9_999 + "a2"),
+    ],
+    ids=["dotted", "hyphens", "leading-number", "many-numbers"],
+)
+def test_should_bump_long_prerelease_in_linear_time(prerelease, expected):
+    version = Version(1, 2, 3, prerelease, "build." + prerelease)
+    assert version.bump_prerelease().prerelease == (expected or prerelease)
+    assert version.bump_build().build == "build." + (expected or prerelease)
@@ -0,0 +1,333 @@
+import random
+import sys
+
+import pytest
+
+import semver
+from semver import Version
+from semver.collections import CompactVersionList, VersionIndex
+from semver.version import PACKED_LIMIT
+
+
+@pytest.mark.parametrize(
+    "version",
+    [
+        Version(0),
+        Version(1, 2, 3),
+        Version(PACKED_LIMIT - 1, PACKED_LIMIT - 1, PACKED_LIMIT - 1),
+    ],
+)
+def test_to_int_and_from_int_roundtrip(version):
+    value = version.to_int()
+    assert 0 <= value < 2**63
+    assert Version.from_int(value) == version
+
+
+def test_to_int_keeps_order():
+    versions = [Version(0, 0, 1), Version(0, 1, 0), Version(1, 0, 0), Version(1, 0, 9)]
+    values = [v.to_int() for v in versions]
+    assert values == sorted(values)
+
+
+@pytest.mark.parametrize(
+    "version,message",
+    [
+        (Version(1, 0, 0, "rc.1"), "without prerelease and build"),
+        (Version(1, 0, 0, None, "build.1"), "without prerelease and build"),
+        (Version(PACKED_LIMIT), "must be smaller than 2097152"),
+        (Version(0, 0, PACKED_LIMIT), "must be smaller than 2097152"),
+    ],
+)
+def test_to_int_raises(version, message):
+    with pytest.raises(ValueError, match=message):
+        version.to_int()
+
+
+@pytest.mark.parametrize("value", [-1, 2**63])
+def test_from_int_raises(value):
+    with pytest.raises(ValueError, match="is not a packed version"):
+        Version.from_int(value)
+
+
+def test_compact_version_list():
+    versions = [
+        Version(1, 0, 0),
+        Version(1, 0, 0, "rc.1"),
+        Version(PACKED_LIMIT, 0, 0),
+        Version(2, 0, 0, None, "build.5"),
+        Version(3, 4, 5),
+    ]
+    compact = CompactVersionList(versions)
+    assert len(compact) == 5
+    assert list(compact) == versions
+    assert [compact[i] for i in range(-5, 5)] == versions * 2
+    assert compact[2] is versions[2]
+    assert list(compact[1::2]) == versions[1::2]
+    assert compact.index(Version(3, 4, 5)) == 4
+    assert repr(compact[:2]) == "CompactVersionList(['1.0.0', '1.0.0-rc.1'])"
+
+
+def test_compact_version_list_accepts_strings():
+    compact = CompactVersionList(["1.2.3"])
+    compact.append(b"2.0.0-rc.1")
+    compact.extend(["3.0.0"])
+    assert [str(v) for v in compact] == ["1.2.3", "2.0.0-rc.1", "3.0.0"]
+    with pytest.raises(ValueError):
+        compact.append("1.2")
+
+
+@pytest.mark.parametrize(
+    "version,expected",
+    [
+        ("1.2.3", True),
+        (Version(1, 2, 3, None, "build.1"), True),
+        ("2.0.0-rc.1", True),
+        ("2.0.0", False),
+        (Version(PACKED_LIMIT), True),
+        (42, False),
+    ],
+)
+def test_compact_version_list_contains(version, expected):
+    compact = CompactVersionList(["1.2.3", "2.0.0-rc.1", Version(PACKED_LIMIT)])
+    assert (version in compact) is expected
+
+
+def test_compact_version_list_keeps_subclasses():
+    class SemVerSubclass(Version):
+        pass
+
+    compact = CompactVersionList(["1.2.3"], version_class=SemVerSubclass)
+    compact.append(Version(1, 2, 4))
+    assert [type(v) for v in compact] == [SemVerSubclass, Version]
+
+
+def test_compact_version_list_is_small():
+    versions = [Version(1, minor, patch) for minor in range(50) for patch in range(50)]
+    size = sys.getsizeof(versions) + sum(map(sys.getsizeof, versions))
+    assert sys.getsizeof(CompactVersionList(versions)) * 10 < size
+
+
+def random_versions(seed, count=300):
+    rng = random.Random(seed)
+    return [
+        Version(
+            rng.randint(0, 4),
+            rng.randint(0, 3),
+            rng.randint(0, 3),
+            rng.choice([None, None, "rc.1", "alpha", "0"]),
+            rng.choice([None, "build.1"]),
+        )
+        for _ in range(count)
+    ]
+
+
+PROBES = [
+    Version.parse(v)
+    for v in ["0.0.0-0", "1.0.0", "1.2.3-rc.1", "2.0.0", "2.3.3", "4.9.9", "5.0.0"]
+]
+
+
+def test_version_index_sorts_and_deduplicates():
+    versions = random_versions(1)
+    index = VersionIndex(versions)
+    unique = {}
+    for version in versions:
+        unique.setdefault(version.sort_key(), version)
+    assert list(index) == [unique[key] for key in sorted(unique)]
+    assert list(reversed(index)) == list(index)[::-1]
+    assert len(index) == len(unique)
+
+
+def test_version_index_keeps_first_of_equal_precedence():
+    index = VersionIndex(["1.0.0+build.1", "1.0.0+build.2"])
+    index.add("1.0.0+build.3")
+    assert [str(v) for v in index] == ["1.0.0+build.1"]
+
+
+@pytest.mark.parametrize("probe", PROBES)
+def test_version_index_neighbors(probe):
+    versions = sorted(set(random_versions(2)))
+    index = VersionIndex(versions)
+    lower = [v for v in index if v < probe]
+    higher = [v for v in index if v > probe]
+    assert index.floor(probe) == max([v for v in index if v <= probe], default=None)
+    assert index.ceiling(probe) == min([v for v in index if v >= probe], default=None)
+    assert index.previous_before(probe) == (lower[-1] if lower else None)
+    assert index.next_after(probe) == (higher[0] if higher else None)
+
+
+@pytest.mark.parametrize("inclusive", [(True, True), (False, True), (True, False)])
+@pytest.mark.parametrize("lower, upper", [("1.0.0", "2.3.3"), (None, "1.2.3-rc.1")])
+def test_version_index_between(lower, upper, inclusive):
+    index = VersionIndex(random_versions(3))
+    low = Version.parse(lower) if lower else Version(0, prerelease="0")
+    high = Version.parse(upper)
+    expected = [
+        v
+        for v in index
+        if (v >= low if inclusive[0] or lower is None else v > low)
+        and (v <= high if inclusive[1] else v < high)
+    ]
+    result = index.between(lower, upper, inclusive=inclusive)
+    assert isinstance(result, VersionIndex)
+    assert list(result) == expected
+
+
+def test_version_index_between_empty():
+    index = VersionIndex(["1.0.0", "2.0.0"])
+    assert list(index.between("2.0.0", "1.0.0")) == []
+    assert list(index.between(upper="0.1.0")) == []
+    assert list(index.between("1.0.0")) == list(index)
+
+
+@pytest.mark.parametrize("prerelease", [True, False])
+def test_version_index_latest(prerelease):
+    versions = random_versions(4)
+    index = VersionIndex(versions)
+
+    def brute_force(*prefix):
+        candidates = [
+            v
+            for v in versions
+            if v.to_tuple()[: len(prefix)] == prefix
+            and (prerelease or v.prerelease is None)
+        ]
+        return max(candidates, default=None)
+
+    assert index.latest(prerelease=prerelease) == brute_force()
+    for major in range(6):
+        assert index.latest(major, prerelease=prerelease) == brute_force(major)
+        for minor in range(5):
+            latest = index.latest(major, minor, prerelease=prerelease)
+            assert latest == brute_force(major, minor)
+        latest = index.latest_per_major(prerelease=prerelease).get(major)
+        assert latest == brute_force(major)
+
+
+def test_version_index_latest_per_major_order():
+    index = VersionIndex(["3.0.0", "1.0.0", "1.1.0-rc.1", "2.0.0-rc.1"])
+    assert {k: str(v) for k, v in index.latest_per_major().items()} == {
+        1: "1.1.0-rc.1",
+        2: "2.0.0-rc.1",
+        3: "3.0.0",
+    }
+    assert list(index.latest_per_major(prerelease=False)) == [1, 3]
+
+
+def test_version_index_latest_raises_on_minor_without_major():
+    with pytest.raises(ValueError, match="minor requires major"):
+        VersionIndex().latest(minor=1)
+
+
+def test_version_index_empty():
+    index = VersionIndex()
+    assert index.latest() is None
+    assert index.floor("1.0.0") is None
+    assert index.next_after("1.0.0") is None
+    assert index.latest_per_major() == {}
+
+
+def test_version_index_add_and_discard():
+    index = VersionIndex(["1.0.0", "3.0.0"])
+    index.add(Version(2))
+    index.add("2.0.0+build")
+    index.discard("1.0.0+other")
+    index.discard("9.0.0")
+    assert [str(v) for v in index] == ["2.0.0", "3.0.0"]
+
+
+def test_version_index_sequence_api():
+    index = VersionIndex(["1.0.0", "2.0.0", "3.0.0"])
+    assert index[0] == Version(1)
+    assert index[-1] == Version(3)
+    assert list(index[1:]) == [Version(2), Version(3)]
+    assert "2.0.0" in index
+    assert b"2.0.0+build" in index
+    assert Version(4) not in index
+    assert (2, 0, 0) not in index
+    assert "2.0" not in index
+    assert b"\xff" not in index
+    assert index.index(Version(2)) == 1
+    assert repr(index) == "VersionIndex(['1.0.0', '2.0.0', '3.0.0'])"
+
+
+def test_version_index_slices_with_step():
+    index = VersionIndex(["1.0.0", "2.0.0", "3.0.0", "4.0.0"])
+    every_other = index[::2]
+    assert isinstance(every_other, VersionIndex)
+    assert list(every_other) == [Version(1), Version(3)]
+    assert every_other.latest() == Version(3)
+    assert index[::-1] == [Version(4), Version(3), Version(2), Version(1)]
+    assert index[2::-2] == [Version(3), Version(1)]
+
+
+def test_version_index_uses_version_class():
+    class MyVersion(Version):
+        pass
+
+    index = VersionIndex(["1.0.0"], version_class=MyVersion)
+    index.add("2.0.0")
+    assert all(type(v) is MyVersion for v in index)
+    assert type(index[:1][0]) is MyVersion
+
+
+def random_version_strings(seed, count=500):
+    return [str(v) for v in random_versions(seed, count)]
+
+
+@pytest.mark.parametrize("include_prereleases", [True, False])
+def test_latest_and_top_k_agree_with_sorting(include_prereleases):
+    strings = random_version_strings(5)
+    candidates = [
+        s for s in strings if include_prereleases or Version.parse(s).prerelease is None
+    ]
+    ordered = sorted(candidates, key=Version.parse, reverse=True)
+    options = {"include_prereleases": include_prereleases}
+    assert semver.latest(strings, **options) == ordered[0]
+    assert semver.top_k(strings, 10, **options) == ordered[:10]
+    versions = [Version.parse(s) for s in strings]
+    assert semver.latest(versions, **options) == Version.parse(ordered[0])
+
+
+def test_latest_returns_first_of_equal_versions():
+    assert semver.latest(["1.0.0+a", "0.1.0", "1.0.0+b"]) == "1.0.0+a"
+    assert semver.top_k(["1.0.0+a", "1.0.0+b", "0.1.0"], 2) == ["1.0.0+a", "1.0.0+b"]
+
+
+def test_latest_compares_prereleases_of_equal_parts():
+    items = ["1.0.0-rc.2", "1.0.0-rc.10", "1.0.0-beta", "0.9.0"]
+    assert semver.latest(items, include_prereleases=True) == "1.0.0-rc.10"
+
+
+def test_latest_and_top_k_with_key():
+    items = [{"v": "1.0.0"}, {"v": b"2.0.0"}, {"v": Version(1, 5)}]
+    assert semver.latest(items, key=lambda item: item["v"]) == items[1]
+    assert semver.top_k(items, 2, key=lambda item: item["v"]) == items[1:]
+
+
+def test_latest_and_top_k_empty():
+    assert semver.latest([]) is None
+    assert semver.latest(["1.0.0-rc.1"]) is None
+    assert semver.top_k([], 3) == []
+    assert semver.top_k(["1.0.0"], 0) == []
+
+
+@pytest.mark.parametrize("invalid", ["1.0", "x", b"\xff"])
+def test_latest_and_top_k_invalid(invalid):
+    items = ["1.0.0", invalid, "0.5.0"]
+    with pytest.raises(ValueError, match="is not valid SemVer string"):
+        semver.latest(items)
+    with pytest.raises(ValueError, match="is not valid SemVer string"):
+        semver.top_k(items, 1)
+    assert semver.latest(items, skip_invalid=True) == "1.0.0"
+    assert semver.top_k(items, 5, skip_invalid=True) == ["1.0.0", "0.5.0"]
+
+
+def test_latest_raises_type_error():
+    with pytest.raises(TypeError, match="Expected str, bytes, or Version"):
+        semver.latest([(1, 0, 0)])
+
+
+def test_latest_consumes_iterators_lazily():
+    assert semver.latest(iter(["1.0.0", "2.0.0"])) == "2.0.0"
+    assert semver.top_k((s for s in ["1.0.0", "2.0.0"]), 1) == ["2.0.0"]
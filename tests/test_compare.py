@@ -1,7 +1,8 @@
 import pytest
+from semverwithvprefix import SemVerWithVPrefix
 
 import semver
-from semver import Version, compare
+from semver import Version, coerce_cache, compare, compile_match
 
 
 @pytest.mark.parametrize(
@@ -302,3 +303,99 @@ def test_should_compare_prerelease_and_build_with_numbers():
     assert Version(1, 9, 1, 1, 1) < Version(1, 9, 1, 2, 1)
     assert Version("2") < Version(10)
     assert Version("2") < Version("10")
+
+
+def test_sort_key_orders_by_precedence():
+    chain = [
+        "1.0.0-0",
+        "1.0.0-1",
+        "1.0.0-1.0",
+        "1.0.0-alpha",
+        "1.0.0-alpha.1",
+        "1.0.0-alpha.beta",
+        "1.0.0-beta.2",
+        "1.0.0-beta.11",
+        "1.0.0-rc.1",
+        "1.0.0",
+        "1.0.1-rc.1",
+        "1.3.7+build",
+    ]
+    versions = [Version.parse(v) for v in reversed(chain)]
+    assert [str(v) for v in sorted(versions, key=Version.sort_key)] == chain
+    assert [str(v) for v in sorted(versions)] == chain
+
+
+def test_sort_key_with_bisect():
+    import bisect
+
+    keys = [Version.parse(v).sort_key() for v in ("1.0.0-rc.1", "1.0.0", "2.0.0")]
+    assert bisect.bisect(keys, Version.parse("1.0.0+build.1").sort_key()) == 2
+    assert bisect.bisect_left(keys, Version.parse("1.0.0-rc.2").sort_key()) == 1
+
+
+def test_sort_key_is_computed_once(version):
+    assert version.sort_key() is version.sort_key()
+
+
+@pytest.mark.parametrize(
+    "left,right",
+    [
+        (Version(1, 0, 0, "rc.1", "build.1"), Version(1, 0, 0, "rc.1", "build.2")),
+        (Version(1, 0, 0, "1"), Version(1, 0, 0, "01")),
+        (Version(1, 0, 0, ""), Version(1, 0, 0)),
+    ],
+)
+def test_equal_versions_have_equal_sort_keys_and_hashes(left, right):
+    assert left == right
+    assert left.sort_key() == right.sort_key()
+    assert hash(left) == hash(right)
+
+
+@pytest.mark.parametrize(
+    "op", ["__eq__", "__ne__", "__lt__", "__le__", "__gt__", "__ge__"]
+)
+def test_comparing_two_versions_does_not_coerce(op, monkeypatch):
+    def fail(self, other):
+        raise AssertionError("unexpected coercion")
+
+    monkeypatch.setattr(Version, "_coerce", fail)
+    v1, v2 = Version(1, 2, 3), Version(1, 2, 4)
+    assert getattr(v1, op)(v2) in (True, False)
+    with pytest.raises(AssertionError, match="unexpected coercion"):
+        getattr(v1, op)("1.2.4")
+
+
+def test_comparing_with_string_parses_it_once():
+    coerce_cache.clear()
+    versions = [Version(1, minor) for minor in range(5)]
+    assert [v > "1.2.0" for v in versions] == [False] * 3 + [True] * 2
+    assert versions[0].compare(b"1.2.0") == -1
+    info = coerce_cache.info()
+    assert (info.hits, info.misses, info.currsize) == (4, 2, 2)
+    assert versions[0]._coerce("1.2.0") is versions[1]._coerce("1.2.0")
+
+
+def test_coerce_cache_is_keyed_on_class():
+    coerce_cache.clear()
+    assert Version(1, 2, 3) == "1.2.3"
+    assert SemVerWithVPrefix(1, 2, 3) == "v1.2.3"
+    assert type(SemVerWithVPrefix(1)._coerce("v1.2.3")) is SemVerWithVPrefix
+    assert coerce_cache.info().currsize == 2
+
+
+def test_compile_match_does_not_cache_versions():
+    coerce_cache.clear()
+    is_new = compile_match(">=2.0.0")
+    assert [is_new(v) for v in ("1.0.0", "2.0.0", "2.0.0")] == [False, True, True]
+    assert coerce_cache.info().misses == 0
+
+
+def test_compare_works_with_disabled_coerce_cache():
+    coerce_cache.resize(0)
+    try:
+        assert Version(1, 2, 3) < "1.2.4"
+        assert Version(1, 2, 3)._coerce("1.2.4") is not Version(1)._coerce("1.2.4")
+        assert coerce_cache.info().misses == 0
+    finally:
+        coerce_cache.resize(512)
+        coerce_cache.clear()
@@ -1,4 +1,14 @@
+import os
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
+from semverwithvprefix import SemVerWithVPrefix
+
+import semver
+from semver import Version
 
 
 def test_immutable_major(version):
@@ -31,3 +41,51 @@ def test_immutable_unknown_attribute(version):
         AttributeError, match=".* object has no attribute 'new_attribute'"
     ):
         version.new_attribute = "forbidden"
+
+
+def test_hash_and_str_are_cached(version, monkeypatch):
+    assert str(version) is str(version)
+    expected = hash(version)
+    assert expected == hash(version.sort_key())
+    # Only the cached hash is used from now on
+    monkeypatch.setattr(type(version), "sort_key", None)
+    assert hash(version) == expected
+
+
+@pytest.mark.parametrize(
+    "version", [Version.parse("1.2.3-rc.1+build.5"), SemVerWithVPrefix(1, 2)]
+)
+def test_cached_parts_are_not_pickled(version):
+    str(version), hash(version), version.sort_key()
+    copy = pickle.loads(pickle.dumps(version))
+    assert (copy._hash, copy._str, copy._sort_key) == (None, None, None)
+    assert copy == version
+    assert type(copy) is type(version)
+    assert str(copy) == str(version)
+    assert hash(copy) == hash(version)
+
+
+def test_pickled_versions_hash_equal_in_other_processes():
+    # The hash of a prerelease depends on the hash seed of the process
+    code = (
+        "import pickle, sys; from semver import Version;"
+        "v = Version.parse(sys.argv[1]); hash(v);"
+        "sys.stdout.write(pickle.dumps(v).hex() + ' ' + str(hash(v)))"
+    )
+    env = dict(os.environ, PYTHONPATH=str(Path(semver.__file__).parent.parent))
+    results = [
+        subprocess.run(
+            [sys.executable, "-c", code, "1.2.3-rc.1"],
+            capture_output=True,
+            check=True,
+            env=dict(env, PYTHONHASHSEED=seed),
+            text=True,
+        ).stdout.split()
+        for seed in ("1", "2")
+    ]
+    assert results[0][1] != results[1][1]
+    loaded = pickle.loads(bytes.fromhex(results[0][0]))
+    version = Version.parse("1.2.3-rc.1")
+    assert loaded == version
+    assert hash(loaded) == hash(version)
+    assert {loaded: 1}.get(version) == 1
@@ -0,0 +1,79 @@
+import os
+import subprocess
+import sys
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+import semver
+
+
+def importtime(code):
+    """Run code in a new interpreter and return the names of imported modules."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(Path(semver.__file__).parent.parent)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    # Each line looks like "import time: self [us] | cumulative | name"
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }, result.stdout
+
+
+@pytest.mark.parametrize("code", ["import semver", "from semver import Version"])
+def test_import_should_not_load_heavy_modules(code):
+    modules, _ = importtime(code)
+    assert "semver.version" in modules
+    assert not modules & {
+        "argparse",
+        "inspect",
+        "semver._deprecated",
+        "semver.cli",
+        "semver.collections",
+        "semver.range",
+    }
+
+
+def test_import_should_not_compile_regexes():
+    _, out = importtime(
+        "import semver; semver.Version.parse('1.2.3');"
+        "print(semver.Version.__dict__['_REGEX']._compiled)"
+    )
+    assert out == "None\n"
+
+
+@pytest.mark.parametrize(
+    "name,module",
+    [
+        ("bump_major", "semver._deprecated"),
+        ("main", "semver._deprecated"),
+        ("latest", "semver.collections"),
+        ("top_k", "semver.collections"),
+    ],
+)
+def test_should_import_names_lazily(name, module):
+    assert getattr(semver, name) is getattr(import_module(module), name)
+    assert name in dir(semver)
+
+
+@pytest.mark.parametrize("name", ["cli", "collections", "range"])
+def test_should_import_submodules_lazily(name):
+    assert getattr(semver, name).__name__ == f"semver.{name}"
+
+
+def test_should_raise_for_unknown_attribute():
+    with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+        semver.unknown  # noqa: B018
+
+
+def test_should_compile_regex_on_first_use():
+    assert semver.Version._REGEX.match("1.2.3")
+    assert semver.Version._REGEX is semver.Version._REGEX
@@ -0,0 +1,234 @@
+import sys
+
+import pytest
+
+from semver import (
+    Version,
+    cli,
+    coerce_cache,
+    instrumentation,
+    main,
+    match_cache,
+    server,
+)
+from semver.instrumentation import CoercionWarning, Stats
+
+
+@pytest.fixture
+def instrumented():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield instrumentation
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def calls(name):
+    return instrumentation.snapshot().operations[name].calls
+
+
+def test_should_be_disabled_by_default():
+    assert not instrumentation.is_enabled()
+    assert "parse" in Version.__dict__
+    assert not hasattr(Version.__dict__["parse"].__func__, "__wrapped__")
+
+
+def test_should_restore_originals():
+    originals = dict(Version.__dict__), cli.process, cli.process_batch
+    instrumentation.enable()
+    instrumentation.enable()
+    assert instrumentation.is_enabled()
+    assert Version.__dict__["compare"] is not originals[0]["compare"]
+    instrumentation.disable()
+    instrumentation.disable()
+    assert not instrumentation.is_enabled()
+    assert (dict(Version.__dict__), cli.process, cli.process_batch) == originals
+
+
+def test_should_count_methods(instrumented):
+    # The match expression and the strings are parsed, unless they're cached
+    match_cache.clear()
+    coerce_cache.clear()
+    version = Version.parse("1.2.3")
+    version.compare("2.0.0")
+    version.compare(Version(2))
+    assert version < (2, 0, 0)
+    assert version.match(">=1.0.0")
+    version.replace(prerelease="rc.1").bump_prerelease().bump_build()
+    for part in ("major", "minor", "patch"):
+        getattr(version, f"bump_{part}")()
+    Version.parse_many(["1.0.0", "2.0.0"])
+
+    operations = instrumented.snapshot().operations
+    assert {name: stats.calls for name, stats in operations.items()} == {
+        "parse": 3,
+        "parse_many": 1,
+        "compare": 2,
+        "cmp.lt": 1,
+        "coerce": 2,
+        "match": 1,
+        "replace": 1,
+        "bump_prerelease": 1,
+        "bump_build": 1,
+        "bump_major": 1,
+        "bump_minor": 1,
+        "bump_patch": 1,
+    }
+    assert all(stats.errors == 0 and stats.time > 0 for stats in operations.values())
+
+
+def test_should_count_errors(instrumented):
+    with pytest.raises(ValueError):
+        Version.parse("1.2")
+    with pytest.raises(TypeError):
+        Version(1).compare(1)
+    operations = instrumented.snapshot().operations
+    assert operations["parse"].errors == 1
+    assert operations["coerce"] == Stats(1, 1, operations["coerce"].time)
+
+
+def test_should_count_subclasses(instrumented):
+    class SubVersion(Version):
+        pass
+
+    SubVersion.parse("1.0.0").compare("1.0.0")
+    assert calls("parse") == 2
+    assert calls("compare") == 1
+
+
+def test_should_count_commands(instrumented, capsys, monkeypatch):
+    assert main(["bump", "major", "1.2.3"]) == 0
+    assert main(["check", "1.2"]) == 2
+    monkeypatch.setattr("sys.stdin", iter(["1.0.0\n", "2.0.0\n"]))
+    assert main(["bump", "minor", "--batch"]) == 0
+    request = {"cmd": "compare", "a": "1.0.0", "b": "2.0.0"}
+    assert server.handle(request) == {"result": "-1"}
+    assert server.handle({"cmd": "unknown"})["error"]
+    assert server.handle([])["error"]
+    capsys.readouterr()
+
+    operations = instrumented.snapshot().operations
+    assert operations["cli.bump"].calls == 2
+    assert operations["cli.check"].errors == 1
+    assert operations["cli.compare"].calls == 1
+    assert "cli.unknown" not in operations
+
+
+def test_should_not_count_without_command(instrumented):
+    with pytest.raises(SystemExit):
+        main([])
+    assert not any(name.startswith("cli") for name in instrumented.snapshot()[0])
+
+
+def test_should_reset_counters(instrumented):
+    Version.parse("1.0.0")
+    instrumented.reset()
+    assert instrumented.snapshot().operations == {}
+    Version.parse("1.0.0")
+    assert calls("parse") == 1
+
+
+def test_should_keep_counters_when_disabled(instrumented):
+    Version.parse("1.0.0")
+    instrumented.disable()
+    Version.parse("1.0.0")
+    assert calls("parse") == 1
+
+
+def test_snapshot_should_contain_caches(instrumented):
+    Version(1).match(">=1.0.0")
+    caches = instrumented.snapshot().caches
+    assert {"parse", "match", "coerce", "range"} <= set(caches)
+    assert caches["match"].currsize >= 1
+
+
+def test_snapshot_without_range_cache(instrumented, monkeypatch):
+    monkeypatch.delitem(sys.modules, "semver.range")
+    assert set(instrumented.snapshot().caches) == {"parse", "match", "coerce"}
+
+
+def test_should_export_snapshots(instrumented):
+    exported = []
+    instrumented.add_exporter(exported.append)
+    try:
+        Version.parse("1.0.0")
+        snapshot = instrumented.export()
+    finally:
+        instrumented.remove_exporter(exported.append)
+    assert exported == [snapshot]
+    assert snapshot.operations["parse"].calls == 1
+    instrumented.export()
+    assert len(exported) == 1
+    with pytest.raises(ValueError):
+        instrumented.remove_exporter(exported.append)
+
+
+def test_should_not_track_coercion_sites_by_default(instrumented):
+    for version in [Version(1), Version(2)]:
+        assert version > "0.1.0"
+    assert instrumented.snapshot().coercion_sites == []
+
+
+def test_should_track_coercion_sites(instrumented):
+    instrumented.enable(coercion_sites=True)
+    versions = [Version(1, minor) for minor in range(5)]
+    with pytest.warns(CoercionWarning, match="'1.2.0' is converted into a Version"):
+        newer = [v for v in versions if v > "1.2.0"]
+    newer_line = sys._getframe().f_lineno - 1
+    versions[0].compare((1, 0, 0))
+    compare_line = sys._getframe().f_lineno - 1
+
+    sites = instrumented.snapshot().coercion_sites
+    assert [(site.lineno, site.count, site.operand) for site in sites] == [
+        (newer_line, 5, "1.2.0"),
+        (compare_line, 1, (1, 0, 0)),
+    ]
+    assert sites[0].filename == __file__
+    assert sites[1].function == "test_should_track_coercion_sites"
+    assert len(newer) == 2
+
+    instrumented.reset()
+    assert instrumented.snapshot().coercion_sites == []
+
+
+def test_should_warn_once_per_site(instrumented, recwarn):
+    instrumented.enable(coercion_sites=True)
+    for minor in range(5):
+        Version(1, minor).compare("1.0.0")
+    assert len(recwarn.list) == 1
+    assert recwarn.list[0].category is CoercionWarning
+    assert recwarn.list[0].lineno == sys._getframe().f_lineno - 3
+
+
+def test_should_stop_tracking_coercion_sites(instrumented):
+    instrumented.enable(coercion_sites=True)
+    instrumented.enable()
+    Version(1).compare("1.0.0")
+    instrumented.enable(coercion_sites=True)
+    instrumented.disable()
+    instrumented.enable()
+    Version(1).compare("1.0.0")
+    assert instrumented.snapshot().coercion_sites == []
+
+
+def test_should_count_comparison_operators(instrumented):
+    a, b = Version(1), Version(2)
+    assert a < b
+    assert a != b
+    assert not a == b  # noqa: SIM201
+    assert a <= b and b > a and b >= a
+    assert sorted([b, a]) == [a, b]
+    assert a in {a: 1}
+
+    operations = instrumented.snapshot().operations
+    counts = {name: stats.calls for name, stats in operations.items()}
+    assert counts["cmp.lt"] == 2
+    assert counts["cmp.eq"] >= 1
+    assert all(counts[f"cmp.{op}"] == 1 for op in ("ne", "le", "gt", "ge"))
+    assert hash(a) == hash(Version(1))
+
+
+def test_should_count_sorted(instrumented):
+    versions = [Version(1, minor) for minor in (3, 1, 2, 0)]
+    sorted(versions)
+    assert calls("cmp.lt") >= len(versions) - 1
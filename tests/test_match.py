@@ -1,6 +1,7 @@
 import pytest
+from semverwithvprefix import SemVerWithVPrefix
 
-from semver import match
+from semver import Version, compile_match, match, match_cache
 
 
 def test_should_match_simple():
@@ -64,3 +65,58 @@ def test_should_raise_value_error_for_unexpected_match_expression(left, right):
 def test_should_raise_value_error_for_invalid_match_expression(left, right):
     with pytest.raises(ValueError):
         match(left, right)
+
+
+@pytest.mark.parametrize(
+    "expr", [">=1.0.0", "<1.0.0", ">1.0.0", "<=1.0.0", "==1.0.0", "!=1.0.0", "1.0.0"]
+)
+@pytest.mark.parametrize("version", ["0.9.0", "1.0.0-rc.1", "1.0.0+b", "2.0.0"])
+def test_compile_match_agrees_with_match(expr, version):
+    predicate = compile_match(expr)
+    expected = Version.parse(version).match(expr)
+    assert predicate(version) is expected
+    assert predicate(Version.parse(version)) is expected
+    assert predicate(Version.parse(version).to_tuple()) is expected
+
+
+def test_compile_match_with_version_class():
+    predicate = compile_match(">=v1.2.0", version_class=SemVerWithVPrefix)
+    assert predicate("v1.3.0") is True
+    assert predicate(SemVerWithVPrefix(1, 1, 0)) is False
+
+
+def test_compile_match_names_predicate():
+    assert compile_match(">=1.0.0").__name__ == "match('>=1.0.0')"
+
+
+@pytest.mark.parametrize("expr", ["=>1.0.0", ">=1.0", ""])
+def test_compile_match_raises_value_error(expr):
+    with pytest.raises(ValueError):
+        compile_match(expr)
+
+
+def test_match_uses_cache():
+    match_cache.clear()
+    version = Version(1, 2, 3)
+    assert version.match(">=1.0.0")
+    assert not version.match(">=2.0.0")
+    assert version.match(">=1.0.0")
+    info = match_cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+def test_match_cache_is_keyed_on_class():
+    match_cache.clear()
+    assert Version(1, 2, 3).match("1.2.3")
+    assert SemVerWithVPrefix(1, 2, 3).match("==v1.2.3")
+    assert match_cache.info().currsize == 2
+
+
+def test_match_works_with_disabled_cache():
+    match_cache.resize(0)
+    try:
+        assert Version(1, 2, 3).match(">1.0.0")
+        assert len(match_cache) == 0
+    finally:
+        match_cache.resize(512)
+        match_cache.clear()
@@ -0,0 +1,102 @@
+import pytest
+
+from semver import Version, parse_cache
+from semver._cache import CacheInfo, LRUCache
+
+
+@pytest.fixture
+def cache():
+    parse_cache.resize(4)
+    parse_cache.clear()
+    yield parse_cache
+    parse_cache.resize(0)
+    parse_cache.clear()
+
+
+def test_parse_cache_is_disabled_by_default():
+    assert parse_cache.maxsize == 0
+    assert Version.parse("1.2.3") is not Version.parse("1.2.3")
+    assert parse_cache.info() == CacheInfo(0, 0, 0, 0, 0)
+
+
+def test_parse_cache_returns_shared_instances(cache):
+    v1 = Version.parse("1.2.3-rc.1")
+    v2 = Version.parse("1.2.3-rc.1")
+    assert v1 is v2
+    assert cache.info() == CacheInfo(
+        hits=1, misses=1, evictions=0, maxsize=4, currsize=1
+    )
+
+
+def test_parse_cache_key_contains_optional_minor_and_patch(cache):
+    v1 = Version.parse("1.2.3")
+    v2 = Version.parse("1.2.3", optional_minor_and_patch=True)
+    assert v1 == v2
+    assert v1 is not v2
+    assert len(cache) == 2
+
+
+def test_parse_cache_keeps_subclasses_apart(cache):
+    class SemVerSubclass(Version):
+        pass
+
+    v1 = Version.parse("1.2.3")
+    v2 = SemVerSubclass.parse("1.2.3")
+    assert type(v1) is Version
+    assert type(v2) is SemVerSubclass
+    assert SemVerSubclass.parse("1.2.3") is v2
+
+
+def test_parse_cache_evicts_least_recently_used(cache):
+    first = Version.parse("1.0.0")
+    for version in ("2.0.0", "3.0.0", "4.0.0"):
+        Version.parse(version)
+    # Mark 1.0.0 as recently used, so 2.0.0 is evicted next
+    assert Version.parse("1.0.0") is first
+    Version.parse("5.0.0")
+    assert cache.info().evictions == 1
+    assert Version.parse("1.0.0") is first
+    assert cache.info().misses == 5
+
+
+def test_parse_cache_does_not_store_invalid_versions(cache):
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            Version.parse("1.2")
+    with pytest.raises(TypeError):
+        Version.parse(["1.2.3"])  # type: ignore
+    assert len(cache) == 0
+
+
+def test_parse_cache_resize_and_clear(cache):
+    for version in ("1.0.0", "2.0.0", "3.0.0"):
+        Version.parse(version)
+    cache.resize(1)
+    assert cache.info() == CacheInfo(0, 3, 2, 1, 1)
+    cache.clear()
+    assert cache.info() == CacheInfo(0, 0, 0, 1, 0)
+    cache.resize(0)
+    Version.parse("1.0.0")
+    assert len(cache) == 0
+
+
+def test_lru_cache():
+    disabled = LRUCache()
+    disabled.put("a", 1)
+    assert len(disabled) == 0
+
+    lru = LRUCache(2)
+    assert repr(lru) == "LRUCache(maxsize=2)"
+    assert lru.get("a", 42) == 42
+    lru.put("a", 1)
+    lru.put("a", 2)
+    assert lru.get("a") == 2
+    with pytest.raises(ValueError, match="must not be negative"):
+        lru.resize(-1)
+
+
+def test_parse_many_uses_cache_with_optional_minor_and_patch(cache):
+    v1 = Version.parse("1.2", optional_minor_and_patch=True)
+    result = Version.parse_many(["1.2", "1"], optional_minor_and_patch=True)
+    assert result.versions == [Version(1, 2), Version(1)]
+    assert result.versions[0] is v1
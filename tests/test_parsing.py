@@ -1,4 +1,7 @@
+import re
+
 import pytest
+from semverwithvprefix import SemVerWithVPrefix
 
 from semver import Version, parse, parse_version_info
 
@@ -205,3 +208,160 @@ def test_next_version_with_versioninfo(version, part, expected):
     next_version = ver.next_version(part)
     assert isinstance(next_version, Version)
     assert str(next_version) == expected
+
+
+def _conformance_corpus():
+    cores = ["0", "1", "01", "1.2", "1.02", "0.0.0", "1.2.3", "10.20.30", "1.2.3.4"]
+    cores += ["", ".", "1.", ".1", "1..3", "a.b.c", "1.2.3 ", " 1.2.3", "1\u0661.2.3"]
+    prereleases = [None, "", "0", "00", "01", "10", "rc", "rc.1", "alpha.1.2"]
+    prereleases += ["0f", "0foo.1", "-", "--", "a..b", "rc.", ".rc", "r_c", "\u0661a"]
+    prereleases += ["a\u0661", "\u0661", "x-y-z.--", "1-a.01-b"]
+    builds = [None, "", "0", "001", "build.11.e0f985a", "-", "a..b", "b.", "b+c"]
+    builds += ["\u0661", "b_1"]
+    for core in cores:
+        for prerelease in prereleases:
+            for build in builds:
+                version = core
+                if prerelease is not None:
+                    version += "-" + prerelease
+                if build is not None:
+                    version += "+" + build
+                yield version
+                yield version + "\n"
+    yield from ("", "\n", "\n1.2.3", "1.2.3\n\n", "1.2.3\r", "v1.2.3", "-1.2.3")
+
+
+@pytest.mark.parametrize("optional_minor_and_patch", [False, True])
+def test_scanner_conforms_to_regex(optional_minor_and_patch):
+    from semver._parser import scan
+
+    for version in _conformance_corpus():
+        assert scan(version, optional_minor_and_patch) == Version._parse_with_regex(
+            version, optional_minor_and_patch
+        ), version
+
+
+@pytest.mark.parametrize("version", ["1.2.3-", "1.2.3+", "1.2.3-rc..1", "1"])
+def test_parse_engines_raise_the_same_error(version):
+    class RegexVersion(Version):
+        _REGEX = Version._REGEX
+
+    assert RegexVersion._PARSE_WITH_REGEX
+    for cls in (Version, RegexVersion):
+        with pytest.raises(ValueError, match=re.escape(f"{version} is not valid")):
+            cls.parse(version)
+
+
+def test_parse_uses_customized_regex_in_subclass():
+    class DateVersion(Version):
+        _REGEX = re.compile(
+            r"(?P<major>\d{4})\.(?P<minor>\d\d)\.(?P<patch>\d\d)"
+            r"(?:-(?P<prerelease>\w+))?(?:\+(?P<build>\w+))?$"
+        )
+
+    assert DateVersion.parse("2024.01.05-rc1") == Version(2024, 1, 5, "rc1")
+    with pytest.raises(ValueError):
+        Version.parse("2024.01.05")
+
+
+def test_parse_many():
+    result = Version.parse_many(["1.2.3", b"2.0.0-rc.1", "3.0.0+build.1"])
+    assert result.versions == [
+        Version(1, 2, 3),
+        Version(2, 0, 0, "rc.1"),
+        Version(3, 0, 0, None, "build.1"),
+    ]
+    assert result.errors == []
+
+
+def test_parse_many_with_str_subclass():
+    class Tag(str):
+        pass
+
+    assert Version.parse_many([Tag("1.2.3")]).versions == [Version(1, 2, 3)]
+
+
+def test_parse_many_with_optional_minor_and_patch():
+    result = Version.parse_many(["1", "1.2"], optional_minor_and_patch=True)
+    assert result.versions == [Version(1), Version(1, 2)]
+
+
+INVALID_ITEMS = ["1.2.3", "1.2", 42, b"\xff", "4.5.6"]
+
+
+def test_parse_many_raises_on_first_error():
+    with pytest.raises(ValueError, match=r"^item 1: 1\.2 is not valid SemVer string$"):
+        Version.parse_many(INVALID_ITEMS)
+    with pytest.raises(TypeError, match=r"^item 0: not expecting type"):
+        Version.parse_many([42])
+    with pytest.raises(ValueError, match=r"^item 0: 'utf-8' codec"):
+        Version.parse_many([b"\xff"])
+
+
+def test_parse_many_skips_errors():
+    result = Version.parse_many(INVALID_ITEMS, on_error="skip")
+    assert result.versions == [Version(1, 2, 3), Version(4, 5, 6)]
+    assert result.errors == []
+
+
+def test_parse_many_collects_errors():
+    result = Version.parse_many(iter(INVALID_ITEMS), on_error="collect")
+    assert result.versions == [Version(1, 2, 3), Version(4, 5, 6)]
+    assert [(e.index, e.input) for e in result.errors] == [
+        (1, "1.2"),
+        (2, 42),
+        (3, b"\xff"),
+    ]
+    assert result.errors[0].reason == "1.2 is not valid SemVer string"
+    assert result.errors[1].reason == "not expecting type '<class 'int'>'"
+
+
+def test_parse_many_with_invalid_on_error():
+    with pytest.raises(ValueError, match="on_error must be one of"):
+        Version.parse_many([], on_error="ignore")
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_parse_many_in_subclass_with_own_parse(cache):
+    from semver import parse_cache
+
+    class SemVerWithVPrefix(Version):
+        @classmethod
+        def parse(cls, version, optional_minor_and_patch=False):
+            if version[:1] not in ("v", b"v"):
+                raise ValueError(f"{version!r}: must start with 'v'")
+            return super().parse(version[1:], optional_minor_and_patch)
+
+    parse_cache.resize(16 if cache else 0)
+    try:
+        result = SemVerWithVPrefix.parse_many(
+            ["v1.2.3", "1.2.3", "v1.2", 42], on_error="collect"
+        )
+    finally:
+        parse_cache.resize(0)
+        parse_cache.clear()
+    assert result.versions == [Version(1, 2, 3)]
+    assert type(result.versions[0]) is SemVerWithVPrefix
+    assert [e.reason for e in result.errors] == [
+        "'1.2.3': must start with 'v'",
+        "1.2 is not valid SemVer string",
+        "'int' object is not subscriptable",
+    ]
+
+
+def test_parse_many_in_subclass_with_own_regex():
+    class DateVersion(Version):
+        _REGEX = re.compile(r"(?P<major>\d{4})\.(?P<minor>\d\d)\.(?P<patch>\d\d)$")
+
+    result = DateVersion.parse_many(["2024.01.05", "1.2.3"], on_error="collect")
+    assert result.versions == [Version(2024, 1, 5)]
+    assert [e.index for e in result.errors] == [1]
+
+
+def test_parse_many_with_custom_parse_method():
+    # SemVerWithVPrefix.parse has no optional_minor_and_patch parameter
+    result = SemVerWithVPrefix.parse_many(["v1.2.3", "1.2.3", "V2"], on_error="collect")
+    assert result.versions == [SemVerWithVPrefix(1, 2, 3), SemVerWithVPrefix(2)]
+    assert all(type(v) is SemVerWithVPrefix for v in result.versions)
+    assert [(e.index, e.input) for e in result.errors] == [(1, "1.2.3")]
+    assert "Must start with 'v' or 'V'" in result.errors[0].reason
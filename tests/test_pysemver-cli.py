@@ -1,5 +1,7 @@
+import json
 from argparse import Namespace
 from contextlib import contextmanager
+from io import StringIO
 from unittest.mock import patch
 
 import pytest
@@ -11,6 +13,7 @@ from semver import (
     cmd_nextver,
     createparser,
     main,
+    Version,
     __main__,
 )
 
@@ -41,7 +44,7 @@ def test_should_parse_cli_arguments(cli, expected):
     parser = createparser()
     assert parser
     result = parser.parse_args(cli)
-    del result.func
+    del result.func, result.command_parser
     assert result == expected
 
 
@@ -142,3 +145,336 @@ def test_main_file_should_call_cli_main(package_name):
         with patch("semver.__main__.__package__", package_name):
             __main__.main()
             mocked_main.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "cli,stdin,out,err",
+    [
+        (["bump", "minor", "--batch"], "1.2.3\n\n2.0.0-rc.1\n", "1.3.0\n2.1.0\n", ""),
+        (["check", "--batch", "-"], "1.2.3\n1.2\n", "", "ERROR line 2: "),
+        (["compare", "--batch"], "1.2.3 2.0.0\n2.0.0 2.0.0\n", "-1\n0\n", ""),
+        (["compare", "2.0.0", "--batch"], "1.2.3\n3.0.0\n", "1\n-1\n", ""),
+        (
+            ["nextver", "--batch"],
+            "1.2.3 minor\n1.2.3-rc.1 patch\n",
+            "1.3.0\n1.2.3\n",
+            "",
+        ),
+        (["nextver", "1.2.3", "--batch"], "major\npatch\n", "2.0.0\n1.2.4\n", ""),
+    ],
+)
+def test_should_process_batch_from_stdin(cli, stdin, out, err, capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", StringIO(stdin))
+    rc = main(cli)
+    captured = capsys.readouterr()
+    assert rc == (2 if err else 0)
+    assert captured.out == out
+    assert captured.err.startswith(err)
+
+
+def test_should_continue_batch_after_errors(capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", StringIO("1.2\n1.0.0 2.0.0\n1.2.3\nx y\n"))
+    rc = main(["bump", "patch", "--batch"])
+    captured = capsys.readouterr()
+    assert rc == 2
+    assert captured.out == "1.2.4\n"
+    assert captured.err.splitlines() == [
+        "ERROR line 1: 1.2 is not valid SemVer string",
+        "ERROR line 2: Expected 1 argument(s), but got 2",
+        "ERROR line 4: Expected 1 argument(s), but got 2",
+    ]
+
+
+def test_should_process_batch_from_file(tmp_path, capsys):
+    manifest = tmp_path / "versions.txt"
+    manifest.write_text("1.2.3\n1.0.0-rc.1\n")
+    rc = main(["bump", "major", "--batch", str(manifest)])
+    assert rc == 0
+    assert capsys.readouterr().out == "2.0.0\n2.0.0\n"
+
+
+def test_should_fail_batch_with_missing_file(tmp_path):
+    with pytest.raises(SystemExit) as excinfo:
+        main(["check", "--batch", str(tmp_path / "missing.txt")])
+    assert excinfo.value.code == 2
+
+
+@pytest.mark.parametrize(
+    "cli,command",
+    [
+        (["compare", "1.2.3"], "compare"),
+        (["check"], "check"),
+        (["nextver", "1.0.0"], "nextver"),
+        (["bump", "minor"], "bump minor"),
+    ],
+)
+def test_should_require_arguments_without_batch(cli, command, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        main(cli)
+    err = capsys.readouterr().err
+    assert excinfo.value.code == 2
+    assert err.startswith(f"usage: semver {command} ")
+    assert "the following arguments are required" in err
+
+
+SORT_INPUT = "1.0.0\n2.0.0-rc.1\n2.0.0\n1.0.0+build.1\n\n1.10.0\n2.0.0-alpha\n"
+
+
+@pytest.mark.parametrize(
+    "options,out",
+    [
+        (
+            [],
+            ["1.0.0", "1.0.0+build.1", "1.10.0", "2.0.0-alpha", "2.0.0-rc.1", "2.0.0"],
+        ),
+        (
+            ["--reverse"],
+            ["2.0.0", "2.0.0-rc.1", "2.0.0-alpha", "1.10.0", "1.0.0", "1.0.0+build.1"],
+        ),
+        (["--unique"], ["1.0.0", "1.10.0", "2.0.0-alpha", "2.0.0-rc.1", "2.0.0"]),
+        (["--latest", "2"], ["2.0.0-rc.1", "2.0.0"]),
+        (
+            ["--latest", "5"],
+            ["1.0.0+build.1", "1.10.0", "2.0.0-alpha", "2.0.0-rc.1", "2.0.0"],
+        ),
+        (
+            ["--latest", "5", "-r"],
+            ["2.0.0", "2.0.0-rc.1", "2.0.0-alpha", "1.10.0", "1.0.0"],
+        ),
+        (
+            ["-u", "-r", "--latest", "4"],
+            ["2.0.0", "2.0.0-rc.1", "2.0.0-alpha", "1.10.0"],
+        ),
+    ],
+)
+def test_should_sort_versions_from_stdin(options, out, capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", StringIO(SORT_INPUT))
+    rc = main(["sort", *options])
+    captured = capsys.readouterr()
+    assert rc == 0
+    assert captured.out.splitlines() == out
+
+
+@pytest.mark.parametrize("latest", ["0", "-1", "x"])
+def test_should_reject_latest_below_one(latest, capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", StringIO(SORT_INPUT))
+    with pytest.raises(SystemExit) as excinfo:
+        main(["sort", "--latest", latest])
+    captured = capsys.readouterr()
+    assert excinfo.value.code == 2
+    assert "invalid positive integer" in captured.err
+    assert captured.out == ""
+
+
+@pytest.mark.parametrize("options", [[], ["-r"], ["-u"], ["--latest", "3"]])
+def test_should_sort_like_sort_key(options, capsys, monkeypatch):
+    versions = [
+        f"{major}.{minor}.0-rc.{pre}" if pre else f"{major}.{minor}.0"
+        for major in range(3)
+        for minor in (10, 2, 1)
+        for pre in (0, 2, 1, 0)
+    ]
+    monkeypatch.setattr("sys.stdin", StringIO("\n".join(versions)))
+    assert main(["sort", *options]) == 0
+    expected = sorted(versions, key=Version.parse, reverse="-r" in options)
+    if "-u" in options:
+        expected = list(dict.fromkeys(expected))
+    if "--latest" in options:
+        expected = expected[-3:]
+    assert capsys.readouterr().out.splitlines() == expected
+
+
+@pytest.mark.parametrize(
+    "cli,out",
+    [
+        (["filter", "^1.2"], ["1.2.0", "1.10.0", "1.2.0"]),
+        (["filter", ">=1.5 <2.0.0"], ["2.0.0-rc.1", "1.10.0"]),
+        (["filter", "3.x"], []),
+    ],
+)
+def test_should_filter_versions_from_stdin(cli, out, capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", StringIO("1.2.0\n2.0.0-rc.1\n1.10.0\n1.2.0\n"))
+    rc = main(cli)
+    captured = capsys.readouterr()
+    assert rc == 0
+    assert captured.out.splitlines() == out
+
+
+@pytest.mark.parametrize("cli", [["sort"], ["filter", "*"]])
+def test_should_report_invalid_lines(cli, capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", StringIO("1.2\n1.0.0\nv1.1.0\n"))
+    rc = main(cli)
+    captured = capsys.readouterr()
+    assert rc == 2
+    assert captured.out == "1.0.0\n"
+    assert captured.err.splitlines() == [
+        "ERROR line 1: Invalid version '1.2'",
+        "ERROR line 3: Invalid version 'v1.1.0'",
+        "ERROR Found 2 invalid version(s)",
+    ]
+
+
+@pytest.mark.parametrize("cli", [["sort"], ["filter", "*"]])
+def test_should_skip_invalid_lines(cli, capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", StringIO("1.2\n1.0.0\nv1.1.0\n"))
+    rc = main([*cli, "--skip-invalid"])
+    captured = capsys.readouterr()
+    assert rc == 0
+    assert captured.out == "1.0.0\n"
+    assert captured.err == ""
+
+
+def test_should_fail_filter_with_invalid_range(capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", StringIO("1.0.0\n"))
+    assert main(["filter", ">=1.2.3.4"]) == 2
+    assert capsys.readouterr().err.startswith("ERROR")
+
+
+def parts(major, minor, patch, prerelease=None, build=None):
+    return {
+        "major": major,
+        "minor": minor,
+        "patch": patch,
+        "prerelease": prerelease,
+        "build": build,
+    }
+
+
+@pytest.mark.parametrize("format", ["json", "ndjson"])
+@pytest.mark.parametrize(
+    "cli,record,rc",
+    [
+        (
+            ["compare", "1.2.3", "2.0.0"],
+            {"input": "1.2.3 2.0.0", "parsed": parts(1, 2, 3), "result": "-1"},
+            0,
+        ),
+        (
+            ["bump", "minor", "1.2.3-rc.1+b.1"],
+            {
+                "input": "1.2.3-rc.1+b.1",
+                "parsed": parts(1, 2, 3, "rc.1", "b.1"),
+                "result": "1.3.0",
+            },
+            0,
+        ),
+        (
+            ["check", "1.2.3"],
+            {"input": "1.2.3", "parsed": parts(1, 2, 3), "result": None},
+            0,
+        ),
+        (
+            ["check", "1.2"],
+            {"input": "1.2", "parsed": None, "error": "Invalid version '1.2'"},
+            2,
+        ),
+        (
+            ["nextver", "1.2.3", "foo"],
+            {"input": "1.2.3 foo", "parsed": parts(1, 2, 3), "result": None},
+            2,
+        ),
+    ],
+)
+def test_should_write_single_record(format, cli, record, rc, capsys):
+    assert main(["--format", format, *cli]) == rc
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert captured.out.count("\n") == 1
+    written = json.loads(captured.out)
+    assert written.keys() == {"input", "parsed", "result", "error"}
+    assert {key: written[key] for key in record} == record
+    assert (written["error"] is not None) == bool(rc)
+
+
+BATCH_RECORDS = [
+    {
+        "input": "1.2.3",
+        "parsed": parts(1, 2, 3),
+        "result": "1.3.0",
+        "error": None,
+        "line": 1,
+    },
+    {
+        "input": "1.2",
+        "parsed": None,
+        "result": None,
+        "error": "1.2 is not valid SemVer string",
+        "line": 3,
+    },
+]
+
+
+def test_should_write_ndjson_stream(capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", StringIO("1.2.3\n\n1.2\n"))
+    assert main(["--format", "ndjson", "bump", "minor", "--batch"]) == 2
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert [json.loads(line) for line in captured.out.splitlines()] == BATCH_RECORDS
+
+
+def test_should_report_parsed_version_of_each_batch_line(capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", StringIO("1.0.0 2.0.0\n1 2 3\n3.0.0\n4.0.0 1\n"))
+    assert main(["--format", "ndjson", "compare", "--batch"]) == 2
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(r["line"], r["parsed"]) for r in records] == [
+        (1, parts(1, 0, 0)),
+        (2, None),
+        (3, None),
+        (4, parts(4, 0, 0)),
+    ]
+    assert records[1]["error"] == "Expected 2 argument(s), but got 3"
+
+
+def test_should_write_json_array_stream(capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", StringIO("1.2.3\n\n1.2\n"))
+    assert main(["--format", "json", "bump", "minor", "--batch"]) == 2
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert json.loads(captured.out) == BATCH_RECORDS
+    # Each record is written on its own line
+    assert len(captured.out.splitlines()) == 4
+
+
+@pytest.mark.parametrize(
+    "cli,stdin,records,rc",
+    [
+        (["sort"], "", [], 0),
+        (
+            ["sort", "-r"],
+            "1.0.0\nfoo\n2.0.0-rc.1\n",
+            [
+                {"input": "foo", "error": "Invalid version 'foo'", "line": 2},
+                {"input": "2.0.0-rc.1", "parsed": parts(2, 0, 0, "rc.1")},
+                {"input": "1.0.0", "result": "1.0.0"},
+            ],
+            2,
+        ),
+        (
+            ["filter", "^1"],
+            "1.0.0\n2.0.0\n",
+            [{"input": "1.0.0", "result": "1.0.0", "error": None}],
+            0,
+        ),
+        (
+            ["filter", ">=1.2.3.4"],
+            "1.0.0\n",
+            [{"input": None, "parsed": None, "result": None}],
+            2,
+        ),
+    ],
+)
+@pytest.mark.parametrize("format", ["json", "ndjson"])
+def test_should_write_records_of_sort_and_filter(
+    format, cli, stdin, records, rc, capsys, monkeypatch
+):
+    monkeypatch.setattr("sys.stdin", StringIO(stdin))
+    assert main(["--format", format, *cli]) == rc
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    if format == "json":
+        written = json.loads(captured.out)
+    else:
+        written = [json.loads(line) for line in captured.out.splitlines()]
+    assert len(written) == len(records)
+    for record, expected in zip(written, records):
+        assert {key: record[key] for key in expected} == expected
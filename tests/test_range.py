@@ -0,0 +1,286 @@
+import random
+
+import pytest
+
+from semver import Version
+from semver.range import ConstraintIndex, VersionRange, range_cache
+
+
+@pytest.mark.parametrize(
+    "expr, normalized",
+    [
+        ("1.2.3", "=1.2.3"),
+        ("=1.2.3", "=1.2.3"),
+        ("==v1.2.3+build", "=1.2.3"),
+        ("^1.2.3", ">=1.2.3 <2.0.0-0"),
+        ("^1.2.3-beta.2", ">=1.2.3-beta.2 <2.0.0-0"),
+        ("^0.2.3", ">=0.2.3 <0.3.0-0"),
+        ("^0.0.3", ">=0.0.3 <0.0.4-0"),
+        ("^0.0", ">=0.0.0 <0.1.0-0"),
+        ("^0", ">=0.0.0 <1.0.0-0"),
+        ("^1.2.x", ">=1.2.0 <2.0.0-0"),
+        ("^*", "*"),
+        ("~1.2.3", ">=1.2.3 <1.3.0-0"),
+        ("~1.2", ">=1.2.0 <1.3.0-0"),
+        ("~1", ">=1.0.0 <2.0.0-0"),
+        ("~*", "*"),
+        ("1.x", ">=1.0.0 <2.0.0-0"),
+        ("1.X.3", ">=1.0.0 <2.0.0-0"),
+        ("1.2.*", ">=1.2.0 <1.3.0-0"),
+        ("1.2", ">=1.2.0 <1.3.0-0"),
+        ("*", "*"),
+        ("", "*"),
+        (">1.2.3", ">1.2.3"),
+        (">1.2", ">=1.3.0-0"),
+        (">=1.2", ">=1.2.0"),
+        ("<1.2", "<1.2.0"),
+        ("<=1.2", "<1.3.0-0"),
+        ("<=1.2.3", "<=1.2.3"),
+        ("!=1.2.3", "<1.2.3 || >1.2.3"),
+        ("!=1.x", "<1.0.0 || >=2.0.0-0"),
+        (">*", "<0.0.0-0 >0.0.0-0"),
+        ("<*", "<0.0.0-0 >0.0.0-0"),
+        ("!=*", "<0.0.0-0 >0.0.0-0"),
+        (">=*", "*"),
+        ("<=*", "*"),
+        ("1.2.3 - 2.3", ">=1.2.3 <2.4.0-0"),
+        ("1 - 2.3.4", ">=1.0.0 <=2.3.4"),
+        ("* - 2", "<3.0.0-0"),
+        ("1.2.3 - *", ">=1.2.3"),
+        (">= 1.0.0", ">=1.0.0"),
+        (">=1.0.0, <1.5 || >=1.4 <3", ">=1.0.0 <3.0.0"),
+        ("1.0.0 || 1.0.0", "=1.0.0"),
+        ("<1.0.0 || >=1.0.0", "*"),
+        ("<=1.0.0 || >1.0.0", "*"),
+        ("<1.0.0 || >1.0.0", "<1.0.0 || >1.0.0"),
+        (">1.0.0 <=1.0.0", "<0.0.0-0 >0.0.0-0"),
+        (">=1.0.0 <1.0.0 || ~2", ">=2.0.0 <3.0.0-0"),
+        ("^1 || ^3 || ^2", ">=1.0.0 <2.0.0-0 || >=2.0.0 <3.0.0-0 || >=3.0.0 <4.0.0-0"),
+        ("^1 || >=2.0.0-0 <3", ">=1.0.0 <3.0.0"),
+    ],
+)
+def test_should_normalize(expr, normalized):
+    assert str(VersionRange(expr)) == normalized
+
+
+@pytest.mark.parametrize(
+    "expr",
+    ["<0.0.0-0", ">3 <=1.0.1", "!=*", "!=1.2.3", "^1 || ~3.1", "1.2.3 - 2", "*"],
+)
+def test_should_compile_str_to_equal_range(expr):
+    vrange = VersionRange.compile(expr)
+    assert VersionRange.compile(str(vrange)) == vrange
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "1.2.3.4",
+        "=>1",
+        "01.2",
+        "1.2-beta",
+        "1.0.0 |",
+        ">=",
+        "v",
+        "a - b",
+        "1.2.3 - 1.2.3.4",
+    ],
+)
+def test_should_raise_on_invalid_expression(expr):
+    with pytest.raises(ValueError, match="Invalid"):
+        VersionRange(expr)
+
+
+@pytest.mark.parametrize(
+    "expr, version, expected",
+    [
+        ("^1.2.3", "1.2.3", True),
+        ("^1.2.3", "1.9.9", True),
+        ("^1.2.3", "1.2.2", False),
+        ("^1.2.3", "2.0.0", False),
+        ("^1.2.3", "2.0.0-rc.1", False),
+        ("^1.2.3", "1.5.0-rc.1", True),
+        ("~1.4.0", "1.4.7", True),
+        ("~1.4.0", "1.5.0", False),
+        ("1.x || >=3.0.0 <4", "1.0.0", True),
+        ("1.x || >=3.0.0 <4", "2.0.0", False),
+        ("1.x || >=3.0.0 <4", "3.5.0", True),
+        ("1.x || >=3.0.0 <4", "4.0.0", False),
+        ("1.x || >=3.0.0 <4", "4.0.0-rc.1", True),
+        ("!=1.2.3", "1.2.3", False),
+        ("!=1.2.3", "1.2.3+build", False),
+        ("!=1.2.3", "1.2.3-rc.1", True),
+        ("<0.0.0-0", "0.0.0-0", False),
+    ],
+)
+def test_contains(expr, version, expected):
+    version_range = VersionRange.compile(expr)
+    assert version_range.contains(version) is expected
+    assert (version in version_range) is expected
+    assert version_range.contains(Version.parse(version)) is expected
+
+
+@pytest.mark.parametrize(
+    "version", ["0.9.0", "1.0.0-rc.1", "1.0.0", "1.0.0+b", "1.0.1", "2.0.0"]
+)
+@pytest.mark.parametrize("op", ["<", "<=", ">", ">=", "==", "!="])
+def test_single_operator_agrees_with_match(op, version):
+    expr = f"{op}1.0.0"
+    assert VersionRange(expr).contains(version) is Version.parse(version).match(expr)
+
+
+def test_filter_keeps_items():
+    versions = ["0.9.0", Version.parse("1.2.0"), b"1.5.0", "2.0.0"]
+    result = list(VersionRange.compile("^1.0.0").filter(versions))
+    assert result == [versions[1], b"1.5.0"]
+
+
+def test_max_satisfying():
+    version_range = VersionRange.compile("^1.2")
+    assert version_range.max_satisfying(["1.2.0", "1.9.1", "2.0.0"]) == "1.9.1"
+    assert version_range.max_satisfying(["1.9.1+b", "1.9.1+a"]) == "1.9.1+b"
+    assert version_range.max_satisfying([Version(1, 3)]) == Version(1, 3)
+    assert version_range.max_satisfying(["0.1.0", "2.0.0"]) is None
+    assert version_range.max_satisfying([]) is None
+
+
+def test_compile_uses_cache():
+    range_cache.clear()
+    first = VersionRange.compile("^1.2.3")
+    assert VersionRange.compile("^1.2.3") is first
+    assert range_cache.info().hits == 1
+    assert VersionRange("^1.2.3") is not first
+
+
+def test_compile_keys_cache_on_class():
+    class MyRange(VersionRange):
+        pass
+
+    assert type(MyRange.compile("^9.9.9")) is MyRange
+    assert type(VersionRange.compile("^9.9.9")) is VersionRange
+
+
+def test_equality_and_hash():
+    assert VersionRange("^1.2.3") == VersionRange(">=1.2.3, <2.0.0-0")
+    assert VersionRange("^1.2.3") != VersionRange("~1.2.3")
+    assert hash(VersionRange("1.x")) == hash(VersionRange("^1"))
+    assert VersionRange("1.x") != "1.x"
+
+
+def test_expr_and_repr():
+    version_range = VersionRange(" ^1.2 ")
+    assert version_range.expr == " ^1.2 "
+    assert repr(version_range) == "VersionRange(' ^1.2 ')"
+
+
+def random_constraint(rng):
+    def version():
+        return f"{rng.randint(0, 3)}.{rng.randint(0, 3)}.{rng.randint(0, 3)}"
+
+    choice = rng.randrange(6)
+    if choice == 0:
+        return f"^{version()}"
+    if choice == 1:
+        return f"~{version()}"
+    if choice == 2:
+        return f"{rng.choice(['<', '<=', '>', '>=', '!=', '='])}{version()}"
+    if choice == 3:
+        return f"{version()} - {version()}"
+    if choice == 4:
+        return f">={version()} <{version()} || {rng.randint(0, 3)}.x"
+    return rng.choice(["*", ">*", f"{rng.randint(0, 3)}.{rng.randint(0, 3)}"])
+
+
+def test_constraint_index_agrees_with_linear_scan():
+    rng = random.Random(13)
+    index = ConstraintIndex()
+    expected = {}
+    probes = [
+        Version.parse(f"{a}.{b}.{c}{pre}")
+        for a in range(5)
+        for b in range(4)
+        for c in range(4)
+        for pre in ("", "-0", "-rc.1")
+    ]
+    for step in range(1500):
+        key = rng.randrange(400)
+        if key in expected and rng.random() < 0.4:
+            index.remove(key)
+            del expected[key]
+        else:
+            expected[key] = random_constraint(rng)
+            index.add(key, expected[key])
+        if step % 30 == 0:
+            for probe in rng.sample(probes, 5):
+                found = index.query(probe)
+                assert len(found) == len(set(found))
+                assert set(found) == {
+                    k
+                    for k, expr in expected.items()
+                    if probe in VersionRange.compile(expr)
+                }
+    assert len(index) == len(expected)
+
+
+def test_constraint_index_bulk_insert():
+    constraints = {f"dep{i}": f"^{i % 7}.{i % 5}" for i in range(1000)}
+    index = ConstraintIndex(constraints)
+    found = index.query(Version(3, 4, 1))
+    assert sorted(found) == sorted(
+        key for key, expr in constraints.items() if "3.4.1" in VersionRange(expr)
+    )
+    assert index._tree is not None
+    assert index._pending == []
+
+
+def test_constraint_index_accepts_pairs_and_ranges():
+    index = ConstraintIndex([("a", VersionRange("^1")), ("b", "2.x")])
+    assert index.query("1.5.0") == ["a"]
+    assert index.query(b"2.0.0") == ["b"]
+    assert index.query("3.0.0") == []
+
+
+def test_constraint_index_is_a_mapping():
+    index = ConstraintIndex()
+    index["a"] = "^1.2"
+    index["b"] = "~1.2.0"
+    assert index["a"] == VersionRange("^1.2")
+    assert list(index) == ["a", "b"]
+    assert "a" in index
+    index["a"] = ">=3.0.0"
+    assert index.query("1.2.5") == ["b"]
+    assert index.query("3.0.0") == ["a"]
+    del index["b"]
+    assert len(index) == 1
+    assert repr(index) == "ConstraintIndex({'a': '>=3.0.0'})"
+
+
+def test_constraint_index_removes_indexed_ranges():
+    index = ConstraintIndex(dict.fromkeys(range(100), "^1"))
+    assert len(index.query("1.0.0")) == 100
+    for i in range(60):
+        index.remove(i)
+    assert sorted(index.query("1.0.0")) == list(range(60, 100))
+    # The tree was rebuilt without the removed ranges
+    assert index._removed == 0
+    assert index._indexed == 40
+
+
+def test_constraint_index_handles_empty_ranges():
+    index = ConstraintIndex({"never": ">*"})
+    assert index.query("1.0.0") == []
+    index._rebuild()
+    assert index._tree is None
+    assert index.query("1.0.0") == []
+
+
+def test_constraint_index_raises():
+    index = ConstraintIndex()
+    with pytest.raises(KeyError):
+        index.remove("missing")
+    with pytest.raises(TypeError, match="Expected str or VersionRange"):
+        index.add("a", 1)
+    with pytest.raises(ValueError):
+        index.add("a", "=>1")
+    with pytest.raises(ValueError):
+        index.query("1.0")
@@ -4,7 +4,19 @@ from semver import Version
 
 
 @pytest.mark.parametrize(
-    "string,expected", [("rc", "rc"), ("rc.1", "rc.2"), ("2x", "3x")]
+    "string,expected",
+    [
+        ("rc", "rc"),
+        ("rc.1", "rc.2"),
+        ("2x", "3x"),
+        ("", ""),
+        ("9", "10"),
+        ("rc.9.x", "rc.10.x"),
+        ("1.2-rc3-", "1.2-rc4-"),
+        ("build.009", "build.010"),
+        ("build.099", "build.100"),
+        ("x\u0663", "x4"),
+    ],
 )
 def test_should_private_increment_string(string, expected):
     assert Version._increment_string(string) == expected
@@ -77,6 +89,48 @@ def test_should_versioninfo_isvalid():
     assert Version.is_valid("foo") is False
 
 
+@pytest.mark.parametrize(
+    "version,expected",
+    [("1.0.0-rc.1", True), (b"1.0.0", True), ("1.0", False), (b"\xff", False)],
+)
+def test_is_valid_does_not_create_versions(version, expected, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("unexpected call")
+
+    monkeypatch.setattr(Version, "__init__", fail)
+    monkeypatch.setattr(Version, "parse", fail)
+    assert Version.is_valid(version) is expected
+
+
+def test_is_valid_with_str_subclass():
+    class Tag(str):
+        pass
+
+    assert Version.is_valid(Tag("1.2.3"))
+
+
+def test_is_valid_raises_on_wrong_type():
+    with pytest.raises(TypeError, match="not expecting type"):
+        Version.is_valid(42)  # type: ignore
+
+
+def test_is_valid_in_subclasses():
+    class SemVerWithVPrefix(Version):
+        @classmethod
+        def parse(cls, version, optional_minor_and_patch=False):
+            if not version.startswith("v"):
+                raise ValueError(f"{version!r}: must start with 'v'")
+            return super().parse(version[1:], optional_minor_and_patch)
+
+    class ShortVersion(Version):
+        _REGEX = Version._REGEX_OPTIONAL_MINOR_AND_PATCH
+
+    assert SemVerWithVPrefix.is_valid("v1.2.3")
+    assert not SemVerWithVPrefix.is_valid("1.2.3")
+    assert ShortVersion.is_valid("1.2")
+    assert not ShortVersion.is_valid("1.2.x")
+
+
 def test_versioninfo_compare_should_raise_when_passed_invalid_value():
     with pytest.raises(TypeError):
         Version(1, 2, 3).compare(4)
@@ -0,0 +1,247 @@
+import json
+import shutil
+import socket
+import tempfile
+import threading
+from argparse import Namespace
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+from semver import cli, main, parse_cache
+from semver.server import create_server, handle, send, serve, to_request
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="requires Unix sockets"
+)
+
+
+@pytest.fixture
+def socket_path():
+    # Socket paths are limited to about 100 chars, so keep them short
+    directory = tempfile.mkdtemp(prefix="semver")
+    yield str(Path(directory, "s.sock"))
+    shutil.rmtree(directory)
+
+
+@pytest.fixture
+def server(socket_path):
+    server = create_server(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield socket_path
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize(
+    "request_,response",
+    [
+        ({"cmd": "compare", "a": "1.2.3", "b": "2.0.0"}, {"result": "-1"}),
+        ({"cmd": "bump", "part": "minor", "version": "1.2.3"}, {"result": "1.3.0"}),
+        ({"cmd": "check", "version": "1.2.3", "id": 1}, {"id": 1, "result": None}),
+        (
+            {"cmd": "nextver", "version": "1.2.3", "part": "major"},
+            {"result": "2.0.0"},
+        ),
+        ({"cmd": "check", "version": "1.2"}, {"error": "Invalid version '1.2'"}),
+        (
+            {"cmd": "bump", "part": "x", "version": "1.2.3"},
+            {"error": "Invalid argument 'x'"},
+        ),
+        ({"cmd": "compare", "a": "1.2.3"}, {"error": "Expected string field(s): b"}),
+        (
+            {"cmd": "check", "version": 1},
+            {"error": "Expected string field(s): version"},
+        ),
+        ({"cmd": "sort", "id": "a"}, {"id": "a", "error": "Unknown command 'sort'"}),
+        ({}, {"error": "Unknown command None"}),
+        ([], {"error": "Request must be a JSON object"}),
+    ],
+)
+def test_should_handle_request(request_, response):
+    assert handle(request_) == response
+
+
+@pytest.mark.parametrize(
+    "args,request_",
+    [
+        (
+            Namespace(func=cli.cmd_compare, version1="1.0.0", version2="2.0.0"),
+            {"cmd": "compare", "a": "1.0.0", "b": "2.0.0"},
+        ),
+        (
+            Namespace(func=cli.cmd_bump, bump="patch", version="1.0.0"),
+            {"cmd": "bump", "part": "patch", "version": "1.0.0"},
+        ),
+        (Namespace(func=cli.cmd_sort), None),
+    ],
+)
+def test_should_convert_arguments_to_request(args, request_):
+    assert to_request(args) == request_
+
+
+def test_should_answer_requests(server):
+    assert send(server, {"cmd": "compare", "a": "2.0.0", "b": "1.0.0"}) == {
+        "result": "1"
+    }
+
+
+def test_should_answer_many_lines_per_connection(server):
+    requests = [
+        b'{"cmd": "check", "version": "1.0.0", "id": 1}\n',
+        b"\n",
+        b"no json\n",
+        b'{"cmd": "check", "version": "1.0", "id": 2}\n',
+    ]
+    with socket.socket(socket.AF_UNIX) as sock:
+        sock.connect(server)
+        sock.sendall(b"".join(requests))
+        sock.shutdown(socket.SHUT_WR)
+        responses = [json.loads(line) for line in sock.makefile("rb")]
+    assert responses[0] == {"id": 1, "result": None}
+    assert responses[1]["error"].startswith("Invalid JSON:")
+    assert responses[2] == {"id": 2, "error": "Invalid version '1.0'"}
+
+
+def test_should_answer_concurrent_connections(server):
+    errors = []
+
+    def client(major):
+        try:
+            for minor in range(20):
+                version = f"{major}.{minor}.0"
+                request = {"cmd": "bump", "part": "minor", "version": version}
+                response = send(server, request)
+                if response != {"result": f"{major}.{minor + 1}.0"}:
+                    errors.append(response)  # pragma: no cover
+        except Exception as exc:  # pragma: no cover
+            errors.append(exc)
+
+    threads = [threading.Thread(target=client, args=(major,)) for major in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_should_refuse_second_server(server):
+    with pytest.raises(ValueError, match="already listening"):
+        create_server(server)
+
+
+def test_should_refuse_other_files(socket_path):
+    Path(socket_path).touch()
+    with pytest.raises(ValueError, match="is not a socket"):
+        create_server(socket_path)
+
+
+def test_should_replace_stale_socket(socket_path):
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(socket_path)
+    stale.close()
+    server = create_server(socket_path)
+    server.server_close()
+
+
+def test_should_serve_until_interrupted(socket_path, monkeypatch):
+    def interrupt(server):
+        assert Path(socket_path).exists()
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr("socketserver.BaseServer.serve_forever", interrupt)
+    try:
+        assert main(["serve", "--socket", socket_path, "--cache-size", "16"]) == 0
+        assert parse_cache.maxsize == 16
+        # A smaller cache size never shrinks the cache
+        serve(socket_path, cache_size=8)
+        assert parse_cache.maxsize == 16
+    finally:
+        parse_cache.resize(0)
+    assert not Path(socket_path).exists()
+
+
+def test_should_fail_when_server_closes_connection(socket_path):
+    listener = socket.socket(socket.AF_UNIX)
+    listener.bind(socket_path)
+    listener.listen()
+
+    def accept_and_close():
+        conn, _ = listener.accept()
+        with conn, conn.makefile("rb") as reader:
+            reader.readline()
+
+    thread = threading.Thread(target=accept_and_close)
+    thread.start()
+    with pytest.raises(ConnectionError, match="closed the connection"):
+        send(socket_path, {"cmd": "check", "version": "1.0.0"})
+    thread.join()
+    listener.close()
+
+
+def test_should_fail_without_unix_sockets(socket_path, monkeypatch):
+    monkeypatch.delattr(socket, "AF_UNIX")
+    with pytest.raises(OSError, match="not supported"):
+        send(socket_path, {})
+
+
+@pytest.mark.parametrize(
+    "cli_args,out,rc",
+    [
+        (["compare", "1.0.0", "1.0.1"], "-1\n", 0),
+        (["bump", "major", "1.0.0"], "2.0.0\n", 0),
+        (["check", "1.0.0"], "", 0),
+        (["check", "1.0"], "", 2),
+    ],
+)
+def test_should_connect_to_server(server, cli_args, out, rc, capsys, monkeypatch):
+    def fail(args):  # pragma: no cover
+        raise AssertionError("processed locally")
+
+    monkeypatch.setattr(cli, "process", fail)
+    assert main(["--connect", server, *cli_args]) == rc
+    captured = capsys.readouterr()
+    assert captured.out == out
+    if rc:
+        assert captured.err == "ERROR Invalid version '1.0'\n"
+
+
+@pytest.mark.parametrize(
+    "cli_args,out",
+    [
+        (["compare", "1.0.0", "1.0.1"], "-1\n"),
+        (["nextver", "1.0.0-rc.1", "patch"], "1.0.0\n"),
+    ],
+)
+def test_should_fall_back_without_server(socket_path, cli_args, out, capsys):
+    assert main(["--connect", socket_path, *cli_args]) == 0
+    assert capsys.readouterr().out == out
+
+
+def test_should_process_unsupported_commands_locally(server, capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", StringIO(""))
+    assert main(["--connect", server, "sort"]) == 0
+    assert capsys.readouterr().out == ""
+
+
+def test_should_report_missing_arguments_locally(server):
+    with pytest.raises(SystemExit):
+        main(["--connect", server, "compare", "1.0.0"])
+
+
+@pytest.mark.parametrize("from_file", [False, True])
+def test_should_refuse_batch_with_connect(
+    server, from_file, tmp_path, capsys, monkeypatch
+):
+    batch = tmp_path / "versions.txt"
+    batch.write_text("1.0.0\n")
+    monkeypatch.setattr("sys.stdin", StringIO("1.0.0\n"))
+    batch_args = [str(batch)] if from_file else []
+    with pytest.raises(SystemExit) as excinfo:
+        main(["--connect", server, "check", "--batch", *batch_args])
+    captured = capsys.readouterr()
+    assert excinfo.value.code == 2
+    assert "not allowed with argument --connect" in captured.err
+    assert captured.out == ""
@@ -0,0 +1,113 @@
+import random
+from functools import cmp_to_key
+
+import pytest
+
+from semver import Version
+
+
+def random_identifier(rng):
+    if rng.random() < 0.5:
+        return str(rng.choice([0, 1, 2, 9, 10, 11, 255, 256, 2**40, 2**70]))
+    alphabet = "0123456789abcAB-z"
+    ident = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+    return ident if not ident.isdigit() else ident + "a"
+
+
+def random_version(rng):
+    parts = [rng.choice([0, 1, 2, 255, 256, 65535, 2**32, 2**64]) for _ in range(3)]
+    prerelease = build = None
+    if rng.random() < 0.6:
+        prerelease = ".".join(
+            random_identifier(rng) for _ in range(rng.randint(1, 4))
+        )
+    if rng.random() < 0.3:
+        build = rng.choice(["build.1", "001", "x-y"])
+    return Version(*parts, prerelease=prerelease, build=build)
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    rng = random.Random(2024)
+    return [random_version(rng) for _ in range(3000)]
+
+
+def test_byte_order_equals_version_order(corpus):
+    by_bytes = sorted(corpus, key=Version.to_sortable_bytes)
+    by_version = sorted(corpus, key=cmp_to_key(Version.compare))
+    assert [v.sort_key() for v in by_bytes] == [v.sort_key() for v in by_version]
+
+
+def test_byte_order_equals_compare_pairwise(corpus):
+    rng = random.Random(7)
+    for _ in range(20000):
+        left, right = rng.choice(corpus), rng.choice(corpus)
+        cmp = (left.to_sortable_bytes() > right.to_sortable_bytes()) - (
+            left.to_sortable_bytes() < right.to_sortable_bytes()
+        )
+        # The build part only orders otherwise equal versions
+        if left.compare(right) or (left.build is None and right.build is None):
+            assert cmp == left.compare(right)
+
+
+def test_round_trip(corpus):
+    for version in corpus:
+        data = version.to_sortable_bytes()
+        assert Version.from_sortable_bytes(data).to_tuple() == version.to_tuple()
+
+
+@pytest.mark.parametrize(
+    "version, expected",
+    [
+        ("0.0.0", b"\x00\x00\x00\x02"),
+        ("1.0.256", b"\x01\x01\x00\x02\x01\x00\x02"),
+        ("1.0.0-0", b"\x01\x01\x00\x00\x01\x01\x00\x00"),
+        ("1.0.0-a+b.1", b"\x01\x01\x00\x00\x01\x02a\x00\x00+b.1"),
+    ],
+)
+def test_encoding(version, expected):
+    assert Version.parse(version).to_sortable_bytes() == expected
+
+
+def test_from_sortable_bytes_accepts_bytes_like():
+    data = Version.parse("1.2.3-rc.1").to_sortable_bytes()
+    assert Version.from_sortable_bytes(memoryview(data)) == "1.2.3-rc.1"
+    assert Version.from_sortable_bytes(bytearray(data)) == "1.2.3-rc.1"
+
+
+def test_from_sortable_bytes_returns_subclass():
+    class MyVersion(Version):
+        pass
+
+    data = Version(1).to_sortable_bytes()
+    assert type(MyVersion.from_sortable_bytes(data)) is MyVersion
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"\x01\x01",
+        b"\x02\x01",
+        b"\x00\x00\x00",
+        b"\x00\x00\x00\x03",
+        b"\x00\x00\x00\x02x",
+        b"\x00\x00\x00\x01\x03\x00",
+        b"\x00\x00\x00\x01\x02rc",
+        b"\x00\x00\x00\x01\x02\xff\x00\x00",
+        b"\x00\x00\x00\x01\x01\x05\x00",
+    ],
+)
+def test_from_sortable_bytes_rejects_invalid(data):
+    with pytest.raises(ValueError, match="is not a sortable version encoding"):
+        Version.from_sortable_bytes(data)
+
+
+def test_to_sortable_bytes_rejects_huge_parts():
+    with pytest.raises(ValueError, match="too big"):
+        Version(2**2048).to_sortable_bytes()
+
+
+def test_to_sortable_bytes_rejects_null_characters():
+    with pytest.raises(ValueError, match="null characters"):
+        Version(1, prerelease="a\x00b").to_sortable_bytes()
@@ -0,0 +1,79 @@
+import random
+from itertools import islice
+
+import pytest
+
+from semver import Version
+from semver.testing import INVALID_KINDS, PROFILES, generate_corpus, main
+
+
+def test_corpus_is_reproducible():
+    assert list(generate_corpus(500, seed=7)) == list(generate_corpus(500, seed=7))
+    assert list(generate_corpus(500, seed=7)) != list(generate_corpus(500, seed=8))
+
+
+def test_corpus_is_endless_without_n():
+    corpus = generate_corpus(seed=1)
+    assert list(islice(corpus, 100)) == list(generate_corpus(100, seed=1))
+    assert len(list(islice(corpus, 10000))) == 10000
+
+
+@pytest.mark.parametrize("profile", PROFILES)
+def test_corpus_follows_profile(profile):
+    fractions = PROFILES[profile]
+    corpus = list(generate_corpus(2000, profile))
+    valid = [Version.parse(v) for v in corpus if Version.is_valid(v)]
+    assert len(corpus) - len(valid) == pytest.approx(
+        fractions.invalid * 2000, abs=100
+    )
+    if valid:
+        prereleases = sum(v.prerelease is not None for v in valid)
+        builds = sum(v.build is not None for v in valid)
+        assert prereleases / len(valid) == pytest.approx(fractions.prerelease, abs=0.05)
+        assert builds / len(valid) == pytest.approx(fractions.build, abs=0.05)
+
+
+def test_corpus_contains_long_prereleases():
+    corpus = list(generate_corpus(2000, "prerelease"))
+    assert max(v.count(".") for v in corpus) >= 8
+    assert any(v.split("-", 1)[1][0].isdigit() for v in corpus)
+
+
+@pytest.mark.parametrize("kind", INVALID_KINDS)
+def test_invalid_kinds_create_invalid_versions(kind):
+    valid = generate_corpus(300, "build", seed=3)
+    mutate = INVALID_KINDS[kind]
+    rng = random.Random(kind)
+    for version in valid:
+        invalid = mutate(rng, version)
+        assert not Version.is_valid(invalid), (kind, version, invalid)
+        assert not Version._REGEX.match(invalid), (kind, version, invalid)
+
+
+def test_corpus_with_invalid_fraction():
+    corpus = list(generate_corpus(1000, "release", invalid=0.5))
+    assert sum(not Version.is_valid(v) for v in corpus) == pytest.approx(500, abs=60)
+
+
+@pytest.mark.parametrize(
+    "kwargs,message",
+    [
+        ({"profile": "unknown"}, "Unknown profile 'unknown'"),
+        ({"invalid": 1.5}, "between 0 and 1"),
+        ({"invalid": -0.1}, "between 0 and 1"),
+    ],
+)
+def test_should_reject_wrong_arguments(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        generate_corpus(10, **kwargs)
+
+
+def test_cli_writes_corpus(capsys):
+    assert main(["-n", "5000", "--profile", "prerelease", "--seed", "3"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines == list(generate_corpus(5000, "prerelease", seed=3))
+
+
+def test_cli_reports_errors(capsys):
+    assert main(["-n", "1", "--invalid", "2"]) == 2
+    assert capsys.readouterr().err.startswith("ERROR invalid must be")